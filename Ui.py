@@ -4,6 +4,9 @@ import requests
 from datetime import datetime
 import os
 from groq import Groq
+from search_index import BM25Index, parse_indices
+from feed_data import file_signature, load_articles, project_articles, load_article_bodies, FeedFacets, FeedView, paginate
+from read_api import ReadApiClient
 
 
 current_date = datetime.now().strftime('%Y-%m-%d')
@@ -12,12 +15,19 @@ current_date = datetime.now().strftime('%Y-%m-%d')
 GROQ_API_KEY = "Your Groq Key"
 client = Groq(api_key=GROQ_API_KEY)
 
+# Number of BM25 hits sent to the LLM for reranking
+RERANK_TOP_K = 15
+# Also index full article bodies (larger index, better recall)
+SEARCH_INCLUDE_BODY = False
+# Articles rendered per page in the News Feed and Favorites tabs
+PAGE_SIZE = 20
+# Base URL of read_api.py (e.g. http://127.0.0.1:8502); empty loads the JSON file in this process
+READ_API_URL = os.getenv('NEWS_READ_API_URL', '')
+
 def load_news_data(json_file_path):
-    """Load news data from JSON file"""
+    """Load news data from the day's JSON file, or its journal while that is newer"""
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
+        return {"articles": load_articles(json_file_path)}
     except FileNotFoundError:
         st.error(f"JSON file not found at path: {json_file_path}")
         return {"articles": []}
@@ -28,13 +38,68 @@ def load_news_data(json_file_path):
         st.error(f"Error loading JSON file: {e}")
         return {"articles": []}
 
-def search_articles(query, articles):
-    """Search articles based on query using Groq API"""
+@st.cache_resource(max_entries=2)
+def load_feed(json_file_path, signature):
+    """Parse the data file once per (mtime, size) and keep only the feed projection"""
+    news_data = load_news_data(json_file_path)
+    return project_articles(news_data.get("articles", []))
+
+@st.cache_resource(max_entries=2)
+def load_bodies(json_file_path, signature):
+    """Full article bodies, loaded the first time an article is opened"""
+    return load_article_bodies(json_file_path)
+
+def get_feed(json_file_path):
+    """Cached feed articles and the file signature they were loaded from"""
+    signature = file_signature(json_file_path)
+    if signature is None:
+        st.error(f"JSON file not found at path: {json_file_path}")
+        return [], None
+    return load_feed(json_file_path, signature), signature
+
+@st.cache_resource(max_entries=2)
+def build_search_index(json_file_path, signature, _articles):
+    """Build the BM25 index once per data file version"""
+    if SEARCH_INCLUDE_BODY:
+        bodies = load_bodies(json_file_path, signature)
+        _articles = [{**article, 'text': bodies.get(article['id'], '')} for article in _articles]
+    return BM25Index(_articles, include_body=SEARCH_INCLUDE_BODY)
+
+@st.cache_resource(max_entries=2)
+def build_feed_facets(json_file_path, signature, _articles):
+    """Keyword frequencies and favorites matcher, built once per data file version"""
+    return FeedFacets(_articles)
+
+@st.cache_resource
+def get_read_api_client(base_url):
+    """One client (and ETag cache) shared by every session of this Streamlit process"""
+    return ReadApiClient(base_url)
+
+def get_feed_view(json_file_path):
+    """Feed queries served by the read API, or built in-process from the cached dataset"""
+    if READ_API_URL:
+        return get_read_api_client(READ_API_URL)
+    
+    articles, signature = get_feed(json_file_path)
+    search_index = build_search_index(json_file_path, signature, articles)
+    facets = build_feed_facets(json_file_path, signature, articles)
+    
+    def bodies():
+        return load_bodies(json_file_path, signature) if signature is not None else {}
+    
+    return FeedView(articles, search_index, facets, bodies)
+
+def search_articles(query, feed):
+    """Search articles with the local index, reranking the top hits using Groq API"""
+    candidates = feed.search(query, top_k=RERANK_TOP_K)
+    if not candidates:
+        return []
+    
     try:
-        # Prepare context from articles
+        # Prepare context from the top hits only
         context = "\n\n".join([
-            f"Title: {article['title']}\nSummary: {article['ai_summary']}\nKeywords: {', '.join(article.get('keywords', []))}"
-            for article in articles
+            f"[{i}] Title: {article['title']}\nSummary: {article.get('ai_summary', '')}\nKeywords: {', '.join(article.get('keywords', []))}"
+            for i, article in enumerate(candidates)
         ])
         
         # Create prompt for Groq
@@ -46,7 +111,7 @@ def search_articles(query, articles):
         
         User Query: {query}
         
-        Return only the indices of the most relevant articles (0-based) in a list format. Be precise and only return articles that directly match the query.
+        Return only the indices of the most relevant articles (0-based) in a list format, most relevant first. Be precise and only return articles that directly match the query.
         """
         
         # Call Groq API
@@ -69,48 +134,29 @@ def search_articles(query, articles):
         response = chat_completion.choices[0].message.content.strip()
         
         # Parse the response to get indices
-        try:
-            if "[" in response and "]" in response:
-                indices_str = response[response.index("["):response.index("]")+1]
-                indices = eval(indices_str)
-                return [articles[i] for i in indices if i < len(articles)]
-            else:
-                return keyword_search(query, articles)
-        except:
-            return keyword_search(query, articles)
+        indices = parse_indices(response, len(candidates))
+        if indices is None:
+            return candidates
+        return [candidates[i] for i in indices]
             
     except Exception as e:
         st.error(f"Search error: {e}")
-        return keyword_search(query, articles)
+        return keyword_search(query, feed)
 
-def keyword_search(query, articles):
-    """Fallback keyword-based search"""
-    query_lower = query.lower()
-    relevant_articles = []
-    
-    for article in articles:
-        # Check title, summary, and keywords
-        article_keywords = article.get('keywords', [])
-        if (query_lower in article['title'].lower() or 
-            query_lower in article.get('ai_summary', '').lower() or
-            any(query_lower in str(keyword).lower() for keyword in article_keywords)):
-            relevant_articles.append(article)
-    
-    return relevant_articles
+def keyword_search(query, feed):
+    """Fallback search: BM25 ranking from the local index without the LLM"""
+    return feed.search(query, top_k=RERANK_TOP_K)
 
-def filter_by_favorites(articles, favorite_subjects):
-    """Filter articles based on favorite subjects"""
-    if not favorite_subjects:
-        return articles
-    
-    filtered_articles = []
-    for article in articles:
-        # Check if any favorite subject matches article keywords or title/summary
-        article_text = f"{article['title']} {article.get('ai_summary', '')} {' '.join(article.get('keywords', []))}".lower()
-        if any(subject.lower() in article_text for subject in favorite_subjects):
-            filtered_articles.append(article)
+def display_article_page(page_articles, start, page_count, page_key):
+    """Display one page of article summaries with page navigation"""
+    for i, article in enumerate(page_articles, start):
+        display_article_summary(article, i)
+        st.markdown("---")
     
-    return filtered_articles
+    if page_count > 1:
+        # Keep the widget in range when the list shrinks (e.g. a new search)
+        st.session_state[page_key] = start // PAGE_SIZE + 1
+        st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key=page_key)
 
 def display_article_summary(article, index):
     """Display article summary in feed format"""
@@ -134,17 +180,20 @@ def display_article_summary(article, index):
         if st.button("Read More", key=f"read_{index}"):
             st.session_state.selected_article = article
 
-def display_full_article(article):
+def display_full_article(article, feed):
     """Display full article content"""
+    full_article = feed.article(article['id'])
+    text = full_article.get('text', '') if full_article else ''
+    
     st.header(article['title'])
     st.write(f"**Source:** {article.get('source', 'Unknown')}")
     st.write(f"**Date:** {article.get('date', 'Unknown')}")
     st.write(f"**Published:** {article.get('published_date', 'Unknown')}")
     
     # Display full text if available, otherwise show summary
-    if article.get('text'):
+    if text:
         st.write("**Full Article:**")
-        st.write(article['text'])
+        st.write(text)
     else:
         st.write("**Summary:**")
         st.write(article.get('ai_summary', 'No content available'))
@@ -172,9 +221,13 @@ def main():
     # Replace with your actual JSON file path
     JSON_FILE_PATH = f"news_scraper/output/news_articles_{current_date}.json"  # Update this path
     
-    # Load news data
-    news_data = load_news_data(JSON_FILE_PATH)
-    articles = news_data.get("articles", [])
+    # Load news data (cached until the file's mtime or size changes, or shared through the read API)
+    feed = get_feed_view(JSON_FILE_PATH)
+    try:
+        article_count = feed.count()
+    except requests.RequestException as e:
+        st.error(f"Read API not reachable at {READ_API_URL}: {e}")
+        return
     
     # Initialize session state
     if 'favorites' not in st.session_state:
@@ -201,14 +254,14 @@ def main():
         if search_query:
             if st.button("Search"):
                 with st.spinner("Searching..."):
-                    st.session_state.search_results = search_articles(search_query, articles)
+                    st.session_state.search_results = search_articles(search_query, feed)
         
         if st.button("Clear Search"):
             st.session_state.search_results = None
         
         # Display stats
         st.subheader("📊 Stats")
-        st.write(f"Total Articles: {len(articles)}")
+        st.write(f"Total Articles: {article_count}")
         if st.session_state.search_results is not None:
             st.write(f"Search Results: {len(st.session_state.search_results)}")
         st.write(f"Favorite Topics: {len(st.session_state.favorites)}")
@@ -216,7 +269,7 @@ def main():
     # Main content area
     if st.session_state.selected_article:
         # Display full article
-        display_full_article(st.session_state.selected_article)
+        display_full_article(st.session_state.selected_article, feed)
     
     else:
         # Display appropriate content based on current tab
@@ -224,19 +277,20 @@ def main():
             st.title("📰 News Feed")
             
             # Display search results or all articles
+            page = st.session_state.get("feed_page", 1)
             if st.session_state.search_results is not None:
-                articles_to_display = st.session_state.search_results
-                st.write(f"### Search Results ({len(articles_to_display)} articles found)")
+                search_results = st.session_state.search_results
+                page_articles, start, page_count = paginate(search_results, page, PAGE_SIZE)
+                total = len(search_results)
+                st.write(f"### Search Results ({total} articles found)")
             else:
-                articles_to_display = articles
-                st.write(f"### Latest News ({len(articles_to_display)} articles)")
+                page_articles, start, page_count, total = feed.feed_page(page, PAGE_SIZE)
+                st.write(f"### Latest News ({total} articles)")
             
-            if not articles_to_display:
+            if not total:
                 st.info("No articles found.")
             else:
-                for i, article in enumerate(articles_to_display):
-                    display_article_summary(article, i)
-                    st.markdown("---")
+                display_article_page(page_articles, start, page_count, "feed_page")
         
         elif st.session_state.current_tab == "Favorites":
             st.title("⭐ Favorite Topics News")
@@ -244,15 +298,15 @@ def main():
             if not st.session_state.favorites:
                 st.info("No favorite topics set. Go to 'Manage Favorites' to add some!")
             else:
-                favorite_articles = filter_by_favorites(articles, st.session_state.favorites)
-                st.write(f"### News matching your favorite topics ({len(favorite_articles)} articles)")
+                page_articles, start, page_count, total = feed.favorites_page(
+                    st.session_state.favorites, st.session_state.get("favorites_page", 1), PAGE_SIZE
+                )
+                st.write(f"### News matching your favorite topics ({total} articles)")
                 
-                if not favorite_articles:
+                if not total:
                     st.info("No articles match your favorite topics.")
                 else:
-                    for i, article in enumerate(favorite_articles):
-                        display_article_summary(article, i)
-                        st.markdown("---")
+                    display_article_page(page_articles, start, page_count, "favorites_page")
         
         elif st.session_state.current_tab == "Manage Favorites":
             st.title("⚙️ Manage Favorite Topics")
@@ -282,13 +336,8 @@ def main():
             
             # Show suggested topics based on article keywords
             st.write("### Suggested Topics")
-            all_keywords = []
-            for article in articles:
-                all_keywords.extend(article.get('keywords', []))
-            
-            # Get unique keywords and show top ones
-            unique_keywords = list(set(all_keywords))
-            popular_keywords = [kw for kw in unique_keywords if all_keywords.count(kw) > 1][:10]
+            # Most frequent keywords from the precomputed frequency table
+            popular_keywords = feed.popular_keywords(limit=10, min_count=2)
             
             for keyword in popular_keywords:
                 if keyword not in st.session_state.favorites:
@@ -0,0 +1,197 @@
+import bisect
+import math
+import os
+import re
+import sys
+from collections import Counter
+
+# The scraper's packages import each other as top-level modules (run from news_scraper/)
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'news_scraper')
+if SCRAPER_DIR not in sys.path:
+    sys.path.insert(0, SCRAPER_DIR)
+
+from utils.article_journal import ArticleJournal
+from utils.body_store import BodyStore
+from utils.daily_articles import read_daily_articles
+
+# Fields the feed, favorites and search need (with defaults); bodies stay out of the hot path
+FEED_FIELDS = {
+    'title': '',
+    'source': 'Unknown',
+    'date': 'Unknown',
+    'published_date': 'Unknown',
+    'link': '',
+    'ai_summary': '',
+    'keywords': [],
+}
+
+def daily_data_path(json_file_path):
+    """The day's journal when it is at least as new as the JSON file, else the JSON file
+
+    Journal storage appends each article as it finishes but only rebuilds the
+    JSON file at day rollover or on --compact-journal.
+    """
+    journal_path, _, _ = ArticleJournal.paths(json_file_path)
+    try:
+        journal_mtime = os.stat(journal_path).st_mtime_ns
+    except OSError:
+        return json_file_path
+    try:
+        json_mtime = os.stat(json_file_path).st_mtime_ns
+    except OSError:
+        return journal_path
+    return journal_path if journal_mtime >= json_mtime else json_file_path
+
+def file_signature(json_file_path):
+    """(mtime_ns, size) of the day's data file (see daily_data_path), or None if there is none"""
+    try:
+        stat = os.stat(daily_data_path(json_file_path))
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def load_articles(json_file_path):
+    """The day's articles from its journal or JSON file; raises OSError/ValueError"""
+    if daily_data_path(json_file_path) != json_file_path:
+        return ArticleJournal.read_articles(json_file_path)
+    return read_daily_articles(json_file_path)
+
+def project_articles(articles):
+    """Lightweight feed records; 'id' is the article's position in the file"""
+    return [
+        {'id': position, **{field: article.get(field) or default for field, default in FEED_FIELDS.items()}}
+        for position, article in enumerate(articles)
+    ]
+
+class ArticleBodies:
+    """Article id to full text, for inline 'text' or a 'body_ref' into the day's .bodies file
+
+    Stored bodies are read through the scraper's BodyStore (mmap, only the
+    requested record is decompressed).
+    """
+
+    def __init__(self, articles, json_file_path):
+        self._inline = {}
+        self._refs = {}
+        for position, article in enumerate(articles):
+            if article.get('body_ref'):
+                self._refs[position] = article['body_ref']
+            else:
+                self._inline[position] = article.get('text', '')
+        self._body_store = BodyStore(json_file_path)
+
+    def get(self, article_id, default=''):
+        if article_id in self._inline:
+            return self._inline[article_id]
+        ref = self._refs.get(article_id)
+        if ref is None:
+            return default
+        try:
+            return self._body_store.read(ref)
+        except (OSError, ValueError, RuntimeError):
+            # Missing or truncated store, or a zstd body without zstandard installed
+            return default
+
+def load_article_bodies(json_file_path):
+    """Map article id to full text, read only when an article is opened"""
+    return ArticleBodies(load_articles(json_file_path), json_file_path)
+
+def article_blob(article):
+    """Lowercased title, summary and keywords, as matched against favorite subjects"""
+    return f"{article['title']} {article.get('ai_summary', '')} {' '.join(article.get('keywords', []))}".lower()
+
+class FeedFacets:
+    """Keyword frequencies and a favorites matcher, built once per dataset"""
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, articles):
+        self.keyword_counts = Counter(
+            keyword for article in articles for keyword in article.get('keywords', [])
+        )
+
+        # One corpus string so all favorite subjects are found in a single regex scan
+        blobs = [article_blob(article).replace(self.SEPARATOR, ' ') for article in articles]
+        self._starts = []
+        position = 0
+        for blob in blobs:
+            self._starts.append(position)
+            position += len(blob) + 1
+        self._corpus = self.SEPARATOR.join(blobs)
+        self._article_count = len(articles)
+
+    def popular_keywords(self, limit=10, min_count=2):
+        """Most frequent keywords that appear in at least min_count articles"""
+        return [keyword for keyword, count in self.keyword_counts.most_common(limit) if count >= min_count]
+
+    def match_favorites(self, favorite_subjects):
+        """Positions of articles whose text contains any favorite subject (substring match)"""
+        subjects = [subject.lower() for subject in favorite_subjects]
+        if any(not subject for subject in subjects):
+            return list(range(self._article_count))
+
+        pattern = re.compile('|'.join(re.escape(subject) for subject in sorted(set(subjects), key=len, reverse=True)))
+        matches = []
+        position = 0
+        while True:
+            match = pattern.search(self._corpus, position)
+            if not match:
+                break
+            article_index = bisect.bisect_right(self._starts, match.start()) - 1
+            matches.append(article_index)
+            # Resume at the next article; one match per article is enough
+            if article_index + 1 >= self._article_count:
+                break
+            position = self._starts[article_index + 1]
+        return matches
+
+def paginate(items, page, page_size):
+    """Slice one page of items; returns (page_items, start_index, page_count)"""
+    page_count = max(1, math.ceil(len(items) / page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+    return items[start:start + page_size], start, page_count
+
+class FeedView:
+    """Feed queries over one dataset version: pages, search candidates, favorites, keywords and bodies
+
+    Ui.py builds one per rerun from its cached pieces; read_api.py serves a single
+    shared instance to every viewer.
+    """
+
+    def __init__(self, articles, search_index, facets, load_bodies):
+        self.articles = articles
+        self.search_index = search_index
+        self.facets = facets
+        # Called the first time a full article is needed; returns {id: text}
+        self._load_bodies = load_bodies
+
+    def count(self):
+        return len(self.articles)
+
+    def feed_page(self, page, page_size):
+        """(page_articles, start_index, page_count, total) of the whole feed"""
+        page_articles, start, page_count = paginate(self.articles, page, page_size)
+        return page_articles, start, page_count, len(self.articles)
+
+    def search(self, query, top_k=20):
+        """BM25 hits for a query, best first"""
+        return [self.articles[doc_id] for doc_id, _ in self.search_index.search(query, top_k=top_k)]
+
+    def favorites_page(self, favorite_subjects, page, page_size):
+        """One page of articles matching any favorite subject, with the same tuple as feed_page"""
+        if favorite_subjects:
+            matches = self.facets.match_favorites(favorite_subjects)
+        else:
+            matches = range(len(self.articles))
+        positions, start, page_count = paginate(matches, page, page_size)
+        return [self.articles[i] for i in positions], start, page_count, len(matches)
+
+    def popular_keywords(self, limit=10, min_count=2):
+        return self.facets.popular_keywords(limit=limit, min_count=min_count)
+
+    def article(self, article_id):
+        """Feed record plus full 'text', or None for an unknown id"""
+        if not 0 <= article_id < len(self.articles):
+            return None
+        return {**self.articles[article_id], 'text': self._load_bodies().get(article_id, '')}
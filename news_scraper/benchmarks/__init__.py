@@ -0,0 +1,4 @@
+from .fixtures import FixtureCorpus
+from .servers import FixtureServer, FakeGroqServer
+
+__all__ = ['FixtureCorpus', 'FixtureServer', 'FakeGroqServer']
\ No newline at end of file
@@ -0,0 +1,151 @@
+import glob
+import html
+import os
+import random
+import re
+from datetime import datetime
+from config.settings import Settings
+from utils.body_store import BodyStore
+from utils.daily_articles import read_daily_articles
+
+SOURCE_PATHS = {
+    'The Hindu': 'thehindu',
+    'Times of India': 'toi',
+}
+
+class FixtureCorpus:
+    """Synthetic articles built from the scraper's saved JSON output, reproducible for a given seed
+
+    Titles and bodies are reshuffled from the words and paragraphs of saved
+    articles; no original pages are kept, the HTML is rendered from these.
+    """
+
+    def __init__(self, recorded_files=None, seed=42):
+        self.random = random.Random(seed)
+        self.recorded = self._load_recorded(recorded_files)
+        self.words = sorted(set(
+            word for article in self.recorded
+            for word in re.findall(r"[A-Za-z]{4,}", article['title'])
+        ))
+        self.paragraphs = [
+            paragraph.strip() for article in self.recorded
+            for paragraph in article.get('text', '').split('\n') if len(paragraph.strip()) > 80
+        ]
+
+    @staticmethod
+    def _load_recorded(recorded_files):
+        """Articles from saved daily JSON files (scraper output, not page captures)"""
+        if recorded_files is None:
+            recorded_files = sorted(glob.glob(os.path.join(Settings.JSON_OUTPUT_DIR, 'news_articles_*.json')))
+
+        articles = []
+        for path in recorded_files:
+            # Newer files keep a body_ref into the day's body store instead of 'text'
+            body_store = BodyStore(path)
+            try:
+                for article in read_daily_articles(path):
+                    text = body_store.text(article)
+                    if text:
+                        articles.append({**article, 'text': text})
+            finally:
+                body_store.close()
+        if not articles:
+            raise ValueError("No recorded articles with text found to build fixtures from")
+        return articles
+
+    def title(self, number):
+        """A distinct headline of 8-14 recorded words"""
+        words = self.random.sample(self.words, self.random.randint(8, 14))
+        return f"{' '.join(words).capitalize()} {number}"
+
+    def body(self, paragraphs=6):
+        return self.random.sample(self.paragraphs, min(paragraphs, len(self.paragraphs)))
+
+    def articles(self, count, source='The Hindu', base_url='http://127.0.0.1'):
+        """Scraped-article dicts (as BaseScraper.create_article_object builds them)"""
+        now = datetime.now()
+        return [
+            {
+                'title': self.title(i),
+                'link': article_path(base_url, source, i),
+                'published': now.strftime('%Y-%m-%d %H:%M:%S'),
+                'source': source,
+                'summary': '',
+                'date': now.strftime('%Y-%m-%d'),
+            }
+            for i in range(count)
+        ]
+
+    def processed_articles(self, count, base_url='http://127.0.0.1'):
+        """Fully processed article records, shaped like the daily JSON file"""
+        processed = []
+        for i, article in enumerate(self.articles(count, base_url=base_url)):
+            text = '\n\n'.join(self.body())
+            processed.append({
+                'title': article['title'],
+                'source': article['source'],
+                'link': article['link'],
+                'final_url': article['link'],
+                'date': article['date'],
+                'published_date': article['published'],
+                'processed_at': datetime.now().isoformat(),
+                'used_selenium': False,
+                'success': True,
+                'authors': [],
+                'publish_date': None,
+                'text': text,
+                'top_image': '',
+                'summary': '',
+                'content_length': len(text),
+                'ai_summary': ' '.join(self.body(1))[:300],
+                'keywords': self.random.sample(self.words, 6),
+            })
+        return processed
+
+    def near_duplicates(self, articles, fraction=0.2):
+        """Copies of some titles with one word changed, to exercise similarity matching"""
+        picked = self.random.sample(articles, int(len(articles) * fraction))
+        duplicates = []
+        for article in picked:
+            words = article['title'].split()
+            words[self.random.randrange(len(words))] = self.random.choice(self.words)
+            duplicates.append({**article, 'title': ' '.join(words)})
+        return duplicates
+
+def article_path(base_url, source, number):
+    """Article URL under the fixture server, matching each scraper's link filter"""
+    if source == 'Times of India':
+        return f"{base_url}/toi/india/story-{number}/articleshow/{100000 + number}.cms"
+    return f"{base_url}/thehindu/news/national/story-{number}/article{100000 + number}.ece"
+
+def render_homepage(source, titles, base_url):
+    """Homepage HTML with one link per title, using selectors the scraper looks for"""
+    if source == 'Times of India':
+        template = '<div class="w_tle"><a href="{href}">{title}</a></div>'
+    else:
+        template = '<div class="story-card"><h3 class="title"><a href="{href}">{title}</a></h3></div>'
+
+    items = '\n'.join(
+        template.format(href=article_path(base_url, source, i), title=html.escape(title))
+        for i, title in enumerate(titles)
+    )
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(source)}</title></head>
+<body><nav><a href="/">Home</a><a href="/about">About us</a></nav>
+<main>
+{items}
+</main>
+<footer>Copyright {html.escape(source)}</footer></body></html>"""
+
+def render_article(title, paragraphs):
+    """Article page HTML that newspaper3k can extract a body from"""
+    body = '\n'.join(f"<p>{html.escape(paragraph)}</p>" for paragraph in paragraphs)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<meta property="og:title" content="{html.escape(title)}"></head>
+<body><header><a href="/">Home</a></header>
+<article><h1>{html.escape(title)}</h1>
+<div class="author">By Staff Reporter</div>
+{body}
+</article>
+<aside><a href="/related">Related stories</a></aside></body></html>"""
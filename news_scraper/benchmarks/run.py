@@ -0,0 +1,295 @@
+"""Offline benchmarks for the scraping pipeline
+
+Run from the news_scraper directory:
+
+    python -m benchmarks.run --scales 100 1000 10000
+    python -m benchmarks.run --save-baseline        # re-record benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.2
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from config.settings import Settings
+from benchmarks.fixtures import FixtureCorpus
+from benchmarks.servers import FixtureServer, FakeGroqServer
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, 'results.json')
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the pipeline's progress output while timing"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+class BenchmarkContext:
+    """Local fixture and fake Groq servers plus an isolated output directory"""
+
+    def __init__(self, args):
+        self.args = args
+        self.corpus = FixtureCorpus(args.fixtures or None)
+        self.fixture_server = FixtureServer(self.corpus, args.latency, args.jitter, args.error_rate)
+        self.groq_server = FakeGroqServer(args.groq_delay, args.groq_rpm)
+        self.output_dir = None
+        self._saved_settings = {}
+        self._saved_base_url = None
+
+    def __enter__(self):
+        self.fixture_server.start()
+        self.groq_server.start()
+        self.output_dir = tempfile.mkdtemp(prefix='news_bench_')
+
+        # Cold runs only: caches and the seen-URL set would hide the work being measured
+        overrides = {
+            'JSON_OUTPUT_DIR': self.output_dir,
+            'HTTP_CACHE_ENABLED': False,
+            'SUMMARY_CACHE_ENABLED': False,
+            'BODY_FINGERPRINTS_ENABLED': False,
+            'SEEN_URLS_ENABLED': False,
+            'DELAY_BETWEEN_REQUESTS': 0,
+        }
+        for name, value in overrides.items():
+            self._saved_settings[name] = getattr(Settings, name)
+            setattr(Settings, name, value)
+
+        self._saved_base_url = os.environ.get('GROQ_BASE_URL')
+        os.environ['GROQ_BASE_URL'] = self.groq_server.base_url
+        return self
+
+    def __exit__(self, *exc_info):
+        for name, value in self._saved_settings.items():
+            setattr(Settings, name, value)
+        if self._saved_base_url is None:
+            os.environ.pop('GROQ_BASE_URL', None)
+        else:
+            os.environ['GROQ_BASE_URL'] = self._saved_base_url
+        self.fixture_server.stop()
+        self.groq_server.stop()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+def bench_homepage_parse(context, scale, scraper_class, source):
+    """Time one scraper's parse() against a homepage with ``scale`` links"""
+    from utils.http_client import HttpClient
+
+    context.fixture_server.set_homepage(source, scale)
+    http_client = HttpClient()
+    scraper = scraper_class(http_client)
+    scraper.url = context.fixture_server.homepage_url(source)
+
+    def run():
+        return len(scraper.parse())
+
+    try:
+        return measure(run, context.args.repeat)
+    finally:
+        http_client.close()
+
+def bench_the_hindu_parse(context, scale):
+    from scraper.the_hindu_scraper import TheHinduScraper
+    return bench_homepage_parse(context, scale, TheHinduScraper, 'The Hindu')
+
+def bench_times_of_india_parse(context, scale):
+    from scraper.times_of_india_scraper import TimesOfIndiaScraper
+    return bench_homepage_parse(context, scale, TimesOfIndiaScraper, 'Times of India')
+
+def bench_filter_new_articles(context, scale):
+    """``scale`` scraped articles (20% near-duplicates) against ``scale`` existing ones"""
+    from utils.duplicate_checker import DuplicateChecker
+
+    existing = context.corpus.processed_articles(scale)
+    scraped = context.corpus.articles(scale - scale // 5) + context.corpus.near_duplicates(existing, 0.2)
+
+    def run():
+        return len(DuplicateChecker.filter_new_articles(scraped, existing))
+
+    return measure(run, context.args.repeat)
+
+def bench_file_save(context, scale):
+    from utils.file_handler import FileHandler
+
+    articles = context.corpus.processed_articles(scale)
+    path = os.path.join(context.output_dir, 'bench_save.json')
+
+    def run():
+        FileHandler.save_to_json(articles, path)
+        return len(articles)
+
+    return measure(run, context.args.repeat)
+
+def bench_file_load(context, scale):
+    from utils.file_handler import FileHandler
+
+    path = os.path.join(context.output_dir, 'bench_load.json')
+    with quiet():
+        FileHandler.save_to_json(context.corpus.processed_articles(scale), path)
+
+    def run():
+        return len(FileHandler.load_existing_articles(path))
+
+    return measure(run, context.args.repeat)
+
+def bench_scrape_news(context, scale):
+    """Full run: ``scale`` existing articles and ``scale`` homepage links per source
+
+    The scrapers cap each homepage at 15 articles, so at most 30 articles are
+    fetched and summarized; ``scale`` grows the homepage, dedup and save work.
+    """
+    from main import NewsScraper
+    from utils.file_handler import FileHandler
+    from utils.http_client import HttpClient
+
+    existing = context.corpus.processed_articles(scale)
+    for source in ('The Hindu', 'Times of India'):
+        context.fixture_server.set_homepage(source, scale)
+
+    def run():
+        with quiet():
+            FileHandler.save_to_json(existing, Settings.get_full_json_path())
+        # A fresh shared client so connection reuse starts cold each run
+        HttpClient._shared = None
+        news_scraper = NewsScraper(groq_api_key='benchmark-key', mode=context.args.mode)
+        for scraper in news_scraper.scrapers:
+            scraper.url = context.fixture_server.homepage_url(scraper.source_name)
+        try:
+            articles = news_scraper.scrape_news()
+            news_scraper.save_results(articles)
+            return len(news_scraper.new_articles)
+        finally:
+            news_scraper.close()
+
+    return measure(run, context.args.scrape_repeat)
+
+BENCHMARKS = {
+    'the_hindu_parse': bench_the_hindu_parse,
+    'times_of_india_parse': bench_times_of_india_parse,
+    'filter_new_articles': bench_filter_new_articles,
+    'file_save': bench_file_save,
+    'file_load': bench_file_load,
+    'scrape_news': bench_scrape_news,
+}
+
+def measure(run, repeat):
+    """Time ``run`` ``repeat`` times; ``run`` returns the number of items it handled"""
+    durations = []
+    items = 0
+    for _ in range(repeat):
+        with quiet():
+            start = time.perf_counter()
+            items = run()
+            durations.append(time.perf_counter() - start)
+    return {
+        'median_s': statistics.median(durations),
+        'min_s': min(durations),
+        'max_s': max(durations),
+        'repeat': repeat,
+        'items': items,
+    }
+
+def run_benchmarks(args):
+    results = []
+    with BenchmarkContext(args) as context:
+        for name in args.only or BENCHMARKS:
+            for scale in args.scales:
+                print(f"⏱️  {name} @ {scale}...", end=' ', flush=True)
+                result = {'name': name, 'scale': scale, **BENCHMARKS[name](context, scale)}
+                results.append(result)
+                print(f"{result['median_s'] * 1000:.1f} ms (min {result['min_s'] * 1000:.1f} ms, {result['items']} items)")
+
+        server_stats = {
+            'fixture_requests': context.fixture_server.requests,
+            'groq_requests': context.groq_server.requests,
+            'groq_rate_limited': context.groq_server.rate_limited,
+        }
+
+    return {
+        'metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'mode': args.mode,
+            'latency': args.latency,
+            'jitter': args.jitter,
+            'error_rate': args.error_rate,
+            'groq_delay': args.groq_delay,
+            'groq_rpm': args.groq_rpm,
+            **server_stats,
+        },
+        'results': results,
+    }
+
+def compare(report, baseline, tolerance, min_delta):
+    """Regressions where the median grew by more than ``tolerance`` and ``min_delta`` seconds"""
+    baseline_results = {(r['name'], r['scale']): r for r in baseline.get('results', [])}
+    regressions = []
+
+    print(f"\n{'benchmark':<28}{'scale':>7}{'baseline ms':>14}{'current ms':>13}{'change':>9}")
+    for result in report['results']:
+        previous = baseline_results.get((result['name'], result['scale']))
+        if not previous:
+            continue
+        change = result['median_s'] / previous['median_s'] - 1 if previous['median_s'] else 0.0
+        regressed = change > tolerance and result['median_s'] - previous['median_s'] > min_delta
+        marker = ' ❌' if regressed else ''
+        print(f"{result['name']:<28}{result['scale']:>7}{previous['median_s'] * 1000:>14.1f}"
+              f"{result['median_s'] * 1000:>13.1f}{change:>+9.0%}{marker}")
+        result['baseline_median_s'] = previous['median_s']
+        result['change'] = change
+        if regressed:
+            regressions.append(result)
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scraper offline against local fixture servers")
+    parser.add_argument('--scales', type=int, nargs='+', default=[100, 1000, 10000],
+                        help="Synthetic article counts to run each benchmark at")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per micro-benchmark (median is reported)")
+    parser.add_argument('--scrape-repeat', type=int, default=1, help="Timed runs of the full scrape_news benchmark")
+    parser.add_argument('--mode', choices=['sequential', 'concurrent'], default=Settings.PIPELINE_MODE)
+    parser.add_argument('--fixtures', nargs='+', metavar='JSON',
+                        help="Saved daily JSON files to build fixtures from (default: output/news_articles_*.json)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Fixture server delay per response, in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random delay of up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of fixture requests answered with 503")
+    parser.add_argument('--groq-delay', type=float, default=0.05, help="Fake Groq response delay, in seconds")
+    parser.add_argument('--groq-rpm', type=int, default=None, help="Fake Groq requests per minute before 429s")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help="Ignore slowdowns smaller than this many seconds (timer noise)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = run_benchmarks(args)
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance, args.min_delta)
+    report['regressions'] = [(r['name'], r['scale']) for r in regressions]
+
+    output = args.baseline if args.save_baseline else args.output
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved benchmark results to {output}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) slower than the baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from benchmarks.fixtures import SOURCE_PATHS, render_homepage, render_article
+
+class LocalServer:
+    """Runs an HTTP handler on a free localhost port in a background thread"""
+
+    handler_class = None
+
+    def __init__(self):
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def start(self):
+        handler = type('BoundHandler', (self.handler_class,), {'server_state': self})
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+class QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, as the real sites serve it
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type, headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+class FixtureHandler(QuietHandler):
+    def do_GET(self):
+        state = self.server_state
+        state.count_request()
+        time.sleep(state.latency + random.uniform(0, state.jitter))
+
+        if random.random() < state.error_rate:
+            self.send_body(503, 'Service Unavailable', 'text/plain')
+            return
+
+        page = state.page(self.path)
+        if page is None:
+            self.send_body(404, 'Not Found', 'text/plain')
+        else:
+            self.send_body(200, page, 'text/html; charset=utf-8')
+
+class FixtureServer(LocalServer):
+    """Serves synthetic homepage and article HTML rendered from a FixtureCorpus
+
+    Every response waits ``latency`` plus up to ``jitter`` seconds, and a
+    fraction ``error_rate`` of requests fail with 503 to exercise retries.
+    """
+
+    handler_class = FixtureHandler
+    ARTICLE_PATH = re.compile(r'^/(thehindu|toi)/.*?(?:article|articleshow/)(\d+)\.(?:ece|cms)$')
+
+    def __init__(self, corpus, latency=0.0, jitter=0.0, error_rate=0.0):
+        super().__init__()
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.homepage_titles = {}
+
+    def set_homepage(self, source, count):
+        """Put ``count`` article links on a source's homepage"""
+        self.homepage_titles[SOURCE_PATHS[source]] = [self.corpus.title(i) for i in range(count)]
+
+    def homepage_url(self, source):
+        return f"{self.base_url}/{SOURCE_PATHS[source]}/"
+
+    def page(self, path):
+        path = path.split('?', 1)[0]
+        for source, prefix in SOURCE_PATHS.items():
+            if path == f"/{prefix}/":
+                return render_homepage(source, self.homepage_titles.get(prefix, []), self.base_url)
+
+        match = self.ARTICLE_PATH.match(path)
+        if not match:
+            return None
+        titles = self.homepage_titles.get(match.group(1), [])
+        number = int(match.group(2)) - 100000
+        if not 0 <= number < len(titles):
+            return None
+        # Seeded per article so a page has the same body on every request
+        paragraphs = random.Random(number).sample(self.corpus.paragraphs, min(6, len(self.corpus.paragraphs)))
+        return render_article(titles[number], paragraphs)
+
+class FakeGroqHandler(QuietHandler):
+    def do_POST(self):
+        state = self.server_state
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        state.count_request()
+
+        if not self.path.endswith('/chat/completions'):
+            self.send_body(404, json.dumps({'error': {'message': 'not found'}}), 'application/json')
+            return
+
+        retry_after = state.acquire()
+        if retry_after:
+            self.send_body(429, json.dumps({'error': {'message': 'Rate limit reached', 'type': 'tokens'}}),
+                           'application/json', {'retry-after': f"{retry_after:.2f}"})
+            return
+
+        time.sleep(state.delay)
+        prompt = payload['messages'][-1]['content']
+        body = {
+            'id': f"chatcmpl-bench-{state.requests}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', ''),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': state.completion(prompt)},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': 60, 'total_tokens': len(prompt) // 4 + 60},
+        }
+        self.send_body(200, json.dumps(body), 'application/json')
+
+class FakeGroqServer(LocalServer):
+    """Chat-completions endpoint answering summary prompts with canned JSON
+
+    Replies after ``delay`` seconds; beyond ``requests_per_minute`` it
+    answers 429 with a retry-after header, as the real API does.
+    """
+
+    handler_class = FakeGroqHandler
+    BATCH_ID = re.compile(r'^\s*\[(a\d+)\] Title:', re.MULTILINE)
+
+    def __init__(self, delay=0.0, requests_per_minute=None):
+        super().__init__()
+        self.delay = delay
+        self.requests_per_minute = requests_per_minute
+        self.rate_limited = 0
+        self._window = deque()
+
+    def acquire(self):
+        """Record a request in the sliding window; returns seconds to wait if over the limit"""
+        if not self.requests_per_minute:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            if len(self._window) >= self.requests_per_minute:
+                self.rate_limited += 1
+                return 60 - (now - self._window[0])
+            self._window.append(now)
+            return 0
+
+    @staticmethod
+    def completion(prompt):
+        ids = FakeGroqServer.BATCH_ID.findall(prompt)
+        if ids:
+            return json.dumps([
+                {'id': article_id, 'summary': f"Benchmark summary for {article_id}.", 'keywords': ['benchmark', article_id]}
+                for article_id in ids
+            ])
+        return json.dumps({'summary': 'Benchmark summary.', 'keywords': ['benchmark', 'fixture']})
@@ -7,22 +7,147 @@ class Settings:
     
     # File Settings
     JSON_OUTPUT_DIR = "output"
+    STORAGE_MODE = os.getenv('STORAGE_MODE', 'json')  # 'json', 'journal' or 'sqlite'
+    JOURNAL_COMPACT_ON_SAVE = False  # rebuild the daily JSON from the journal after each run (rewrites the whole day)
+    JOURNAL_COMPACT_ON_ROLLOVER = True  # rebuild the finished day's JSON once when a daemon rolls over to a new day
+    SQLITE_DB_FILE = "news_articles.db"  # inside JSON_OUTPUT_DIR
+    SQLITE_EXPORT_JSON = True  # also write the daily JSON file for JSON consumers
+    BODY_STORE_ENABLED = True  # keep article text in a compressed .bodies file next to the daily JSON
+    BODY_STORE_CODEC = os.getenv('BODY_STORE_CODEC', 'zlib')  # 'zlib' or 'zstd' (needs zstandard)
+    BODY_STORE_LEVEL = 6
+    PARQUET_EXPORT_DIR = "parquet"  # inside JSON_OUTPUT_DIR
+    PARQUET_COMPRESSION = 'zstd'
     
     # Scraping Settings
     REQUEST_TIMEOUT = 10
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     SELENIUM_TIMEOUT = 30
     DELAY_BETWEEN_REQUESTS = 2
+    DISCOVERY_MODE = os.getenv('DISCOVERY_MODE', 'homepage')  # 'homepage' or 'feeds' (RSS/sitemaps, homepage fallback)
+    FEED_MAX_ARTICLES_PER_SOURCE = 100
+    FEED_MAX_AGE_HOURS = 24  # skip feed entries published longer ago than this
+    HOMEPAGE_PARSER = os.getenv('HOMEPAGE_PARSER', 'html.parser')  # or 'lxml': faster, but closes malformed nesting differently
+    
+    # Pipeline Settings
+    PIPELINE_MODE = os.getenv('PIPELINE_MODE', 'sequential')  # 'sequential' or 'concurrent'
+    PIPELINE_QUEUE_SIZE = 10
+    FETCH_WORKERS = 4
+    EXTRACT_WORKERS = 2
+    SELENIUM_WORKERS = 1
+    SUMMARIZE_WORKERS = 2
+    PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', '0'))  # processes for HTML parsing; 0 parses in-thread
+    
+    # Selenium Driver Pool Settings
+    SELENIUM_POOL_SIZE = 2
+    SELENIUM_MAX_PAGES_PER_DRIVER = 25
+    SELENIUM_REDIRECT_WAIT = 5  # upper bound on waiting for redirects to settle
+    SELENIUM_URL_STABLE_SECONDS = 0.5
+    SELENIUM_POLL_INTERVAL = 0.2
+    
+    # URL Resolution Settings
+    RESOLVER_STATS_FILE = "resolver_stats.json"  # inside JSON_OUTPUT_DIR
+    RESOLVER_MIN_ATTEMPTS = 3  # attempts before a tier that never worked is skipped for a domain
+    RESOLVER_REPROBE_EVERY = 20  # still retry a skipped tier once per this many articles
+    
+    # Daemon Settings (--daemon)
+    DAEMON_POLL_INTERVAL = 10 * 60  # seconds between polls of a source to start with
+    DAEMON_MIN_INTERVAL = 2 * 60
+    DAEMON_MAX_INTERVAL = 60 * 60
+    DAEMON_BUSY_THRESHOLD = 3  # new articles in one poll that make a source's next poll sooner
+    DAEMON_SPEEDUP_FACTOR = 0.5
+    DAEMON_BACKOFF_FACTOR = 1.5  # applied after a poll with no new articles (or a failed poll)
+    
+    # HTTP Client Settings
+    HTTP_POOL_CONNECTIONS = 10  # number of hosts kept in the pool
+    HTTP_POOL_MAXSIZE = 10  # keep-alive connections per host
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.5
+    HTTP_BACKOFF_JITTER = 0.5
+    
+    # HTTP Cache Settings
+    HTTP_CACHE_ENABLED = True
+    HTTP_CACHE_DIR = "http_cache"  # inside JSON_OUTPUT_DIR
+    HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+    HTTP_CACHE_TTL_HOMEPAGE = 5 * 60  # seconds before a homepage is revalidated
+    HTTP_CACHE_TTL_ARTICLE = 24 * 60 * 60
+    HTTP_CACHE_TTL_FEED = 5 * 60
+    
+    # Groq Settings
+    GROQ_MODEL = "llama-3.1-8b-instant"
+    GROQ_BATCH_ENABLED = os.getenv('GROQ_BATCH_ENABLED', '').lower() in ('1', 'true', 'yes')
+    GROQ_BATCH_SIZE = 5  # max articles per request
+    GROQ_BATCH_TOKEN_BUDGET = 6000  # estimated prompt tokens per request
+    GROQ_BATCH_ITEM_MAX_CHARS = 3000  # per-article truncation inside a batch
+    GROQ_BATCH_TOKENS_PER_ITEM = 200  # completion tokens reserved per article
+    GROQ_BATCH_MAX_WAIT = 2  # seconds a queued article waits for a batch to fill
+    SUMMARY_CACHE_ENABLED = True
+    SUMMARY_CACHE_FILE = "summary_cache.db"  # inside JSON_OUTPUT_DIR
+    SUMMARY_CACHE_MAX_ENTRIES = 20000
+    BODY_FINGERPRINTS_ENABLED = True  # reuse summaries of near-identical bodies (syndicated agency copy)
+    BODY_FINGERPRINTS_FILE = "body_fingerprints.db"  # inside JSON_OUTPUT_DIR
+    BODY_FINGERPRINT_MAX_DISTANCE = 6  # differing SimHash bits (of 64) still treated as the same story
+    BODY_FINGERPRINT_SHINGLE_SIZE = 3  # words per shingle
+    BODY_FINGERPRINT_MIN_WORDS = 50  # shorter bodies are always summarized on their own
+    BODY_FINGERPRINT_RETENTION_DAYS = 7
     
     # Content Settings
     MAX_CONTENT_LENGTH = 8000
+    CONTENT_COMPRESSION_ENABLED = True
+    CONTENT_TOKEN_BUDGET = 1200  # estimated prompt tokens of article text sent for summarization
+    BOILERPLATE_MIN_REPEATS = 3  # a line seen in this many articles from one source is boilerplate
     SIMILARITY_THRESHOLD = 0.7
     
+    # Logging and Metrics Settings
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 'text' (console messages) or 'json' (one object per line)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    METRICS_PROMETHEUS_FILE = os.getenv('METRICS_PROMETHEUS_FILE', '')  # e.g. output/news_scraper.prom
+    METRICS_MAX_SAMPLES = 10000  # latest timings kept per stage for p50/p95 (bounds daemon memory)
+    
+    # Seen URL Settings
+    SEEN_URLS_ENABLED = True
+    SEEN_URLS_FILE = "seen_urls.db"  # inside JSON_OUTPUT_DIR
+    SEEN_URL_RETENTION_DAYS = 7
+    SEEN_URL_BLOOM_BITS = 1 << 24  # 2 MB, about 1% false positives at 1.7M URLs
+    SEEN_URL_BLOOM_HASHES = 7
+    
+    @classmethod
+    def get_current_date(cls):
+        return datetime.now().strftime('%Y-%m-%d')
+    
     @classmethod
-    def get_json_filename(cls):
-        current_date = datetime.now().strftime('%Y-%m-%d')
+    def get_json_filename(cls, date=None):
+        current_date = date or cls.get_current_date()
         return f"news_articles_{current_date}.json"
     
     @classmethod
-    def get_full_json_path(cls):
-        filename = cls.get_json_filename()
-        return f"{cls.JSON_OUTPUT_DIR}/{filename}" if cls.JSON_OUTPUT_DIR else filename
\ No newline at end of file
+    def get_full_json_path(cls, date=None):
+        filename = cls.get_json_filename(date)
+        return f"{cls.JSON_OUTPUT_DIR}/{filename}" if cls.JSON_OUTPUT_DIR else filename
+    
+    @classmethod
+    def get_http_cache_dir(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.HTTP_CACHE_DIR)
+    
+    @classmethod
+    def get_sqlite_path(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.SQLITE_DB_FILE)
+    
+    @classmethod
+    def get_parquet_export_dir(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.PARQUET_EXPORT_DIR)
+    
+    @classmethod
+    def get_summary_cache_path(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.SUMMARY_CACHE_FILE)
+    
+    @classmethod
+    def get_body_fingerprints_path(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.BODY_FINGERPRINTS_FILE)
+    
+    @classmethod
+    def get_resolver_stats_path(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.RESOLVER_STATS_FILE)
+    
+    @classmethod
+    def get_seen_urls_path(cls):
+        return os.path.join(cls.JSON_OUTPUT_DIR or '.', cls.SEEN_URLS_FILE)
\ No newline at end of file
@@ -1,155 +1,370 @@
+import argparse
 import time
 from config.settings import Settings
 from scraper.the_hindu_scraper import TheHinduScraper
 from scraper.times_of_india_scraper import TimesOfIndiaScraper
 from scraper.article_processor import ArticleProcessor
+from scraper.pipeline import ArticlePipeline
+from scraper.scheduler import ScrapeScheduler
 from services.groq_service import GroqService
 from utils.file_handler import FileHandler
 from utils.duplicate_checker import DuplicateChecker
+from utils.http_client import HttpClient
+from utils.seen_urls import SeenUrlStore
+from utils.storage import JournalStorage
+from utils.parquet_export import ParquetExporter
+from utils.log import configure_logging, get_logger
+from utils.metrics import Metrics
+
+logger = get_logger(__name__)
 
 class NewsScraper:
-    def __init__(self, groq_api_key=None):
+    def __init__(self, groq_api_key=None, mode=None, storage_mode=None, discovery=None):
+        self.mode = mode or Settings.PIPELINE_MODE
+        self.discovery = discovery or Settings.DISCOVERY_MODE
+        self.storage_mode = storage_mode or Settings.STORAGE_MODE
+        self.new_articles = []
+        self.existing_articles = []
+        self.run_date = None
+        self.title_index = None
         self.groq_service = GroqService(groq_api_key) if groq_api_key else None
-        self.article_processor = ArticleProcessor(self.groq_service)
+        self.http_client = HttpClient.shared()
+        self.article_processor = ArticleProcessor(self.groq_service, self.http_client)
         self.file_handler = FileHandler()
+        self.storage = self.file_handler.get_storage(self.storage_mode)
         self.duplicate_checker = DuplicateChecker()
+        self.seen_urls = SeenUrlStore() if Settings.SEEN_URLS_ENABLED else None
+        self.metrics = Metrics.shared()
         
         # Initialize scrapers
         self.scrapers = [
-            TheHinduScraper(),
-            TimesOfIndiaScraper()
+            TheHinduScraper(self.http_client),
+            TimesOfIndiaScraper(self.http_client)
         ]
     
     def scrape_news(self):
         """Main function to scrape news from all sources"""
-        print("🚀 Starting News Scraping...")
-        
+        logger.info("🚀 Starting News Scraping...")
+        self.start_day()
+        return self.scrape_sources(self.scrapers)
+    
+    def start_day(self, run_date=None):
+        """Load a day's stored articles and index their titles for duplicate checks"""
         # Get filename for current date
-        filename = Settings.get_full_json_path()
-        print(f"📁 Target file: {filename}")
+        self.run_date = run_date or Settings.get_current_date()
+        filename = Settings.get_full_json_path(self.run_date)
+        logger.info(f"📁 Target file: {filename} ({self.storage.name} storage)")
         
         # Load existing articles
-        existing_articles = self.file_handler.load_existing_articles(filename)
-        print(f"📊 Found {len(existing_articles)} existing articles in {filename}")
+        self.existing_articles = self.storage.load_existing(self.run_date)
+        self.title_index = DuplicateChecker.build_index(self.existing_articles)
+        logger.info(f"📊 Found {len(self.existing_articles)} existing articles in {filename}")
+        if self.article_processor.content_compressor:
+            # Boilerplate counts are relearned each day, so a daemon's memory stays bounded
+            self.article_processor.content_compressor.reset()
+        if self.article_processor.body_fingerprints:
+            self.article_processor.body_fingerprints.prune()
+        if self.seen_urls:
+            self.seen_urls.prune()
+            # Same rule as after processing: stored failures stay unseen so they are retried
+            self.seen_urls.mark_seen(
+                url for article in self.existing_articles if article.get('success')
+                for url in (article.get('link'), article.get('final_url'))
+            )
+        return self.existing_articles
+    
+    def scrape_sources(self, scrapers):
+        """Scrape the given sources and process articles not yet stored for the current day"""
+        existing_articles = self.existing_articles
+        self.new_articles = []
         
         # Scrape from all sources
         all_scraped_articles = []
-        for scraper in self.scrapers:
-            print(f"📰 Fetching {scraper.source_name}...")
-            articles = scraper.parse()
-            print(f"✅ Found {len(articles)} {scraper.source_name} articles")
+        for scraper in scrapers:
+            logger.info(f"📰 Fetching {scraper.source_name}...")
+            articles = scraper.discover(self.discovery)
+            logger.info(f"✅ Found {len(articles)} {scraper.source_name} articles")
+            if self.seen_urls:
+                found = len(articles)
+                articles = self.seen_urls.filter_unseen(articles)
+                self.metrics.increment('seen_url_skips', found - len(articles))
+                logger.info(f"   ⏭️  Skipping {found - len(articles)} articles already processed on earlier days")
             all_scraped_articles.extend(articles)
         
-        print(f"📊 Total articles scraped: {len(all_scraped_articles)}")
+        logger.info(f"📊 Total articles scraped: {len(all_scraped_articles)}")
         
         # Filter out duplicates
-        new_articles_to_process = self.duplicate_checker.filter_new_articles(
-            all_scraped_articles, existing_articles
-        )
+        with self.metrics.timer('dedup'):
+            new_articles_to_process = self.duplicate_checker.filter_new_articles(
+                all_scraped_articles, existing_articles, self.title_index
+            )
         
         if not new_articles_to_process:
-            print("🎉 No new articles to process! All articles are already in the database.")
+            logger.info("🎉 No new articles to process! All articles are already in the database.")
             return existing_articles
         
-        print(f"🆕 Processing {len(new_articles_to_process)} new articles...")
+        logger.info(f"🆕 Processing {len(new_articles_to_process)} new articles ({self.mode} mode)...")
+        
+        if self.mode == 'concurrent':
+            # Enough extract threads to keep every parse process busy
+            parse_workers = Settings.PARSE_WORKERS
+            results = ArticlePipeline(
+                self.article_processor, on_result=self._record_result,
+                extract_workers=max(Settings.EXTRACT_WORKERS, parse_workers)
+            ).run(new_articles_to_process)
+        else:
+            results = self._process_sequentially(new_articles_to_process)
         
         processed_articles = []
         successful_articles = 0
         failed_articles = 0
         selenium_used_count = 0
         
-        for i, article in enumerate(new_articles_to_process, 1):
+        for result in results:
+            if result is None:
+                failed_articles += 1
+                continue
+            
+            processed_articles.append(result)
+            
+            if result['success']:
+                successful_articles += 1
+            else:
+                failed_articles += 1
+            
+            if result.get('used_selenium', False):
+                selenium_used_count += 1
+        
+        self.new_articles = processed_articles
+        self.metrics.increment('articles_succeeded', successful_articles)
+        self.metrics.increment('articles_failed', failed_articles)
+        if self.seen_urls:
+            # Failed articles stay unseen so a later run can retry them
+            self.seen_urls.mark_seen(
+                url for article in processed_articles if article['success']
+                for url in (article['link'], article['final_url'])
+            )
+        
+        # Combine existing articles with newly processed ones
+        all_articles = existing_articles + processed_articles
+        self.existing_articles = all_articles
+        
+        logger.info(f"\n📈 Processing Complete:")
+        logger.info(f"   ✅ New successful articles: {successful_articles}")
+        (logger.warning if failed_articles else logger.info)(f"   ❌ New failed articles: {failed_articles}")
+        logger.info(f"   🔧 Selenium used for: {selenium_used_count} new articles")
+        logger.info(f"   📊 Total articles in database: {len(all_articles)}")
+        
+        return all_articles
+    
+    def close(self):
+        """Release resources held for the whole run"""
+        self.article_processor.close()
+        if self.article_processor.parse_pool:
+            self.article_processor.parse_pool.close()
+        self.http_client.close()
+        self.storage.close()
+        if self.seen_urls:
+            self.seen_urls.close()
+    
+    def _record_result(self, result):
+        """Hand an article to storage as soon as it finishes (journaling appends it)"""
+        self.storage.record(result)
+    
+    def _process_sequentially(self, articles):
+        """Process articles one at a time; critical failures leave None in their slot"""
+        results = []
+        
+        for i, article in enumerate(articles, 1):
             try:
                 result = self.article_processor.process_single_article(
-                    article, i, len(new_articles_to_process)
+                    article, i, len(articles)
                 )
-                processed_articles.append(result)
-                
-                if result['success']:
-                    successful_articles += 1
-                else:
-                    failed_articles += 1
-                
-                if result.get('used_selenium', False):
-                    selenium_used_count += 1
+                results.append(result)
+                self._record_result(result)
                 
                 # Add delay to be respectful to the websites
                 time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
                 
             except Exception as e:
-                print(f"   ❌ Critical error processing article {i}, skipping: {str(e)[:100]}...")
-                failed_articles += 1
-                continue
+                logger.error(f"   ❌ Critical error processing article {i}, skipping: {str(e)[:100]}...")
+                results.append(None)
         
-        # Combine existing articles with newly processed ones
-        all_articles = existing_articles + processed_articles
-        
-        print(f"\n📈 Processing Complete:")
-        print(f"   ✅ New successful articles: {successful_articles}")
-        print(f"   ❌ New failed articles: {failed_articles}")
-        print(f"   🔧 Selenium used for: {selenium_used_count} new articles")
-        print(f"   📊 Total articles in database: {len(all_articles)}")
-        
-        return all_articles
+        return results
     
     def save_results(self, articles):
-        """Save articles to JSON file"""
-        filename = Settings.get_full_json_path()
-        return self.file_handler.save_to_json(articles, filename)
+        """Save articles through the configured storage backend"""
+        with self.metrics.timer('save'):
+            return self.storage.save(articles, self.new_articles, self.run_date)
+    
+    def write_metrics(self, path=None):
+        """Write run metrics in Prometheus text format if a metrics file is configured"""
+        path = path or Settings.METRICS_PROMETHEUS_FILE
+        if path:
+            self.metrics.write_prometheus(path)
+            logger.info(f"📈 Metrics written to: {path}")
+        return path
     
     def print_report(self, articles):
         """Print final report"""
-        print("\n" + "=" * 50)
-        print("📊 FINAL REPORT")
-        print("=" * 50)
+        logger.info("\n" + "=" * 50)
+        logger.info("📊 FINAL REPORT")
+        logger.info("=" * 50)
         
         successful = len([a for a in articles if a.get('success', False)])
         failed = len([a for a in articles if not a.get('success', False)])
         selenium_used = len([a for a in articles if a.get('used_selenium', False)])
+        near_duplicates = len([a for a in articles if a.get('near_duplicate_of')])
         
-        print(f"✅ Successful articles: {successful}")
-        print(f"❌ Failed articles: {failed}")
-        print(f"🔧 Selenium used: {selenium_used}")
-        print(f"📊 Total in database: {len(articles)}")
+        logger.info(f"✅ Successful articles: {successful}")
+        (logger.warning if failed else logger.info)(f"❌ Failed articles: {failed}")
+        logger.info(f"🔧 Selenium used: {selenium_used}")
+        logger.info(f"🔗 Summaries reused from near-identical stories: {near_duplicates}")
+        logger.info(f"📊 Total in database: {len(articles)}")
         
         sources = {}
         for article in articles:
             sources[article['source']] = sources.get(article['source'], 0) + 1
         
         for source, count in sources.items():
-            print(f"   📰 {source}: {count} articles")
+            logger.info(f"   📰 {source}: {count} articles")
+        
+        if self.seen_urls:
+            logger.info(f"⏭️  Fetches skipped for already-seen URLs: {self.seen_urls.skipped}")
+        
+        http_stats = self.http_client.connection_stats()
+        logger.info(f"🔁 HTTP connections reused: {http_stats['reused']} of {http_stats['requests']} requests "
+                    f"({http_stats['connections']} connections opened)")
+        
+        cache_stats = self.http_client.cache_stats()
+        if cache_stats:
+            logger.info(f"🗄️  HTTP cache: {cache_stats['hit']} hits, {cache_stats['miss']} misses, "
+                        f"{cache_stats['revalidated']} revalidated")
+        
+        if self.article_processor.summary_cache:
+            summary_stats = self.article_processor.summary_cache.stats()
+            logger.info(f"♻️  Summary cache: {summary_stats['hits']} hits, {summary_stats['misses']} misses "
+                        f"({summary_stats['hit_rate']:.0%} hit rate)")
+        
+        stages = self.metrics.summary()['stages']
+        if stages:
+            logger.info("⏱️  Stage timings (p50 / p95 / total):", extra={'stages': stages})
+            for stage, stats in stages.items():
+                logger.info(f"   {stage}: {stats['p50_s']:.2f}s / {stats['p95_s']:.2f}s / {stats['total_s']:.2f}s "
+                            f"over {stats['count']}")
         
         # Print sample successful article with AI features
         successful_articles = [a for a in articles if a.get('success', False) and a.get('ai_summary')]
         if successful_articles:
-            print(f"\n🎯 SAMPLE AI-ENHANCED ARTICLE:")
+            logger.info(f"\n🎯 SAMPLE AI-ENHANCED ARTICLE:")
             sample = successful_articles[-1]
-            print(f"   Title: {sample['title']}")
-            print(f"   Source: {sample['source']}")
-            print(f"   AI Summary: {sample.get('ai_summary', 'N/A')}")
-            print(f"   Keywords: {', '.join(sample.get('keywords', []))}")
-            print(f"   Used Selenium: {sample.get('used_selenium', False)}")
+            logger.info(f"   Title: {sample['title']}")
+            logger.info(f"   Source: {sample['source']}")
+            logger.info(f"   AI Summary: {sample.get('ai_summary', 'N/A')}")
+            logger.info(f"   Keywords: {', '.join(sample.get('keywords', []))}")
+            logger.info(f"   Used Selenium: {sample.get('used_selenium', False)}")
         else:
-            print(f"\n⚠️  No AI-enhanced articles to display")
+            logger.warning(f"\n⚠️  No AI-enhanced articles to display")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape news and generate AI summaries")
+    parser.add_argument(
+        '--mode', choices=['sequential', 'concurrent'], default=Settings.PIPELINE_MODE,
+        help="Process articles one at a time or through the concurrent staged pipeline"
+    )
+    parser.add_argument(
+        '--storage', choices=['json', 'journal', 'sqlite'], default=Settings.STORAGE_MODE,
+        help="Rewrite the daily JSON file, append to a crash-safe journal or store in SQLite"
+    )
+    parser.add_argument(
+        '--import-json', metavar='DIR', nargs='?', const=Settings.JSON_OUTPUT_DIR,
+        help="Import existing daily JSON files into the SQLite database and exit"
+    )
+    parser.add_argument(
+        '--compact-journal', metavar='DATE', nargs='?', const=Settings.get_current_date(),
+        help="Rebuild a day's JSON file (default today) from its journal and exit"
+    )
+    parser.add_argument(
+        '--export-parquet', metavar='DIR', nargs='?', const=Settings.get_parquet_export_dir(),
+        help="Export daily JSON files changed since the last export into a Parquet dataset partitioned by date and source, then exit"
+    )
+    parser.add_argument(
+        '--full-export', action='store_true',
+        help="With --export-parquet, rewrite every day instead of only changed ones"
+    )
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help="Keep running and poll each source on its own adaptive interval until SIGINT/SIGTERM"
+    )
+    parser.add_argument(
+        '--parse-workers', type=int, default=Settings.PARSE_WORKERS,
+        help="Parse article and homepage HTML in this many processes (0 parses in the scraping threads)"
+    )
+    parser.add_argument(
+        '--discovery', choices=['homepage', 'feeds'], default=Settings.DISCOVERY_MODE,
+        help="Find articles by scraping homepages or from RSS feeds and news sitemaps (homepage fallback)"
+    )
+    parser.add_argument(
+        '--log-format', choices=['text', 'json'], default=Settings.LOG_FORMAT,
+        help="Console messages or one JSON object per log line"
+    )
+    parser.add_argument(
+        '--metrics-file', metavar='PATH', default=Settings.METRICS_PROMETHEUS_FILE,
+        help="Write stage timings and counters in Prometheus text format after the run"
+    )
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    configure_logging(args.log_format)
+    Settings.PARSE_WORKERS = args.parse_workers
+    
+    if args.import_json:
+        storage = FileHandler().get_storage('sqlite')
+        total = storage.import_json_files(args.import_json)
+        logger.info(f"✅ Imported {total} articles into {storage.db_path}")
+        storage.close()
+        return
+    
+    if args.compact_journal:
+        filename = JournalStorage.compact(args.compact_journal)
+        logger.info(f"✅ Compacted journal into {filename}")
+        return
+    
+    if args.export_parquet:
+        try:
+            exported = ParquetExporter(args.export_parquet).export(full=args.full_export)
+        except ImportError as e:
+            logger.error(f"❌ {e}")
+            return
+        logger.info(f"✅ Exported {len(exported)} changed days to {args.export_parquet}")
+        return
+    
     # Get Groq API key from environment variable or user input
     groq_api_key = Settings.GROQ_API_KEY
-    if not groq_api_key:
+    if not groq_api_key and args.daemon:
+        logger.warning("⚠️  No GROQ_API_KEY set. AI features will be disabled.")
+    elif not groq_api_key:
         print("🔑 Enter your Groq API key (or set GROQ_API_KEY environment variable):")
         groq_api_key = input().strip()
         if not groq_api_key:
-            print("⚠️  No Groq API key provided. AI features will be disabled.")
+            logger.warning("⚠️  No Groq API key provided. AI features will be disabled.")
     
-    scraper = NewsScraper(groq_api_key=groq_api_key)
+    scraper = NewsScraper(groq_api_key=groq_api_key, mode=args.mode, storage_mode=args.storage,
+                          discovery=args.discovery)
     
-    print("=" * 60)
-    print("📰 ENHANCED NEWS SCRAPER - THE HINDU & TIMES OF INDIA")
-    print("🤖 AI-Powered Summaries & Keywords")
-    print("💾 Daily JSON Files with Duplicate Prevention")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("📰 ENHANCED NEWS SCRAPER - THE HINDU & TIMES OF INDIA")
+    logger.info("🤖 AI-Powered Summaries & Keywords")
+    logger.info("💾 Daily JSON Files with Duplicate Prevention")
+    logger.info("=" * 60)
     
     try:
+        if args.daemon:
+            articles = ScrapeScheduler(scraper, args.metrics_file).run()
+            scraper.print_report(articles)
+            return
+        
         # Scrape news
         articles = scraper.scrape_news()
         
@@ -158,10 +373,13 @@ def main():
         
         # Print report
         scraper.print_report(articles)
-        print(f"💾 Results saved to: {filename}")
+        logger.info(f"💾 Results saved to: {filename}")
+        scraper.write_metrics(args.metrics_file)
             
     except Exception as e:
-        print(f"❌ Critical error in main execution: {e}")
+        logger.error(f"❌ Critical error in main execution: {e}")
+    finally:
+        scraper.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,8 @@
 from .the_hindu_scraper import TheHinduScraper
 from .times_of_india_scraper import TimesOfIndiaScraper
 from .article_processor import ArticleProcessor
+from .link_extractor import LinkRules, LinkExtractor
+from .scheduler import SourceSchedule, ScrapeScheduler
 
-__all__ = ['TheHinduScraper', 'TimesOfIndiaScraper', 'ArticleProcessor']
\ No newline at end of file
+__all__ = ['TheHinduScraper', 'TimesOfIndiaScraper', 'ArticleProcessor', 'LinkRules', 'LinkExtractor',
+           'SourceSchedule', 'ScrapeScheduler']
\ No newline at end of file
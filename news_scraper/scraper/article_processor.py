@@ -1,72 +1,216 @@
 from newspaper import Article
 import time
+from concurrent.futures import Future
 from datetime import datetime
 from utils.selenium_helper import SeleniumHelper
+from utils.http_client import HttpClient
+from utils.metrics import Metrics
 from services.groq_service import GroqService
+from .url_resolver import UrlResolver
+from .parse_pool import ParsePool, article_content
+from services.summary_batcher import SummaryBatcher
+from services.summary_cache import SummaryCache
+from services.body_fingerprints import BodyFingerprintIndex, simhash
+from services.content_compressor import ContentCompressor
 from config.settings import Settings
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class ArticleProcessor:
-    def __init__(self, groq_service=None):
+    MIN_CONTENT_LENGTH = 100
+
+    def __init__(self, groq_service=None, http_client=None):
         self.groq_service = groq_service
+        self.http_client = http_client or HttpClient.shared()
+        self.metrics = Metrics.shared()
         self.selenium_helper = SeleniumHelper()
-    
-    def extract_article_content(self, url):
-        """Extract article content using newspaper3k"""
+        self.url_resolver = UrlResolver(self)
+        self.parse_pool = ParsePool.shared()
+        self.summary_batcher = None
+        self.summary_cache = None
+        self.body_fingerprints = None
+        self.content_compressor = ContentCompressor() if Settings.CONTENT_COMPRESSION_ENABLED else None
+        if groq_service and Settings.SUMMARY_CACHE_ENABLED:
+            self.summary_cache = SummaryCache()
+        if groq_service and Settings.BODY_FINGERPRINTS_ENABLED:
+            self.body_fingerprints = BodyFingerprintIndex()
+        if groq_service and Settings.GROQ_BATCH_ENABLED:
+            self.summary_batcher = SummaryBatcher(groq_service)
+
+    @staticmethod
+    def _article_from_html(url, html):
+        """Hand already-fetched HTML to newspaper3k without downloading again"""
+        article = Article(url)
+        article.download(input_html=html)
+        return article
+
+    def fetch_article(self, url, timings=None):
+        """Download article HTML through the shared HTTP client"""
         try:
-            print(f"   Downloading article content...")
-            article = Article(url)
-            article.download()
-            article.parse()
-            
-            content_data = {
-                'title': article.title,
-                'authors': article.authors,
-                'publish_date': str(article.publish_date) if article.publish_date else None,
-                'text': article.text,
-                'top_image': article.top_image,
-                'summary': article.summary,
-                'content_length': len(article.text)
-            }
-            print(f"   ✅ Content extracted ({len(article.text)} characters)")
-            return content_data
-            
+            logger.info(f"   Downloading article content...", extra={'url': url})
+            with self.metrics.timer('fetch', timings):
+                response = self.http_client.fetch(url, Settings.HTTP_CACHE_TTL_ARTICLE)
+                article = self._article_from_html(url, response.html)
+            # Kept for the resolver tiers, so a thin page is not downloaded twice
+            article.response = response
+            # An unchanged page can reuse the content parsed on a previous run
+            article.cache_url = url
+            article.cached_content = None
+            if response.from_cache and self.http_client.cache:
+                article.cached_content = self.http_client.cache.get_derived(url, 'content')
+            return article
+
         except Exception as e:
-            print(f"   ❌ Error extracting content: {str(e)[:100]}...")
+            logger.error(f"   ❌ Error extracting content: {str(e)[:100]}...", extra={'url': url})
             return None
-    
-    def process_single_article(self, article, index, total):
-        """Process a single article with comprehensive error handling"""
-        print(f"\n🔍 Processing {index}/{total}: {article['title'][:60]}...")
-        
-        final_url = article['link']
-        article_content = None
-        needs_selenium = False
-        
+
+    def parse_article(self, article, timings=None):
+        """Parse a downloaded newspaper3k article into content data"""
+        cached_content = getattr(article, 'cached_content', None)
+        if cached_content is not None:
+            logger.info(f"   ✅ Content unchanged since last run ({cached_content['content_length']} characters)")
+            return cached_content
+
         try:
-            # First try to extract content directly
-            print("   Trying direct content extraction...")
-            article_content = self.extract_article_content(final_url)
-            
-            # If direct extraction fails, try with Selenium
-            if not article_content or len(article_content.get('text', '')) < 100:
-                print("   Direct extraction failed, trying with Selenium...")
-                needs_selenium = True
-                final_url = self.selenium_helper.get_final_url_selenium(final_url)
-                article_content = self.extract_article_content(final_url)
-            
-            # Get summary and keywords using Groq API if available
-            groq_data = {"summary": "", "keywords": []}
-            if article_content and article_content.get('text') and self.groq_service:
-                print("   Generating summary and keywords with Groq...")
+            with self.metrics.timer('parse', timings):
+                if self.parse_pool:
+                    content_data = self.parse_pool.extract_article(article.url, article.html)
+                else:
+                    article.parse()
+                    content_data = article_content(article)
+            logger.info(f"   ✅ Content extracted ({content_data['content_length']} characters)")
+            cache_url = getattr(article, 'cache_url', None)
+            if cache_url and self.http_client.cache:
+                self.http_client.cache.set_derived(cache_url, 'content', content_data)
+            return content_data
+
+        except Exception as e:
+            logger.error(f"   ❌ Error extracting content: {str(e)[:100]}...")
+            return None
+
+    def extract_article_content(self, url, timings=None):
+        """Extract article content using newspaper3k"""
+        article = self.fetch_article(url, timings)
+        if article is None:
+            return None
+        return self.parse_article(article, timings)
+
+    def needs_selenium(self, article_content):
+        """Check whether direct extraction produced too little text"""
+        return not article_content or len(article_content.get('text', '')) < self.MIN_CONTENT_LENGTH
+
+    def resolve_without_browser(self, url, article, timings=None):
+        """Try meta refresh/canonical/AMP links and JSON-LD of the downloaded page; returns (final_url, content, tier)"""
+        logger.info("   Direct extraction failed, trying page links and structured data...", extra={'url': url})
+        return self.url_resolver.resolve_without_browser(url, getattr(article, 'response', None), timings)
+
+    def resolve_with_selenium(self, url, timings=None):
+        """Resolve the final URL with Selenium and extract content from its page; returns (final_url, content, tier)"""
+        logger.info("   Trying with Selenium...", extra={'url': url})
+        return self.url_resolver.resolve_with_selenium(url, timings)
+
+    def _cached_summary(self, article_content):
+        """Look up a summary for identical text; returns (cache_key, data or None)"""
+        if not self.summary_cache:
+            return None, None
+        key = SummaryCache.make_key(
+            article_content.get('text', ''), Settings.GROQ_MODEL, GroqService.PROMPT_VERSION
+        )
+        cached = self.summary_cache.get(key)
+        if cached:
+            logger.info("   ♻️  Reusing cached summary and keywords")
+        return key, cached
+
+    def _near_duplicate_summary(self, article, article_content, key):
+        """Summary of an already summarized near-identical body; returns (fingerprint, data or None)"""
+        if not self.body_fingerprints:
+            return None, None
+        fingerprint = simhash(article_content.get('text', ''))
+        if fingerprint is None:
+            return None, None
+        match = self.body_fingerprints.find(fingerprint, exclude=article['link'])
+        if not match:
+            return fingerprint, None
+
+        logger.info(f"   ♻️  Reusing summary of a near-identical story ({match['distance']} bits apart): {match['link']}")
+        article_content['near_duplicate_of'] = match['link']
+        groq_data = {"summary": match['summary'], "keywords": match['keywords']}
+        if key:
+            self.summary_cache.put(key, groq_data)
+        return fingerprint, groq_data
+
+    def _remember_body(self, article, fingerprint, groq_data):
+        """Index a freshly summarized body so later copies can reuse its summary"""
+        if fingerprint is not None:
+            self.body_fingerprints.add(fingerprint, article['link'], groq_data)
+
+    def _prompt_text(self, article, article_content):
+        """Compress article text for the prompt, recording token counts on the content"""
+        text = article_content.get('text', '')
+        if not self.content_compressor:
+            return text
+
+        compressed, tokens_before, tokens_after = self.content_compressor.compress(text, article['source'])
+        article_content['tokens_before'] = tokens_before
+        article_content['tokens_after'] = tokens_after
+        return compressed or text
+
+    def summarize_content(self, article, article_content, timings=None):
+        """Get summary and keywords using Groq API if available"""
+        if article_content and article_content.get('text') and self.groq_service:
+            prompt_text = self._prompt_text(article, article_content)
+            key, cached = self._cached_summary(article_content)
+            if cached:
+                return cached
+            fingerprint, reused = self._near_duplicate_summary(article, article_content, key)
+            if reused:
+                return reused
+
+            logger.info("   Generating summary and keywords with Groq...")
+            with self.metrics.timer('summarize', timings):
                 groq_data = self.groq_service.summarize_article(
-                    article_content.get('text', ''), 
+                    prompt_text,
                     article_content.get('title', article['title'])
                 )
-            
-        except Exception as e:
-            print(f"   ❌ Unexpected error processing article: {str(e)[:100]}...")
-        
-        # Create final article object
+            if key:
+                self.summary_cache.put(key, groq_data)
+            self._remember_body(article, fingerprint, groq_data)
+            return groq_data
+        return {"summary": "", "keywords": []}
+
+    def queue_summary(self, article, article_content):
+        """Queue content for batched summarization; returns a Future or None if not batching"""
+        if not (self.summary_batcher and article_content and article_content.get('text')):
+            return None
+
+        prompt_text = self._prompt_text(article, article_content)
+        key, cached = self._cached_summary(article_content)
+        if not cached:
+            fingerprint, cached = self._near_duplicate_summary(article, article_content, key)
+        if cached:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        logger.info("   Queued for batched summary and keywords with Groq...")
+        future = self.summary_batcher.submit(
+            article_content.get('title', article['title']),
+            prompt_text
+        )
+        if key:
+            future.add_done_callback(lambda done: self.summary_cache.put(key, done.result()))
+        future.add_done_callback(lambda done: self._remember_body(article, fingerprint, done.result()))
+        return future
+
+    def flush_summaries(self):
+        """Wait for every queued summary to be generated"""
+        if self.summary_batcher:
+            self.summary_batcher.flush()
+
+    def build_final_article(self, article, final_url, article_content, needs_selenium, groq_data, timings=None,
+                            resolved_by=None):
+        """Create final article object"""
         final_article = {
             'title': article['title'],
             'source': article['source'],
@@ -76,9 +220,11 @@ class ArticleProcessor:
             'published_date': article['published'],
             'processed_at': datetime.now().isoformat(),
             'used_selenium': needs_selenium,
-            'success': article_content is not None and article_content.get('text', '')
+            # Tier that produced the content: direct, link, structured_data or selenium (None if all failed)
+            'resolved_by': resolved_by if not self.needs_selenium(article_content) else None,
+            'success': bool(article_content and article_content.get('text'))
         }
-        
+
         # Add extracted content if available
         if article_content:
             final_article.update(article_content)
@@ -93,11 +239,62 @@ class ArticleProcessor:
                 'summary': '',
                 'content_length': 0
             })
-        
+
         # Add Groq-generated data
         final_article.update({
             'ai_summary': groq_data['summary'],
             'keywords': groq_data['keywords']
         })
-        
-        return final_article
\ No newline at end of file
+
+        # Seconds spent per stage for this article
+        if timings is not None:
+            final_article['timings'] = {stage: round(seconds, 3) for stage, seconds in timings.items()}
+
+        return final_article
+
+    def process_single_article(self, article, index, total):
+        """Process a single article with comprehensive error handling"""
+        logger.info(f"\n🔍 Processing {index}/{total}: {article['title'][:60]}...")
+
+        final_url = article['link']
+        article_content = None
+        needs_selenium = False
+        resolved_by = 'direct'
+        groq_data = {"summary": "", "keywords": []}
+        timings = {}
+        started = time.perf_counter()
+
+        try:
+            # First try to extract content directly
+            logger.info("   Trying direct content extraction...")
+            downloaded = self.fetch_article(final_url, timings)
+            if downloaded is not None:
+                article_content = self.parse_article(downloaded, timings)
+
+            # If direct extraction fails, try the cheap tiers before Selenium
+            if self.needs_selenium(article_content):
+                final_url, article_content, resolved_by = self.resolve_without_browser(final_url, downloaded, timings)
+            if resolved_by is None:
+                # used_selenium counts attempts; resolved_by records whether Chrome found the text
+                needs_selenium = True
+                final_url, article_content, resolved_by = self.resolve_with_selenium(final_url, timings)
+
+            groq_data = self.summarize_content(article, article_content, timings)
+
+        except Exception as e:
+            logger.error(f"   ❌ Unexpected error processing article: {str(e)[:100]}...")
+
+        self.metrics.observe('total', time.perf_counter() - started, timings)
+        return self.build_final_article(article, final_url, article_content, needs_selenium, groq_data, timings,
+                                        resolved_by)
+
+    def close(self):
+        """Release long-lived resources such as pooled browsers"""
+        self.selenium_helper.close()
+        self.url_resolver.close()
+        if self.summary_batcher:
+            self.summary_batcher.close()
+        if self.summary_cache:
+            self.summary_cache.close()
+        if self.body_fingerprints:
+            self.body_fingerprints.close()
@@ -1,24 +1,127 @@
-import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timedelta
+from config.settings import Settings
+from utils.http_client import HttpClient
+from .link_extractor import LinkExtractor
+from .feed_parser import parse_feed
+from .parse_pool import ParsePool
+from utils.metrics import Metrics
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class BaseScraper:
-    def __init__(self, source_name):
+    link_rules = None  # LinkRules describing where this source's article links are
+    feed_urls = []  # RSS/Atom feeds and news sitemaps for feed discovery
+    revalidate_listings = False  # ignore the cache TTL for homepages and feeds (daemon polls)
+    
+    def __init__(self, source_name, http_client=None):
         self.source_name = source_name
+        self.http_client = http_client or HttpClient.shared()
+        self.link_extractor = LinkExtractor(self.link_rules) if self.link_rules else None
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': Settings.USER_AGENT
         }
     
-    def make_request(self, url):
+    def make_request(self, url, ttl=None):
         """Make HTTP request with error handling"""
+        ttl = ttl or Settings.HTTP_CACHE_TTL_HOMEPAGE
+        if self.revalidate_listings:
+            # A conditional request is still cheap (304) but never misses new links
+            ttl = 0
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return response
+            return self.http_client.fetch(url, ttl, headers=self.headers)
         except Exception as e:
-            print(f"Error fetching {url}: {e}")
+            logger.error(f"Error fetching {url}: {e}")
             return None
     
+    def discover(self, mode=None):
+        """Find today's articles from feeds or the homepage; feeds fall back to the homepage"""
+        mode = mode or Settings.DISCOVERY_MODE
+        if mode == 'feeds' and self.feed_urls:
+            articles = self.parse_feeds()
+            if articles:
+                return articles
+            Metrics.shared().increment('feed_fallbacks')
+            logger.warning(f"⚠️  No usable feed entries for {self.source_name}, scraping the homepage instead")
+        return self.parse()
+    
+    def parse_feeds(self):
+        """Articles from the source's feeds and sitemaps, newest first, with real publish times"""
+        with Metrics.shared().timer('feeds'):
+            entries = []
+            for url in self.feed_urls:
+                entries.extend(self._feed_entries(url))
+        
+        cutoff = (datetime.now() - timedelta(hours=Settings.FEED_MAX_AGE_HOURS)).strftime('%Y-%m-%d %H:%M:%S')
+        href_patterns = self.link_rules.href_patterns if self.link_rules else []
+        
+        articles = []
+        seen_links = set()
+        # Undated entries sort last; ISO-style strings order chronologically
+        for title, link, published in sorted(entries, key=lambda entry: entry[2] or '', reverse=True):
+            if link in seen_links or (published and published < cutoff):
+                continue
+            if href_patterns and not any(pattern in link for pattern in href_patterns):
+                continue
+            seen_links.add(link)
+            if published:
+                articles.append(self.create_article_object(title, link, published=published))
+            else:
+                articles.append(self.create_article_object(title, link))
+        return articles[:Settings.FEED_MAX_ARTICLES_PER_SOURCE]
+    
+    def _feed_entries(self, url):
+        """Parsed entries of one feed; an unchanged feed (304) reuses the previous parse"""
+        response = self.make_request(url, Settings.HTTP_CACHE_TTL_FEED)
+        if not response:
+            return []
+        
+        cache = self.http_client.cache
+        if cache and response.from_cache:
+            entries = cache.get_derived(url, 'feed_entries')
+            if entries is not None:
+                return [tuple(entry) for entry in entries]
+        
+        entries = parse_feed(response.content)
+        if cache:
+            cache.set_derived(url, 'feed_entries', [list(entry) for entry in entries])
+        return entries
+    
+    def parse(self):
+        """Parse the homepage, reusing cached links when it has not changed"""
+        with Metrics.shared().timer('homepage'):
+            return self._parse()
+    
+    def _parse(self):
+        response = self.make_request(self.url)
+        if not response:
+            return []
+        
+        cache = self.http_client.cache
+        if cache and response.from_cache:
+            links = cache.get_derived(self.url, 'homepage_links')
+            if links is not None:
+                return [self.create_article_object(title, link) for title, link in links]
+        
+        articles = self.parse_homepage(response)
+        if cache:
+            cache.set_derived(self.url, 'homepage_links', [[a['title'], a['link']] for a in articles])
+        return articles
+    
+    def parse_homepage(self, response):
+        """Extract article objects from a homepage response using the source's link_rules"""
+        if self.link_rules is None:
+            raise NotImplementedError
+        # ISO-8859-1 is requests' guess when no charset was sent; let the parser sniff instead
+        encoding = None if response.encoding.upper() == 'ISO-8859-1' else response.encoding
+        parse_pool = ParsePool.shared()
+        if parse_pool:
+            links = parse_pool.extract_links(self.link_rules, response.content, encoding)
+        else:
+            links = self.link_extractor.extract(response.content, encoding)
+        return [self.create_article_object(title, link) for title, link in links]
+    
     def create_article_object(self, title, link, **kwargs):
         """Create standardized article object"""
         return {
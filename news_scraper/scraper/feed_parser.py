@@ -0,0 +1,89 @@
+import html
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from utils.seen_urls import TRACKING_PARAMS
+
+def _local(tag):
+    """Tag name without its XML namespace"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def _child_text(element, *names):
+    """Text of the first child with one of the given local names, direct children first"""
+    for name in names:
+        for candidates in (list(element), element.iter()):
+            for child in candidates:
+                if child is not element and _local(child.tag) == name and child.text and child.text.strip():
+                    return child.text.strip()
+    return None
+
+def parse_published(value):
+    """Local 'YYYY-MM-DD HH:MM:SS' from an RFC 822 or ISO 8601 date, or None"""
+    if not value:
+        return None
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if published.tzinfo is not None:
+        published = published.astimezone().replace(tzinfo=None)
+    return published.strftime('%Y-%m-%d %H:%M:%S')
+
+def clean_link(url):
+    """Drop tracking parameters and the fragment, keeping the publisher's host and path"""
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    ])
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+
+def _rss_entry(item):
+    link = _child_text(item, 'link')
+    guid = item.find('guid')
+    if not link and guid is not None and guid.get('isPermaLink', 'true') == 'true':
+        link = (guid.text or '').strip()
+    return _child_text(item, 'title'), link, _child_text(item, 'pubDate', 'date')
+
+def _atom_entry(entry):
+    link = None
+    for child in entry:
+        if _local(child.tag) == 'link' and child.get('rel', 'alternate') == 'alternate':
+            link = child.get('href')
+            break
+    return _child_text(entry, 'title'), link, _child_text(entry, 'published', 'updated')
+
+def _sitemap_entry(url):
+    # Google News sitemaps carry the headline and publication date in <news:news>
+    return (_child_text(url, 'title'), _child_text(url, 'loc'),
+            _child_text(url, 'publication_date', 'lastmod'))
+
+ENTRY_PARSERS = {
+    'item': _rss_entry,
+    'entry': _atom_entry,
+    'url': _sitemap_entry,
+}
+
+def parse_feed(content):
+    """(title, link, published) tuples from an RSS, Atom or news sitemap document
+
+    Entries without a title or link are skipped; ``published`` may be None.
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return []
+
+    entries = []
+    for element in root.iter():
+        parser = ENTRY_PARSERS.get(_local(element.tag))
+        if parser is None:
+            continue
+        title, link, published = parser(element)
+        if title and link:
+            entries.append((html.unescape(title), clean_link(link), parse_published(published)))
+    return entries
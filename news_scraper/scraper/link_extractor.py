@@ -0,0 +1,147 @@
+import re
+from config.settings import Settings
+
+try:
+    import lxml.html
+    import lxml.etree
+except ImportError:  # pragma: no cover - newspaper3k normally brings lxml along
+    lxml = None
+
+class LinkRules:
+    """Declarative description of how to pull article links from one source's homepage
+
+    ``selectors`` are tried in priority order, each capped at ``per_selector_limit``
+    matching anchors (in document order). Supported selector syntax is what the
+    homepages need: descendant steps of ``tag``, ``.class`` or ``tag.class``
+    ending in ``a`` or ``a[href*="..."]``.
+    """
+
+    def __init__(self, base_url, selectors, href_patterns, min_title_length=15,
+                 per_selector_limit=30, max_articles=15, join_relative=False):
+        self.base_url = base_url
+        self.selectors = selectors
+        self.href_patterns = href_patterns
+        self.min_title_length = min_title_length
+        self.per_selector_limit = per_selector_limit
+        self.max_articles = max_articles
+        # Prefix hrefs that neither start with '/' nor 'http' as well
+        self.join_relative = join_relative
+
+class SelectorMatcher:
+    """Matches an anchor against one compiled descendant selector"""
+
+    STEP = re.compile(r'^([a-zA-Z0-9]+)?(?:\.([\w-]+))?$')
+    TARGET = re.compile(r'^a(?:\[href\*="([^"]+)"\])?$')
+
+    def __init__(self, selector):
+        *ancestors, target = selector.split()
+        target_match = self.TARGET.match(target)
+        if not target_match:
+            raise ValueError(f"Unsupported link selector: {selector}")
+        self.href_contains = target_match.group(1)
+
+        self.steps = []
+        for step in ancestors:
+            step_match = self.STEP.match(step)
+            if not step_match or not any(step_match.groups()):
+                raise ValueError(f"Unsupported link selector: {selector}")
+            tag, css_class = step_match.groups()
+            self.steps.append((tag and tag.lower(), css_class))
+
+    def matches(self, href, ancestors):
+        """``ancestors`` is a list of (tag, classes) from the nearest parent outwards"""
+        if self.href_contains is not None and (href is None or self.href_contains not in href):
+            return False
+
+        # Descendant combinators only, so matching the nearest ancestor per step is enough
+        remaining = len(self.steps) - 1
+        for tag, classes in ancestors:
+            if remaining < 0:
+                break
+            step_tag, step_class = self.steps[remaining]
+            if (step_tag is None or step_tag == tag) and (step_class is None or step_class in classes):
+                remaining -= 1
+        return remaining < 0
+
+class LinkExtractor:
+    """Walks a homepage's anchors once and applies a source's LinkRules"""
+
+    def __init__(self, rules, parser=None):
+        self.rules = rules
+        self.matchers = [SelectorMatcher(selector) for selector in rules.selectors]
+        parser = parser or Settings.HOMEPAGE_PARSER
+        self.parser = 'lxml' if parser == 'lxml' and lxml is not None else 'html.parser'
+
+    def _anchors_lxml(self, content, encoding):
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        try:
+            root = lxml.html.document_fromstring(content, parser=parser)
+        except (lxml.etree.ParserError, ValueError):
+            return
+
+        chains = {}
+        for anchor in root.iter('a'):
+            parent = anchor.getparent()
+            # Siblings share a parent, so each ancestor chain is built once
+            ancestors = chains.get(parent)
+            if ancestors is None:
+                ancestors = [(element.tag, (element.get('class') or '').split())
+                             for element in anchor.iterancestors()]
+                chains[parent] = ancestors
+            yield anchor.text_content, anchor.get('href'), ancestors
+
+    def _anchors_soup(self, content):
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(content, 'html.parser')
+        for anchor in soup.find_all('a'):
+            ancestors = [(element.name, element.get('class') or [])
+                         for element in anchor.parents if element.name != '[document]']
+            yield anchor.get_text, anchor.get('href'), ancestors
+
+    def _anchors(self, content, encoding=None):
+        """Yield (text getter, href, ancestors) for every anchor in document order"""
+        if self.parser == 'lxml':
+            return self._anchors_lxml(content, encoding)
+        return self._anchors_soup(content)
+
+    def _candidate(self, title, href):
+        """(title, absolute link) if the anchor passes the source's filters, else None"""
+        rules = self.rules
+        if not (title and len(title) > rules.min_title_length and href and
+                any(pattern in href for pattern in rules.href_patterns)):
+            return None
+
+        if href.startswith('/') or (rules.join_relative and not href.startswith('http')):
+            href = rules.base_url + href
+        return title, href
+
+    def extract(self, content, encoding=None):
+        """Return up to ``max_articles`` (title, link) pairs, in selector priority order"""
+        limit = self.rules.per_selector_limit
+        counts = [0] * len(self.matchers)
+        accepted = [[] for _ in self.matchers]
+
+        for get_text, href, ancestors in self._anchors(content, encoding):
+            candidate = False
+            for position, matcher in enumerate(self.matchers):
+                if counts[position] >= limit or not matcher.matches(href, ancestors):
+                    continue
+                counts[position] += 1
+                # Text and filters are worked out once per anchor, not once per selector
+                if candidate is False:
+                    candidate = self._candidate(get_text().strip(), href)
+                if candidate:
+                    accepted[position].append(candidate)
+
+            if all(count >= limit for count in counts):
+                break
+
+        links = []
+        seen_titles = set()
+        for candidates in accepted:
+            for title, href in candidates:
+                if title not in seen_titles:
+                    seen_titles.add(title)
+                    links.append((title, href))
+        return links[:self.rules.max_articles]
@@ -0,0 +1,67 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from newspaper import Article
+from config.settings import Settings
+from .link_extractor import LinkExtractor
+
+def article_content(article):
+    """Compact content fields of a parsed newspaper3k article"""
+    return {
+        'title': article.title,
+        'authors': article.authors,
+        'publish_date': str(article.publish_date) if article.publish_date else None,
+        'text': article.text,
+        'top_image': article.top_image,
+        'summary': article.summary,
+        'content_length': len(article.text)
+    }
+
+def _extract_article(url, html):
+    # Runs in a worker: the HTML goes in once and only the extracted fields come back
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    return article_content(article)
+
+_link_extractors = {}
+
+def _extract_links(rules, content, encoding):
+    # One extractor per source per worker, so selectors are compiled once
+    extractor = _link_extractors.get(rules.base_url)
+    if extractor is None:
+        extractor = _link_extractors[rules.base_url] = LinkExtractor(rules)
+    return extractor.extract(content, encoding)
+
+class ParsePool:
+    """Process pool for CPU-bound HTML parsing, so extraction is not serialized by the GIL"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers):
+        self.workers = workers
+        # spawn, not fork: the parent runs threads (pipeline, Selenium pool) when the pool grows
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide pool, or None when PARSE_WORKERS is 0 (parse in-thread)"""
+        with cls._shared_lock:
+            if cls._shared is None and Settings.PARSE_WORKERS > 0:
+                cls._shared = cls(Settings.PARSE_WORKERS)
+            return cls._shared
+
+    def extract_article(self, url, html):
+        """Parse article HTML in a worker; returns the content fields"""
+        return self.executor.submit(_extract_article, url, html).result()
+
+    def extract_links(self, rules, content, encoding=None):
+        """Apply a source's LinkRules to homepage bytes in a worker"""
+        return self.executor.submit(_extract_links, rules, content, encoding).result()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        with ParsePool._shared_lock:
+            if ParsePool._shared is self:
+                ParsePool._shared = None
@@ -0,0 +1,159 @@
+import queue
+import threading
+import time
+from config.settings import Settings
+from utils.metrics import Metrics
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class ArticlePipeline:
+    """Concurrent article processing with fetch, extract, Selenium and summarize stages"""
+
+    _STOP = object()
+
+    def __init__(self, article_processor, fetch_workers=None, extract_workers=None,
+                 selenium_workers=None, summarize_workers=None, queue_size=None,
+                 on_result=None):
+        self.article_processor = article_processor
+        self.on_result = on_result
+        self.metrics = Metrics.shared()
+        self.fetch_workers = fetch_workers or Settings.FETCH_WORKERS
+        self.extract_workers = extract_workers or Settings.EXTRACT_WORKERS
+        self.selenium_workers = selenium_workers or Settings.SELENIUM_WORKERS
+        self.summarize_workers = summarize_workers or Settings.SUMMARIZE_WORKERS
+        self.queue_size = queue_size or Settings.PIPELINE_QUEUE_SIZE
+
+    def run(self, articles):
+        """Process articles concurrently, returning results in input order
+
+        Articles that hit a critical error have ``None`` in their slot.
+        """
+        total = len(articles)
+        results = [None] * total
+
+        fetch_queue = queue.Queue(maxsize=self.queue_size)
+        extract_queue = queue.Queue(maxsize=self.queue_size)
+        selenium_queue = queue.Queue(maxsize=self.queue_size)
+        summarize_queue = queue.Queue(maxsize=self.queue_size)
+
+        def fetch(job):
+            logger.info(f"\n🔍 Processing {job['index'] + 1}/{total}: {job['article']['title'][:60]}...")
+            logger.info("   Trying direct content extraction...")
+            job['started'] = time.perf_counter()
+            job['downloaded'] = self.article_processor.fetch_article(job['final_url'], job['timings'])
+            extract_queue.put(job)
+            # Be respectful to the websites, per fetch worker
+            time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
+
+        def extract(job):
+            downloaded = job.pop('downloaded')
+            if downloaded is not None:
+                job['content'] = self.article_processor.parse_article(downloaded, job['timings'])
+            if self.article_processor.needs_selenium(job['content']):
+                job['final_url'], job['content'], job['resolved_by'] = \
+                    self.article_processor.resolve_without_browser(job['final_url'], downloaded, job['timings'])
+            if job['resolved_by'] is None:
+                job['needs_selenium'] = True
+                selenium_queue.put(job)
+            else:
+                summarize_queue.put(job)
+
+        def resolve(job):
+            job['final_url'], job['content'], job['resolved_by'] = self.article_processor.resolve_with_selenium(
+                job['final_url'], job['timings']
+            )
+            summarize_queue.put(job)
+
+        def summarize(job):
+            job['summarize_started'] = time.perf_counter()
+            future = self.article_processor.queue_summary(job['article'], job['content'])
+            if future is None:
+                groq_data = self.article_processor.summarize_content(job['article'], job['content'], job['timings'])
+                self._finish(job, self._build(job, groq_data), results)
+            else:
+                # Don't block the worker; finish the article when its batch returns
+                future.add_done_callback(lambda done: self._finish_batched(job, done, results))
+
+        stages = [
+            (fetch_queue, fetch, self.fetch_workers),
+            (extract_queue, extract, self.extract_workers),
+            (selenium_queue, resolve, self.selenium_workers),
+            (summarize_queue, summarize, self.summarize_workers),
+        ]
+        threads = [
+            [self._start_worker(stage_queue, handler, results) for _ in range(workers)]
+            for stage_queue, handler, workers in stages
+        ]
+
+        for index, article in enumerate(articles):
+            fetch_queue.put(self._new_job(index, article))
+
+        # Shut stages down in order: a stage only stops once every stage
+        # feeding it has drained, so no job is left behind in a queue.
+        for (stage_queue, _, _), workers in zip(stages, threads):
+            for _ in workers:
+                stage_queue.put(self._STOP)
+            for worker in workers:
+                worker.join()
+        self.article_processor.flush_summaries()
+
+        return results
+
+    def _start_worker(self, stage_queue, handler, results):
+        worker = threading.Thread(
+            target=self._work, args=(stage_queue, handler, results), daemon=True
+        )
+        worker.start()
+        return worker
+
+    def _work(self, stage_queue, handler, results):
+        while True:
+            job = stage_queue.get()
+            if job is self._STOP:
+                return
+            try:
+                handler(job)
+            except Exception as e:
+                logger.error(f"   ❌ Unexpected error processing article: {str(e)[:100]}...")
+                # Finish the article with whatever was gathered so far
+                try:
+                    self._finish(job, self._build(job, {"summary": "", "keywords": []}), results)
+                except Exception:
+                    pass
+
+    def _finish_batched(self, job, future, results):
+        try:
+            # Includes the wait for the batch to fill, which is what the article experienced
+            self.metrics.observe('summarize', time.perf_counter() - job['summarize_started'], job['timings'])
+            self._finish(job, self._build(job, future.result()), results)
+        except Exception as e:
+            logger.error(f"   ❌ Unexpected error processing article: {str(e)[:100]}...")
+
+    def _finish(self, job, result, results):
+        results[job['index']] = result
+        if self.on_result:
+            self.on_result(result)
+
+    def _build(self, job, groq_data):
+        if job['started'] is not None:
+            self.metrics.observe('total', time.perf_counter() - job['started'], job['timings'])
+        return self.article_processor.build_final_article(
+            job['article'], job['final_url'], job['content'], job['needs_selenium'], groq_data, job['timings'],
+            job['resolved_by']
+        )
+
+    @staticmethod
+    def _new_job(index, article):
+        return {
+            'index': index,
+            'article': article,
+            'final_url': article['link'],
+            'downloaded': None,
+            'content': None,
+            'needs_selenium': False,
+            'resolved_by': 'direct',
+            'timings': {},
+            'started': None,
+            'summarize_started': None,
+        }
@@ -0,0 +1,111 @@
+import signal
+import threading
+import time
+from config.settings import Settings
+from utils.metrics import Metrics
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class SourceSchedule:
+    """Poll interval for one source: shorter while it keeps producing new articles, longer while idle"""
+
+    def __init__(self, scraper, interval=None, min_interval=None, max_interval=None):
+        self.scraper = scraper
+        self.min_interval = min_interval or Settings.DAEMON_MIN_INTERVAL
+        self.max_interval = max_interval or Settings.DAEMON_MAX_INTERVAL
+        self.interval = self._clamp(interval or Settings.DAEMON_POLL_INTERVAL)
+        self.next_poll = time.monotonic()
+
+    def _clamp(self, interval):
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def record(self, new_articles, now=None):
+        """Adjust the interval after a poll; ``new_articles`` is None when the poll failed"""
+        if not new_articles:
+            factor = Settings.DAEMON_BACKOFF_FACTOR
+        elif new_articles >= Settings.DAEMON_BUSY_THRESHOLD:
+            factor = Settings.DAEMON_SPEEDUP_FACTOR
+        else:
+            factor = 1
+        self.interval = self._clamp(self.interval * factor)
+        self.next_poll = (now or time.monotonic()) + self.interval
+        return self.interval
+
+class ScrapeScheduler:
+    """Daemon loop polling each source on its own schedule, reusing one NewsScraper's open state
+
+    Scrapers, HTTP pools, caches, the dedup index and storage stay open between
+    polls. Homepages and feeds are revalidated on every poll, since polls can be
+    closer together than their cache TTL. The day's file is switched when the
+    date changes, and SIGINT/SIGTERM let the current poll finish and save before
+    the loop exits (a second signal interrupts it).
+    """
+
+    def __init__(self, news_scraper, metrics_file=None):
+        self.news_scraper = news_scraper
+        self.metrics_file = metrics_file
+        self.schedules = [SourceSchedule(scraper) for scraper in news_scraper.scrapers]
+        self.metrics = Metrics.shared()
+        for scraper in news_scraper.scrapers:
+            scraper.revalidate_listings = True
+        self._stop = threading.Event()
+
+    def stop(self, signum=None, frame=None):
+        if self._stop.is_set():
+            raise KeyboardInterrupt
+        logger.info("🛑 Shutdown requested, finishing in-flight articles...")
+        self._stop.set()
+
+    def install_signal_handlers(self):
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.stop)
+
+    def roll_over(self):
+        """Start the new day's file once the date has changed"""
+        today = Settings.get_current_date()
+        if today != self.news_scraper.run_date:
+            logger.info(f"📅 Date changed to {today}, rolling over to a new daily file")
+            self.news_scraper.start_day(today)
+
+    def poll(self, schedules):
+        """Scrape the due sources together, save anything new and reschedule them"""
+        news_scraper = self.news_scraper
+        logger.info(f"🔄 Polling {', '.join(schedule.scraper.source_name for schedule in schedules)}...")
+        try:
+            articles = news_scraper.scrape_sources([schedule.scraper for schedule in schedules])
+            if news_scraper.new_articles:
+                filename = news_scraper.save_results(articles)
+                logger.info(f"💾 Results saved to: {filename}")
+            news_scraper.write_metrics(self.metrics_file)
+            new_counts = {}
+            for article in news_scraper.new_articles:
+                new_counts[article['source']] = new_counts.get(article['source'], 0) + 1
+        except Exception as e:
+            logger.error(f"❌ Poll failed: {e}")
+            self.metrics.increment('daemon_poll_failures')
+            new_counts = None
+
+        self.metrics.increment('daemon_polls')
+        for schedule in schedules:
+            source_name = schedule.scraper.source_name
+            interval = schedule.record(None if new_counts is None else new_counts.get(source_name, 0))
+            logger.info(f"⏰ Next {source_name} poll in {interval / 60:.1f} min")
+
+    def run(self):
+        """Poll until stopped; returns the current day's articles"""
+        self.install_signal_handlers()
+        self.news_scraper.start_day()
+        logger.info(f"🕒 Daemon started, polling {len(self.schedules)} sources")
+
+        while not self._stop.is_set():
+            self.roll_over()
+            now = time.monotonic()
+            due = [schedule for schedule in self.schedules if schedule.next_poll <= now]
+            if due:
+                self.poll(due)
+            else:
+                self._stop.wait(min(schedule.next_poll for schedule in self.schedules) - now)
+
+        logger.info("👋 Daemon stopped")
+        return self.news_scraper.existing_articles
@@ -1,43 +1,24 @@
-from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
+from .link_extractor import LinkRules
 
 class TimesOfIndiaScraper(BaseScraper):
-    def __init__(self):
-        super().__init__("Times of India")
-        self.url = "https://timesofindia.indiatimes.com/"
-    
-    def parse(self):
-        """Parse Times of India homepage for today's news"""
-        articles = []
-        
-        response = self.make_request(self.url)
-        if not response:
-            return articles
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        article_selectors = [
+    link_rules = LinkRules(
+        base_url='https://timesofindia.indiatimes.com',
+        selectors=[
             'div.w_tle a',
             'div.top-story a',
             'a[href*="/articleshow/"]',
             '.headline a',
             '.title a'
-        ]
-        
-        seen_titles = set()
-        
-        for selector in article_selectors:
-            links = soup.select(selector)
-            for link in links[:25]:
-                title = link.get_text().strip()
-                href = link.get('href')
-                
-                if title and len(title) > 15 and href and '/articleshow/' in href:
-                    if href.startswith('/'):
-                        href = 'https://timesofindia.indiatimes.com' + href
-                    
-                    if title not in seen_titles:
-                        seen_titles.add(title)
-                        articles.append(self.create_article_object(title, href))
-        
-        return articles[:15]
\ No newline at end of file
+        ],
+        href_patterns=['/articleshow/'],
+        per_selector_limit=25,
+    )
+    feed_urls = [
+        'https://timesofindia.indiatimes.com/rssfeedstopstories.cms',
+        'https://timesofindia.indiatimes.com/rssfeeds/-2128936835.cms',
+    ]
+    
+    def __init__(self, http_client=None):
+        super().__init__("Times of India", http_client)
+        self.url = "https://timesofindia.indiatimes.com/"
\ No newline at end of file
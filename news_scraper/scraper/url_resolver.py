@@ -0,0 +1,242 @@
+import html
+import json
+import os
+import re
+import threading
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+from config.settings import Settings
+from utils.metrics import Metrics
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class PageHints(HTMLParser):
+    """Collects meta refresh, canonical/AMP links and JSON-LD blocks in one pass"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refresh_url = None
+        self.canonical_url = None
+        self.amp_url = None
+        self.json_ld = []
+        self._in_json_ld = False
+        self._script = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+        if tag == 'meta' and attrs.get('http-equiv', '').lower() == 'refresh':
+            match = re.search(r'url\s*=\s*[\'"]?([^\'";]+)', attrs.get('content', ''), re.IGNORECASE)
+            if match:
+                self.refresh_url = match.group(1).strip()
+        elif tag == 'link':
+            rel = attrs.get('rel', '').lower().split()
+            if 'canonical' in rel and attrs.get('href'):
+                self.canonical_url = attrs['href']
+            elif 'amphtml' in rel and attrs.get('href'):
+                self.amp_url = attrs['href']
+        elif tag == 'script' and attrs.get('type', '').lower() == 'application/ld+json':
+            self._in_json_ld = True
+            self._script = []
+
+    def handle_data(self, data):
+        if self._in_json_ld:
+            self._script.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'script' and self._in_json_ld:
+            self._in_json_ld = False
+            self.json_ld.append(''.join(self._script))
+
+    @classmethod
+    def from_html(cls, markup):
+        hints = cls()
+        try:
+            hints.feed(markup)
+            hints.close()
+        except Exception:
+            pass
+        return hints
+
+def _json_ld_objects(block):
+    """Every dict in a JSON-LD block, including @graph members and nested lists"""
+    try:
+        data = json.loads(block.strip(), strict=False)
+    except ValueError:
+        return
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            yield item
+            if '@graph' in item:
+                stack.append(item['@graph'])
+
+def content_from_json_ld(blocks):
+    """Content data (as parse_article builds it) from the first JSON-LD object with an articleBody"""
+    for block in blocks:
+        for item in _json_ld_objects(block):
+            body = item.get('articleBody')
+            if not isinstance(body, str) or not body.strip():
+                continue
+
+            authors = item.get('author') or []
+            if not isinstance(authors, list):
+                authors = [authors]
+            image = item.get('image')
+            if isinstance(image, list):
+                image = image[0] if image else ''
+            if isinstance(image, dict):
+                image = image.get('url', '')
+
+            text = html.unescape(body).strip()
+            return {
+                'title': html.unescape(item.get('headline') or ''),
+                'authors': [a.get('name', '') if isinstance(a, dict) else str(a) for a in authors],
+                'publish_date': item.get('datePublished'),
+                'text': text,
+                'top_image': image or '',
+                'summary': '',
+                'content_length': len(text)
+            }
+    return None
+
+class TierStats:
+    """Per-domain attempts and successes for each resolution tier, persisted between runs"""
+
+    def __init__(self, path=None, min_attempts=None, reprobe_every=None):
+        self.path = path or Settings.get_resolver_stats_path()
+        self.min_attempts = min_attempts or Settings.RESOLVER_MIN_ATTEMPTS
+        self.reprobe_every = reprobe_every or Settings.RESOLVER_REPROBE_EVERY
+        self._lock = threading.Lock()
+        self._skips = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def should_try(self, domain, tier):
+        """False once a tier has only ever failed for the domain; re-probed every so often"""
+        with self._lock:
+            attempts, successes = self.stats.get(domain, {}).get(tier, (0, 0))
+            if attempts < self.min_attempts or successes:
+                return True
+            skips = self._skips.get((domain, tier), 0) + 1
+            self._skips[(domain, tier)] = skips
+            return skips % self.reprobe_every == 0
+
+    def record(self, domain, tier, success):
+        with self._lock:
+            attempts, successes = self.stats.setdefault(domain, {}).get(tier, (0, 0))
+            self.stats[domain][tier] = [attempts + 1, successes + (1 if success else 0)]
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+class UrlResolver:
+    """Recovers article content when direct extraction fails, cheapest tier first
+
+    Tiers: follow meta refresh / canonical / AMP links, read JSON-LD
+    ``articleBody`` from the page direct extraction already downloaded (HTTP
+    redirects were followed by that fetch), and only then open the page in
+    Selenium.
+    """
+
+    HTTP_TIERS = ('link', 'structured_data')
+
+    def __init__(self, article_processor, stats=None):
+        self.processor = article_processor
+        self.stats = stats or TierStats()
+        self.metrics = Metrics.shared()
+
+    @staticmethod
+    def domain(url):
+        return urlsplit(url).netloc.lower()
+
+    def _attempt(self, domain, tier, timings, resolve, final=False):
+        """Run one tier if the domain's history allows (a ``final`` tier always runs)
+
+        Returns ``(final_url, content, success)``, or None when the tier was
+        skipped or did not apply (no links, no JSON-LD), so nothing is learned.
+        """
+        if not final and not self.stats.should_try(domain, tier):
+            logger.info(f"   ⏭️  Skipping {tier} tier, it has not worked for {domain}")
+            return None
+
+        with self.metrics.timer(f"resolve_{tier}", timings):
+            result = resolve()
+        if result is None:
+            return None
+
+        success = not self.processor.needs_selenium(result[1])
+        self.stats.record(domain, tier, success)
+        if success:
+            self.metrics.increment(f"resolved_{tier}")
+        return result[0], result[1], success
+
+    def resolve_without_browser(self, url, response, timings=None):
+        """Try the HTTP-only tiers on the page direct extraction fetched; returns (final_url, content, tier)
+
+        ``response`` is that fetch's response, or None when it failed, in which
+        case only the browser is left to try.
+        """
+        if response is None:
+            return url, None, None
+
+        domain = self.domain(url)
+        final_url = response.url or url
+        hints = PageHints.from_html(response.text)
+
+        def follow_links():
+            candidates = []
+            for candidate in (hints.refresh_url, hints.canonical_url, hints.amp_url):
+                if candidate:
+                    candidate = urljoin(final_url, candidate)
+                    if candidate not in (url, final_url) and candidate not in candidates:
+                        candidates.append(candidate)
+            if not candidates:
+                return None
+            content = None
+            for candidate in candidates:
+                content = self.processor.extract_article_content(candidate, timings)
+                if not self.processor.needs_selenium(content):
+                    return candidate, content
+            return candidates[-1], content
+
+        def read_structured_data():
+            if not hints.json_ld:
+                return None
+            return final_url, content_from_json_ld(hints.json_ld)
+
+        for tier, resolve in zip(self.HTTP_TIERS, (follow_links, read_structured_data)):
+            result = self._attempt(domain, tier, timings, resolve)
+            if result and result[2]:
+                logger.info(f"   ✅ Resolved without a browser ({tier})")
+                return result[0], result[1], tier
+        return final_url, None, None
+
+    def resolve_with_selenium(self, url, timings=None):
+        """Last tier, never skipped: open the page in Chrome; returns (final_url, content, tier), tier None on failure"""
+        def open_in_browser():
+            self.metrics.increment('selenium_fallbacks')
+            final_url, page_source = self.processor.selenium_helper.get_final_page_selenium(url)
+            if not page_source:
+                return final_url, self.processor.extract_article_content(final_url, timings)
+            return final_url, self.processor.parse_article(
+                self.processor._article_from_html(final_url, page_source), timings
+            )
+
+        # Stats are still recorded, but a domain's history never rules out the fallback
+        final_url, content, success = self._attempt(self.domain(url), 'selenium', timings, open_in_browser, final=True)
+        return final_url, content, 'selenium' if success else None
+
+    def close(self):
+        self.stats.save()
@@ -1,4 +1,8 @@
 """Package initialization"""
 from .groq_service import GroqService
+from .summary_batcher import SummaryBatcher
+from .summary_cache import SummaryCache
+from .body_fingerprints import BodyFingerprintIndex, simhash
+from .content_compressor import ContentCompressor
 
-__all__ = ['GroqService']
\ No newline at end of file
+__all__ = ['GroqService', 'SummaryBatcher', 'SummaryCache', 'ContentCompressor', 'BodyFingerprintIndex', 'simhash']
\ No newline at end of file
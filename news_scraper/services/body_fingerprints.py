@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from config.settings import Settings
+from utils.metrics import Metrics
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+def simhash(text, shingle_size=None, min_words=None):
+    """64-bit SimHash over word shingles, or None for bodies too short to fingerprint"""
+    shingle_size = shingle_size or Settings.BODY_FINGERPRINT_SHINGLE_SIZE
+    min_words = min_words or Settings.BODY_FINGERPRINT_MIN_WORDS
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < min_words:
+        return None
+
+    counts = [0] * 64
+    shingles = {' '.join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            counts[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, count in enumerate(counts):
+        if count > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+def _signed(fingerprint):
+    """Fits an SQLite INTEGER"""
+    return fingerprint - (1 << 64) if fingerprint >> 63 else fingerprint
+
+class BodyFingerprintIndex:
+    """Persistent SimHash index of summarized bodies, to reuse summaries for near-identical copies
+
+    Fingerprints are split into ``max_distance + 1`` bands: two fingerprints
+    within ``max_distance`` bits agree exactly on at least one band, so only
+    articles sharing a band value are compared. Bands live in memory; links,
+    summaries and keywords stay in SQLite.
+    """
+
+    def __init__(self, db_path=None, max_distance=None, retention_days=None):
+        self.db_path = db_path or Settings.get_body_fingerprints_path()
+        self.max_distance = Settings.BODY_FINGERPRINT_MAX_DISTANCE if max_distance is None else max_distance
+        self.retention_days = retention_days or Settings.BODY_FINGERPRINT_RETENTION_DAYS
+        self.band_count = self.max_distance + 1
+        self.band_bits = 64 // self.band_count
+        self._buckets = [{} for _ in range(self.band_count)]
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "link TEXT PRIMARY KEY, fingerprint INTEGER NOT NULL, summary TEXT NOT NULL, "
+            "keywords TEXT NOT NULL, last_seen TEXT NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_last_seen ON fingerprints (last_seen)")
+        self.prune()
+
+        for link, fingerprint in self.conn.execute("SELECT link, fingerprint FROM fingerprints"):
+            self._index(fingerprint & MASK_64, link)
+
+    def _bands(self, fingerprint):
+        mask = (1 << self.band_bits) - 1
+        return [fingerprint >> (band * self.band_bits) & mask for band in range(self.band_count)]
+
+    def _index(self, fingerprint, link):
+        self._unindex(link)
+        self._fingerprints[link] = fingerprint
+        for band, value in enumerate(self._bands(fingerprint)):
+            self._buckets[band].setdefault(value, {})[link] = fingerprint
+
+    def _unindex(self, link):
+        """Drop a link's band entries, e.g. before it is indexed again"""
+        fingerprint = self._fingerprints.pop(link, None)
+        if fingerprint is None:
+            return
+        for band, value in enumerate(self._bands(fingerprint)):
+            bucket = self._buckets[band].get(value)
+            if bucket is not None:
+                bucket.pop(link, None)
+                if not bucket:
+                    del self._buckets[band][value]
+
+    def find(self, fingerprint, exclude=None):
+        """Closest stored body within max_distance as {link, distance, summary, keywords}, or None"""
+        with self._lock:
+            best = None
+            for band, value in enumerate(self._bands(fingerprint)):
+                for link, candidate in self._buckets[band].get(value, {}).items():
+                    if link == exclude:
+                        continue
+                    distance = hamming_distance(fingerprint, candidate)
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, link)
+            if best is None:
+                return None
+
+            row = self.conn.execute(
+                "SELECT summary, keywords FROM fingerprints WHERE link = ?", (best[1],)
+            ).fetchone()
+            if row is None:
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE fingerprints SET last_seen = ? WHERE link = ?",
+                                  (datetime.now().strftime('%Y-%m-%d'), best[1]))
+        Metrics.shared().increment('near_duplicate_bodies')
+        return {'link': best[1], 'distance': best[0], 'summary': row[0], 'keywords': json.loads(row[1])}
+
+    def add(self, fingerprint, link, groq_data):
+        """Remember a summarized body; empty summaries are not stored"""
+        if not groq_data.get('summary'):
+            return
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO fingerprints (link, fingerprint, summary, keywords, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (link, _signed(fingerprint), groq_data['summary'],
+                     json.dumps(groq_data.get('keywords', []), ensure_ascii=False),
+                     datetime.now().strftime('%Y-%m-%d'))
+                )
+            self._index(fingerprint, link)
+
+    def prune(self):
+        """Forget bodies not seen within the retention window, for long-running processes"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+        with self._lock:
+            stale = [row[0] for row in self.conn.execute(
+                "SELECT link FROM fingerprints WHERE last_seen < ?", (cutoff,)
+            )]
+            if not stale:
+                return 0
+            with self.conn:
+                self.conn.execute("DELETE FROM fingerprints WHERE last_seen < ?", (cutoff,))
+            for link in stale:
+                self._unindex(link)
+        return len(stale)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
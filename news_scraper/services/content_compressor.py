@@ -0,0 +1,137 @@
+import re
+import threading
+from collections import Counter
+from config.settings import Settings
+
+class ContentCompressor:
+    """Cleans article text and keeps the most informative sentences within a token budget"""
+
+    BOILERPLATE_PATTERNS = [
+        r'^also read\b',
+        r'^read more\b',
+        r'^read also\b',
+        r'^click here\b',
+        r'^follow us\b',
+        r'^download the\b.*\bapp\b',
+        r'^(published|updated)\s*[-:]',
+        r'^copyright\b',
+        r'\bsubscribe\b.*\bnewsletter\b',
+        r'\bnewsletter\b.*\bsubscribe\b',
+        r'^\(?this is the latest edition of\b',
+        r'^(by|written by)(\s+[\w.,]+){1,4}$',
+    ]
+
+    STOPWORDS = set("""
+        a an and are as at be been but by for from has have he her his i in is it its
+        of on or said says she that the their them they this to was were which who will
+        with would after also more than about over into up out not no had one two
+    """.split())
+
+    SENTENCE_SPLIT = re.compile(r'(?<=[.!?])["”’)]?\s+(?=["“‘(]?[A-Z0-9])')
+    ABBREVIATION = re.compile(r'(?:\b(?:Mr|Mrs|Ms|Dr|Prof|St|Jr|Sr|Gen|Col|Lt|Capt|Sgt|Rev|Hon|Gov|Sen|Rep|No|vs|etc|Inc|Ltd|Co)|\b(?:[A-Z]\.)*[A-Z])\.$')
+
+    def __init__(self, token_budget=None, min_repeats=None):
+        self.token_budget = token_budget or Settings.CONTENT_TOKEN_BUDGET
+        self.min_repeats = min_repeats or Settings.BOILERPLATE_MIN_REPEATS
+        self._boilerplate = re.compile('|'.join(self.BOILERPLATE_PATTERNS), re.IGNORECASE)
+        self._line_counts = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget learned boilerplate lines (the daemon calls this at day rollover)"""
+        with self._lock:
+            self._line_counts = {}
+
+    @staticmethod
+    def estimate_tokens(text):
+        """Rough token estimate (about 4 characters per token)"""
+        return len(text) // 4 + 1 if text else 0
+
+    @staticmethod
+    def _line_key(line):
+        return re.sub(r'\s+', ' ', line).strip().lower()
+
+    def _learn_lines(self, source, lines):
+        """Count each distinct line once per article; lines repeated across a source's articles are boilerplate"""
+        keys = set(self._line_key(line) for line in lines)
+        with self._lock:
+            counts = self._line_counts.setdefault(source, Counter())
+            counts.update(keys)
+            return {key for key in keys if counts[key] >= self.min_repeats}
+
+    def clean(self, text, source=None):
+        """Drop boilerplate lines (pattern-based and learned per source)"""
+        lines = [line.strip() for line in text.splitlines()]
+        lines = [line for line in lines if line]
+        repeated = self._learn_lines(source, lines) if source else set()
+
+        kept = []
+        for line in lines:
+            if self._boilerplate.search(line) or self._line_key(line) in repeated:
+                continue
+            kept.append(re.sub(r'\s+', ' ', line))
+        return kept
+
+    def _split_sentences(self, paragraph):
+        """Split on sentence punctuation, re-joining breaks after titles and initials"""
+        sentences = []
+        for piece in self.SENTENCE_SPLIT.split(paragraph):
+            piece = piece.strip()
+            if not piece:
+                continue
+            if sentences and self.ABBREVIATION.search(sentences[-1]):
+                sentences[-1] = f"{sentences[-1]} {piece}"
+            else:
+                sentences.append(piece)
+        return sentences
+
+    def _score_sentences(self, sentences):
+        words_per_sentence = [
+            [w for w in re.findall(r"[a-z0-9']+", s.lower()) if w not in self.STOPWORDS and len(w) > 2]
+            for s in sentences
+        ]
+        frequencies = Counter(w for words in words_per_sentence for w in set(words))
+
+        scores = []
+        for position, words in enumerate(words_per_sentence):
+            if not words:
+                scores.append(0.0)
+                continue
+            score = sum(frequencies[w] for w in set(words)) / len(words) ** 0.5
+            # Favour the lede: news puts the key facts first
+            score *= 1.0 + 1.0 / (1 + position)
+            scores.append(score)
+        return scores
+
+    def compress(self, text, source=None):
+        """Return (compressed_text, tokens_before, tokens_after)"""
+        tokens_before = self.estimate_tokens(text)
+        paragraphs = self.clean(text, source)
+
+        sentences = []
+        for paragraph in paragraphs:
+            sentences.extend(self._split_sentences(paragraph))
+
+        cleaned = ' '.join(sentences)
+        if self.estimate_tokens(cleaned) <= self.token_budget:
+            return cleaned, tokens_before, self.estimate_tokens(cleaned)
+
+        scores = self._score_sentences(sentences)
+        ranked = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))
+
+        # The lede is always kept; then the highest-scoring sentences that fit
+        selected = {0}
+        used = self.estimate_tokens(sentences[0])
+        for i in ranked:
+            if i in selected:
+                continue
+            cost = self.estimate_tokens(sentences[i])
+            if used + cost > self.token_budget:
+                continue
+            selected.add(i)
+            used += cost
+
+        compressed = ' '.join(sentences[i] for i in sorted(selected))
+        if self.estimate_tokens(compressed) > self.token_budget:
+            compressed = compressed[:self.token_budget * 4]
+        return compressed, tokens_before, self.estimate_tokens(compressed)
@@ -1,13 +1,50 @@
 import json
 from groq import Groq
 from config.settings import Settings
+from utils.log import get_logger
+from utils.metrics import Metrics
+
+logger = get_logger(__name__)
 
 class GroqService:
+    PROMPT_VERSION = 1  # bump when prompts change so cached summaries are regenerated
+    SYSTEM_PROMPT = "You are a helpful assistant that summarizes news articles and extracts key information. Always respond with valid JSON."
+
     def __init__(self, api_key=None):
         self.client = None
         if api_key:
             self.client = Groq(api_key=api_key)
     
+    @staticmethod
+    def estimate_tokens(text):
+        """Rough token estimate (about 4 characters per token)"""
+        return len(text) // 4 + 1
+
+    def _complete(self, prompt, max_tokens):
+        metrics = Metrics.shared()
+        with metrics.timer('groq_request'):
+            response = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model=Settings.GROQ_MODEL,
+                temperature=0.3,
+                max_tokens=max_tokens
+            )
+        metrics.increment('groq_requests')
+        usage = getattr(response, 'usage', None)
+        if usage:
+            metrics.increment('groq_prompt_tokens', usage.prompt_tokens or 0)
+            metrics.increment('groq_completion_tokens', usage.completion_tokens or 0)
+        return response.choices[0].message.content.strip()
+
     def summarize_article(self, text, title):
         """Summarize article content and extract keywords using Groq API"""
         if not self.client or not text:
@@ -34,23 +71,7 @@ class GroqService:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that summarizes news articles and extracts key information. Always respond with valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model="llama-3.1-8b-instant",
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            result_text = response.choices[0].message.content.strip()
+            result_text = self._complete(prompt, 500)
             
             # Try to parse JSON response
             try:
@@ -60,12 +81,129 @@ class GroqService:
                     "keywords": result.get("keywords", [])
                 }
             except json.JSONDecodeError:
-                print("   ⚠️  Failed to parse Groq response as JSON, using fallback")
+                logger.warning("   ⚠️  Failed to parse Groq response as JSON, using fallback")
                 return {
                     "summary": result_text[:200] + "..." if len(result_text) > 200 else result_text,
                     "keywords": []
                 }
                 
         except Exception as e:
-            print(f"   ❌ Error with Groq API: {str(e)[:100]}...")
-            return {"summary": "", "keywords": []}
\ No newline at end of file
+            logger.error(f"   ❌ Error with Groq API: {str(e)[:100]}...")
+            return {"summary": "", "keywords": []}
+
+    def _pack_batches(self, items):
+        """Group items into batches that fit the prompt token budget"""
+        batches = []
+        current = []
+        current_tokens = 0
+
+        for item in items:
+            item_tokens = self.estimate_tokens(item['title']) + self.estimate_tokens(item['text'])
+            if current and (current_tokens + item_tokens > Settings.GROQ_BATCH_TOKEN_BUDGET or
+                            len(current) >= Settings.GROQ_BATCH_SIZE):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += item_tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _parse_batch_response(result_text):
+        """Map article ids to {summary, keywords} from a JSON array response"""
+        start = result_text.find('[')
+        end = result_text.rfind(']')
+        if start == -1 or end < start:
+            return {}
+
+        try:
+            entries = json.loads(result_text[start:end + 1])
+        except json.JSONDecodeError:
+            return {}
+
+        parsed = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get('summary'):
+                continue
+            keywords = entry.get('keywords', [])
+            parsed[str(entry.get('id'))] = {
+                "summary": entry['summary'],
+                "keywords": keywords if isinstance(keywords, list) else []
+            }
+        return parsed
+
+    def _summarize_packed(self, batch):
+        """Summarize one packed batch, splitting and retrying only missing items"""
+        if len(batch) == 1:
+            item = batch[0]
+            return {item['id']: self.summarize_article(item['text'], item['title'])}
+
+        local_ids = {f"a{i}": item for i, item in enumerate(batch, 1)}
+        articles_block = "\n\n".join(
+            f"[{local_id}] Title: {item['title']}\nContent: {item['text']}"
+            for local_id, item in local_ids.items()
+        )
+        prompt = f"""
+            Please analyze each of the following {len(batch)} news articles and provide for each:
+
+            1. A concise summary (2-3 sentences)
+            2. 5-7 important keywords/key phrases
+
+            {articles_block}
+
+            Format your response as a JSON array with one object per article, using the id in brackets:
+            [
+                {{"id": "a1", "summary": "concise summary here", "keywords": ["keyword1", "keyword2"]}}
+            ]
+            """
+
+        parsed = {}
+        try:
+            result_text = self._complete(prompt, Settings.GROQ_BATCH_TOKENS_PER_ITEM * len(batch))
+            parsed = self._parse_batch_response(result_text)
+        except Exception as e:
+            logger.error(f"   ❌ Error with Groq batch request: {str(e)[:100]}...")
+
+        results = {}
+        missing = []
+        for local_id, item in local_ids.items():
+            if local_id in parsed:
+                results[item['id']] = parsed[local_id]
+            else:
+                missing.append(item)
+
+        if missing:
+            logger.warning(f"   ⚠️  Groq batch returned {len(batch) - len(missing)}/{len(batch)} summaries, retrying the rest")
+            middle = (len(missing) + 1) // 2
+            for half in (missing[:middle], missing[middle:]):
+                if half:
+                    results.update(self._summarize_packed(half))
+
+        return results
+
+    def summarize_batch(self, items):
+        """Summarize several articles per request
+
+        ``items`` is a list of ``{'id', 'title', 'text'}`` dicts; returns a dict
+        of id -> ``{"summary", "keywords"}`` covering every item.
+        """
+        empty = {"summary": "", "keywords": []}
+        results = {item['id']: dict(empty) for item in items}
+        if not self.client:
+            return results
+
+        to_send = []
+        for item in items:
+            if not item.get('text'):
+                continue
+            text = item['text']
+            if len(text) > Settings.GROQ_BATCH_ITEM_MAX_CHARS:
+                text = text[:Settings.GROQ_BATCH_ITEM_MAX_CHARS] + "..."
+            to_send.append({'id': item['id'], 'title': item['title'], 'text': text})
+
+        for batch in self._pack_batches(to_send):
+            results.update(self._summarize_packed(batch))
+        return results
@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import Future
+from config.settings import Settings
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class SummaryBatcher:
+    """Collects articles from worker threads and summarizes them in batched Groq requests"""
+
+    def __init__(self, groq_service, max_items=None, max_wait=None):
+        self.groq_service = groq_service
+        self.max_items = max_items or Settings.GROQ_BATCH_SIZE
+        self.max_wait = Settings.GROQ_BATCH_MAX_WAIT if max_wait is None else max_wait
+        self._condition = threading.Condition()
+        self._pending = []
+        self._outstanding = 0
+        self._next_id = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, title, text):
+        """Queue an article; the returned Future resolves to {summary, keywords}"""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Summary batcher is closed")
+            self._next_id += 1
+            self._pending.append(({'id': self._next_id, 'title': title, 'text': text}, future, time.monotonic()))
+            self._outstanding += 1
+            self._condition.notify_all()
+        return future
+
+    def _take_batch(self):
+        """Wait for a full batch, the oldest item's max wait, or shutdown"""
+        with self._condition:
+            while True:
+                if self._pending:
+                    waited = time.monotonic() - self._pending[0][2]
+                    if len(self._pending) >= self.max_items or waited >= self.max_wait or self._closed:
+                        batch = self._pending[:self.max_items]
+                        self._pending = self._pending[self.max_items:]
+                        return batch
+                    self._condition.wait(self.max_wait - waited)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+
+            try:
+                results = self.groq_service.summarize_batch([item for item, _, _ in batch])
+            except Exception as e:
+                logger.error(f"   ❌ Error with Groq batch: {str(e)[:100]}...")
+                results = {}
+
+            for item, future, _ in batch:
+                future.set_result(results.get(item['id'], {"summary": "", "keywords": []}))
+
+            with self._condition:
+                self._outstanding -= len(batch)
+                self._condition.notify_all()
+
+    def flush(self):
+        """Send everything queued now and wait until all results (and callbacks) are done"""
+        with self._condition:
+            if self._pending:
+                # Treat queued items as due so the worker sends them immediately
+                self._pending = [(item, future, float('-inf')) for item, future, _ in self._pending]
+                self._condition.notify_all()
+            while self._outstanding:
+                self._condition.wait()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from config.settings import Settings
+from utils.metrics import Metrics
+
+class SummaryCache:
+    """Persistent LRU cache of Groq summaries keyed by a hash of the article text"""
+
+    def __init__(self, db_path=None, max_entries=None):
+        self.db_path = db_path or Settings.get_summary_cache_path()
+        self.max_entries = max_entries or Settings.SUMMARY_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, summary TEXT NOT NULL, keywords TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_used ON summaries (last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(text, model, prompt_version):
+        """Hash of the normalized, truncated text plus the model and prompt version"""
+        normalized = re.sub(r'\s+', ' ', text[:Settings.MAX_CONTENT_LENGTH]).strip().lower()
+        payload = f"{model}\n{prompt_version}\n{normalized}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return a cached {summary, keywords} or None, updating recency"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT summary, keywords FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                Metrics.shared().increment('summary_cache_misses')
+                return None
+
+            self.hits += 1
+            Metrics.shared().increment('summary_cache_hits')
+            self.conn.execute("UPDATE summaries SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+            return {"summary": row[0], "keywords": json.loads(row[1])}
+
+    def put(self, key, groq_data):
+        """Store a successful summary; empty results are not cached"""
+        if not groq_data.get('summary'):
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, keywords, last_used) VALUES (?, ?, ?, ?)",
+                (key, groq_data['summary'], json.dumps(groq_data.get('keywords', []), ensure_ascii=False), time.time())
+            )
+            # Evict least recently used entries beyond the size limit
+            self.conn.execute(
+                "DELETE FROM summaries WHERE key IN ("
+                "SELECT key FROM summaries ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self.conn.commit()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
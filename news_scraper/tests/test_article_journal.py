@@ -0,0 +1,31 @@
+import json
+from config.settings import Settings
+from utils.article_journal import ArticleJournal
+from utils.storage import JournalStorage
+
+ARTICLE = {'title': 'A', 'source': 'The Hindu', 'link': 'https://example.com/a',
+           'text': 'Body', 'success': True, 'used_selenium': False}
+
+def test_read_articles_sees_appends_before_compaction(tmp_path):
+    filename = str(tmp_path / 'news_articles_2025-01-02.json')
+    journal = ArticleJournal(filename, '2025-01-02')
+    journal.append(ARTICLE)
+    journal.append({**ARTICLE, 'link': 'https://example.com/b'})
+
+    # A torn line from an append in progress is not returned
+    with open(journal.journal_path, 'ab') as f:
+        f.write(b'{"title": "C"')
+
+    links = [article['link'] for article in ArticleJournal.read_articles(filename)]
+    assert links == ['https://example.com/a', 'https://example.com/b']
+
+def test_compaction_keeps_the_journal_date(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, 'JSON_OUTPUT_DIR', str(tmp_path))
+    storage = JournalStorage()
+    storage.load_existing('2025-01-02')
+    storage.record(ARTICLE)
+
+    # Reopened days later, e.g. python main.py --compact-journal 2025-01-02
+    filename = JournalStorage.compact('2025-01-02')
+    with open(filename, 'r', encoding='utf-8') as f:
+        assert json.load(f)['metadata']['date'] == '2025-01-02'
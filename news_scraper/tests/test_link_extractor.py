@@ -0,0 +1,89 @@
+import random
+import pytest
+from bs4 import BeautifulSoup
+from scraper.link_extractor import LinkExtractor, lxml
+from scraper.the_hindu_scraper import TheHinduScraper
+from scraper.times_of_india_scraper import TimesOfIndiaScraper
+
+SOURCES = [TheHinduScraper.link_rules, TimesOfIndiaScraper.link_rules]
+
+# Wrappers around an anchor; the malformed ones put block elements in headings
+# and paragraphs or leave tags unclosed, as real homepages do
+VALID_WRAPPERS = [
+    '<h3 class="title">{a}</h3>',
+    '<h2 class="title">{a}</h2>',
+    '<div class="story-card"><span>{a}</span></div>',
+    '<div class="story-block"><h2>{a}</h2></div>',
+    '<div class="element"><h4>{a}</h4></div>',
+    '<div class="w_tle">{a}</div>',
+    '<div class="top-story"><ul><li>{a}</li></ul></div>',
+    '<span class="headline">{a}</span>',
+    '<p class="title">{a}</p>',
+    '<li>{a}</li>',
+]
+MALFORMED_WRAPPERS = [
+    '<h3 class="title"><div>{a}</div></h3>',
+    '<h2 class="title"><p>{a}</h2>',
+    '<p><div class="story-card">{a}</div></p>',
+    '<div class="story-block"><h2>{a}</div>',
+    '<div class="element"><h4><div>{a}</div></h4></div>',
+    '<span class="headline"><div>{a}</div></span>',
+    '<div class="w_tle">{a}',
+    '<table><div class="top-story">{a}</div></table>',
+    '<p class="title"><ul><li>{a}</li></ul></p>',
+    '<h3 class="title"><h4>{a}</h3></h4>',
+]
+HREFS = [
+    '/news/national/story-{n}.ece',
+    'https://www.thehindu.com/article{n}.ece',
+    'news/world/story-{n}.ece',
+    '/city/delhi/story-{n}/articleshow/{n}.cms',
+    'https://timesofindia.indiatimes.com/india/articleshow/{n}.cms',
+    '/sports/{n}',
+]
+
+def select_loop(rules, content):
+    """The scrapers' original soup.select loop, as the reference for LinkExtractor"""
+    soup = BeautifulSoup(content, 'html.parser')
+    links = []
+    seen_titles = set()
+    for selector in rules.selectors:
+        for link in soup.select(selector)[:rules.per_selector_limit]:
+            title = link.get_text().strip()
+            href = link.get('href')
+            if (title and len(title) > rules.min_title_length and href and
+                    any(pattern in href for pattern in rules.href_patterns)):
+                if href.startswith('/') or (rules.join_relative and not href.startswith('http')):
+                    href = rules.base_url + href
+                if title not in seen_titles:
+                    seen_titles.add(title)
+                    links.append((title, href))
+    return links[:rules.max_articles]
+
+def homepage(rng, wrappers, blocks=60):
+    parts = ['<html><body>']
+    for number in range(blocks):
+        title = ' '.join(rng.choice(['Budget', 'Monsoon', 'Election', 'Court', 'Markets', 'City'])
+                         for _ in range(rng.randint(1, 6)))
+        anchor = f'<a href="{rng.choice(HREFS).format(n=number)}">{title} {number}</a>'
+        parts.append(rng.choice(wrappers).format(a=anchor))
+    parts.append('</body></html>')
+    return ''.join(parts).encode('utf-8')
+
+@pytest.mark.parametrize('rules', SOURCES, ids=['the_hindu', 'times_of_india'])
+def test_default_parser_matches_select_loop_on_malformed_markup(rules):
+    rng = random.Random(17)
+    extractor = LinkExtractor(rules)
+    assert extractor.parser == 'html.parser'
+    for _ in range(60):
+        content = homepage(rng, VALID_WRAPPERS + MALFORMED_WRAPPERS)
+        assert extractor.extract(content) == select_loop(rules, content)
+
+@pytest.mark.skipif(lxml is None, reason="lxml is not installed")
+@pytest.mark.parametrize('rules', SOURCES, ids=['the_hindu', 'times_of_india'])
+def test_lxml_matches_select_loop_on_valid_markup(rules):
+    rng = random.Random(17)
+    extractor = LinkExtractor(rules, parser='lxml')
+    for _ in range(60):
+        content = homepage(rng, VALID_WRAPPERS)
+        assert extractor.extract(content, 'utf-8') == select_loop(rules, content)
@@ -0,0 +1,48 @@
+import os
+from utils.response_cache import ResponseCache
+
+class FakeResponse:
+    def __init__(self, url, content):
+        self.url = url
+        self.content = content
+        self.encoding = 'utf-8'
+        self.status_code = 200
+        self.headers = {}
+
+class FakeClient:
+    def get(self, url, headers=None):
+        return FakeResponse(url, b'<html>' + b'x' * 1000 + b'</html>')
+
+def disk_bytes(cache_dir):
+    return sum(os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir))
+
+def test_set_derived_counts_towards_max_bytes(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=6000)
+    client = FakeClient()
+    for number in range(3):
+        url = f"https://example.com/{number}"
+        cache.fetch(client, url, ttl=60)
+        # Distinct ages, so the least recently used entry is unambiguous
+        os.utime(cache._paths(url)[0], (1000 + number, 1000 + number))
+    assert cache._total_bytes == disk_bytes(tmp_path)
+
+    # Parsed content larger than the body pushes the cache over its limit
+    cache.set_derived("https://example.com/2", 'content', {'text': 'y' * 4000})
+
+    assert cache._total_bytes == disk_bytes(tmp_path)
+    assert cache._total_bytes <= cache.max_bytes
+    assert cache.get_derived("https://example.com/2", 'content') == {'text': 'y' * 4000}
+    assert cache.get_derived("https://example.com/0", 'content') is None
+    assert not os.path.exists(cache._paths("https://example.com/0")[1])
+
+def test_byte_count_survives_rewrites(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=1 << 20)
+    client = FakeClient()
+    url = "https://example.com/article"
+    cache.fetch(client, url, ttl=60)
+    for size in (500, 50, 2000, 10):
+        cache.set_derived(url, 'content', {'text': 'z' * size})
+    cache.fetch(client, url, ttl=0)
+
+    assert cache._total_bytes == disk_bytes(tmp_path)
+    assert ResponseCache(str(tmp_path), max_bytes=1 << 20)._total_bytes == cache._total_bytes
@@ -1,5 +1,18 @@
 from .file_handler import FileHandler
 from .duplicate_checker import DuplicateChecker
-from .selenium_helper import SeleniumHelper
+from .selenium_helper import SeleniumHelper, DriverPool
+from .http_client import HttpClient
+from .response_cache import ResponseCache
+from .article_journal import ArticleJournal
+from .body_store import BodyStore
+from .storage import StorageBackend, JsonStorage, JournalStorage, SQLiteStorage
+from .seen_urls import SeenUrlStore, canonicalize_url
+from .parquet_export import ParquetExporter
+from .metrics import Metrics
+from .log import configure_logging, get_logger
 
-__all__ = ['FileHandler', 'DuplicateChecker', 'SeleniumHelper']
\ No newline at end of file
+__all__ = ['FileHandler', 'DuplicateChecker', 'SeleniumHelper', 'DriverPool', 'HttpClient', 'ResponseCache', 'ArticleJournal',
+           'BodyStore',
+           'StorageBackend', 'JsonStorage', 'JournalStorage', 'SQLiteStorage',
+           'SeenUrlStore', 'canonicalize_url', 'ParquetExporter',
+           'Metrics', 'configure_logging', 'get_logger']
\ No newline at end of file
@@ -0,0 +1,230 @@
+import json
+import os
+import threading
+from datetime import datetime
+from config.settings import Settings
+from utils.body_store import BodyStore
+from utils.daily_articles import read_daily_articles
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class ArticleJournal:
+    """Append-only JSON Lines journal for one day's processed articles
+
+    Three files live next to the daily JSON file:
+      - ``.jsonl``: full article records, appended and fsynced one at a time
+      - ``.idx.jsonl``: light records (title, source, link, flags) plus the
+        journal offset, so loading for dedup never parses article bodies
+      - ``.meta.json``: running metadata, rewritten atomically per append
+    """
+
+    INDEX_FIELDS = ('title', 'source', 'link', 'success', 'used_selenium')
+
+    def __init__(self, json_filename, date=None):
+        self.json_filename = json_filename
+        self.journal_path, self.index_path, self.meta_path = self.paths(json_filename)
+        self.date = date
+        self._lock = threading.Lock()
+        self._index = []
+        self._metadata = None
+        self.body_store = BodyStore(json_filename) if Settings.BODY_STORE_ENABLED else None
+
+        os.makedirs(os.path.dirname(json_filename) or '.', exist_ok=True)
+        if not os.path.exists(self.journal_path) and os.path.exists(json_filename):
+            self._seed_from_json()
+        self._load_index()
+
+    @staticmethod
+    def paths(json_filename):
+        """(journal, index, metadata) paths next to a daily JSON file"""
+        base, _ = os.path.splitext(json_filename)
+        return f"{base}.jsonl", f"{base}.idx.jsonl", f"{base}.meta.json"
+
+    @classmethod
+    def read_articles(cls, json_filename):
+        """Full records of a day's journal, read-only, for readers such as the UI"""
+        journal_path, _, _ = cls.paths(json_filename)
+        if not os.path.exists(journal_path):
+            raise FileNotFoundError(journal_path)
+        return [article for _, article in cls._read_lines(journal_path)]
+
+    @staticmethod
+    def _write_line(f, record):
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _seed_from_json(self):
+        """One-time import of a daily JSON file written by the whole-file mode"""
+        try:
+            articles = read_daily_articles(self.json_filename)
+        except Exception as e:
+            logger.warning(f"⚠️  Error seeding journal from {self.json_filename}: {e}")
+            return
+
+        with open(self.journal_path, 'ab') as journal, open(self.index_path, 'a', encoding='utf-8') as index:
+            for article in articles:
+                self._append_record(journal, index, article)
+
+    def _append_record(self, journal, index, article):
+        if self.body_store:
+            article = self.body_store.externalize([article])[0]
+        journal.write((json.dumps(article, ensure_ascii=False) + '\n').encode('utf-8'))
+        journal.flush()
+        os.fsync(journal.fileno())
+
+        entry = self._index_entry(article)
+        entry['offset'] = journal.tell()
+        self._write_line(index, entry)
+        return entry
+
+    def _index_entry(self, article):
+        entry = {field: article.get(field) for field in self.INDEX_FIELDS}
+        entry['success'] = bool(entry['success'])
+        entry['used_selenium'] = bool(entry['used_selenium'])
+        return entry
+
+    @staticmethod
+    def _read_lines(path, start=0):
+        """Yield (end_offset, record) pairs, skipping a torn trailing line"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    yield f.tell(), json.loads(line)
+                except ValueError:
+                    continue
+
+    @staticmethod
+    def _truncate_torn_tail(path):
+        """Drop a partial last line left by a crash so later appends start cleanly"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            position = size
+            while position > 0:
+                chunk_start = max(0, position - 4096)
+                f.seek(chunk_start)
+                chunk = f.read(position - chunk_start)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    position = chunk_start + newline + 1
+                    break
+                position = chunk_start
+            if position != size:
+                f.truncate(position)
+
+    def _load_index(self):
+        self._truncate_torn_tail(self.journal_path)
+        self._truncate_torn_tail(self.index_path)
+        self._index = [entry for _, entry in self._read_lines(self.index_path)]
+
+        # Recover articles that reached the journal but not the index before a crash
+        indexed_offset = self._index[-1]['offset'] if self._index else 0
+        journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        if journal_size > indexed_offset:
+            with open(self.index_path, 'a', encoding='utf-8') as index:
+                for offset, article in self._read_lines(self.journal_path, indexed_offset):
+                    entry = self._index_entry(article)
+                    entry['offset'] = offset
+                    self._write_line(index, entry)
+                    self._index.append(entry)
+
+        self._metadata = self._load_metadata()
+
+    def _load_metadata(self):
+        metadata = None
+        if os.path.exists(self.meta_path):
+            try:
+                with open(self.meta_path, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except Exception:
+                metadata = None
+
+        stale_date = self.date is not None and metadata is not None and metadata.get('date') != self.date
+        if metadata is None or metadata.get('total_articles') != len(self._index) or stale_date:
+            metadata = self._metadata_from_index(metadata)
+            self._write_atomic(self.meta_path, metadata)
+        return metadata
+
+    def _metadata_from_index(self, previous=None):
+        now = datetime.now()
+        # The day this journal belongs to, not the day it is reopened (e.g. for compaction)
+        date = self.date or (previous or {}).get('date') or now.strftime('%Y-%m-%d')
+        return {
+            'total_articles': len(self._index),
+            'successful_articles': sum(1 for a in self._index if a['success']),
+            'failed_articles': sum(1 for a in self._index if not a['success']),
+            'selenium_used': sum(1 for a in self._index if a['used_selenium']),
+            'sources': sorted(set(a['source'] for a in self._index)),
+            'generated_at': (previous or {}).get('generated_at', now.isoformat()),
+            'date': date,
+            'updated_at': now.isoformat()
+        }
+
+    def load_index(self):
+        """Light records for every journaled article (no bodies or summaries)"""
+        with self._lock:
+            return [dict(entry) for entry in self._index]
+
+    def append(self, article):
+        """Durably append one processed article and update metadata"""
+        with self._lock:
+            with open(self.journal_path, 'ab') as journal, open(self.index_path, 'a', encoding='utf-8') as index:
+                entry = self._append_record(journal, index, article)
+            self._index.append(entry)
+
+            metadata = self._metadata
+            metadata['total_articles'] += 1
+            if entry['success']:
+                metadata['successful_articles'] += 1
+            else:
+                metadata['failed_articles'] += 1
+            if entry['used_selenium']:
+                metadata['selenium_used'] += 1
+            if entry['source'] not in metadata['sources']:
+                metadata['sources'].append(entry['source'])
+            metadata['updated_at'] = datetime.now().isoformat()
+            self._write_atomic(self.meta_path, metadata)
+
+    @property
+    def metadata(self):
+        with self._lock:
+            return dict(self._metadata)
+
+    def compact(self, extra_metadata=None):
+        """Atomically rewrite the daily JSON file from the journal"""
+        with self._lock:
+            metadata = {**self._metadata, **(extra_metadata or {})}
+            tmp_path = f"{self.json_filename}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('{\n  "metadata": ')
+                f.write(json.dumps(metadata, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+                f.write(',\n  "articles": [')
+                count = 0
+                for _, article in self._read_lines(self.journal_path):
+                    f.write(',\n    ' if count else '\n    ')
+                    f.write(json.dumps(article, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+                    count += 1
+                f.write('\n  ]\n}' if count else ']\n}')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.json_filename)
+
+        logger.info(f"💾 Compacted {len(self._index)} journaled articles into {self.json_filename}")
+        return self.json_filename
@@ -0,0 +1,33 @@
+import os
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zlib is always available
+    zstandard = None
+
+# Record layout of the body store: one codec byte, then the compressed UTF-8 text
+CODEC_ZLIB = b'z'
+CODEC_ZSTD = b's'
+
+def bodies_path(json_filename):
+    """Body store file that sits next to a daily JSON file"""
+    base, _ = os.path.splitext(json_filename)
+    return f"{base}.bodies"
+
+def compress_record(data, codec, level):
+    """One stored record for UTF-8 ``data``; ``codec`` is CODEC_ZLIB or CODEC_ZSTD"""
+    if codec == CODEC_ZSTD:
+        return CODEC_ZSTD + zstandard.ZstdCompressor(level=level).compress(data)
+    return CODEC_ZLIB + zlib.compress(data, level)
+
+def decompress_record(record):
+    """Text of one stored record; ``record`` may be a memoryview"""
+    codec = bytes(record[:1])
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Article body was stored with zstd; install zstandard to read it")
+        data = zstandard.ZstdDecompressor().decompress(record[1:])
+    else:
+        data = zlib.decompress(record[1:])
+    return data.decode('utf-8')
@@ -0,0 +1,126 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from utils.body_codec import CODEC_ZLIB, CODEC_ZSTD, bodies_path, compress_record, decompress_record, zstandard
+from config.settings import Settings
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class BodyStore:
+    """Append-only file of individually compressed article bodies for one day
+
+    ``<base>.bodies`` holds the records and ``<base>.bodies.idx`` one fixed-size
+    entry per record (offset, length, digest of the text), so a body saved
+    again is stored once. Articles keep ``body_ref: [offset, length]`` instead
+    of ``text``; reads map the file and decompress only the requested record.
+    """
+
+    ENTRY = struct.Struct('<QI8s')
+
+    def __init__(self, json_filename, codec=None):
+        self.path = bodies_path(json_filename)
+        self.index_path = f"{self.path}.idx"
+        codec = codec or Settings.BODY_STORE_CODEC
+        if codec == 'zstd' and zstandard is None:
+            logger.warning("⚠️  zstandard is not installed, compressing article bodies with zlib")
+        self.codec = CODEC_ZSTD if codec == 'zstd' and zstandard is not None else CODEC_ZLIB
+        self._lock = threading.Lock()
+        self._refs = {}
+        self._index_size = 0
+        self._map = None
+        self._load_index()
+
+    def _load_index(self):
+        """Index entries whose record is fully on disk; later entries are from a torn write"""
+        try:
+            blob_size = os.path.getsize(self.path)
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+
+        for position in range(0, len(data) - self.ENTRY.size + 1, self.ENTRY.size):
+            offset, length, digest = self.ENTRY.unpack_from(data, position)
+            if offset + length > blob_size:
+                break
+            self._refs[digest] = [offset, length]
+            self._index_size = position + self.ENTRY.size
+
+    @staticmethod
+    def digest(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+    def _compress(self, data):
+        return compress_record(data, self.codec, Settings.BODY_STORE_LEVEL)
+
+    def put_many(self, texts):
+        """Store bodies not stored yet (two fsyncs per call); returns an [offset, length] per text"""
+        encoded = [text.encode('utf-8') for text in texts]
+        digests = [self.digest(data) for data in encoded]
+        with self._lock:
+            new_records = {}
+            for digest, data in zip(digests, encoded):
+                if digest not in self._refs and digest not in new_records:
+                    new_records[digest] = self._compress(data)
+
+            if new_records:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                entries = []
+                # Records first and appended after whatever is on disk (a torn tail stays
+                # unreferenced), then index entries, so an entry never points past the data
+                with open(self.path, 'ab') as f:
+                    offset = f.tell()
+                    for digest, record in new_records.items():
+                        f.write(record)
+                        self._refs[digest] = [offset, len(record)]
+                        entries.append(self.ENTRY.pack(offset, len(record), digest))
+                        offset += len(record)
+                    f.flush()
+                    os.fsync(f.fileno())
+                with open(self.index_path, 'ab') as f:
+                    f.truncate(self._index_size)
+                    f.write(b''.join(entries))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._index_size += len(entries) * self.ENTRY.size
+
+            return [list(self._refs[digest]) for digest in digests]
+
+    def externalize(self, articles):
+        """Copies of the articles with non-empty 'text' moved into the store as 'body_ref'"""
+        with_text = [article for article in articles if article.get('text')]
+        refs = iter(self.put_many([article['text'] for article in with_text]))
+
+        stored = []
+        for article in articles:
+            if article.get('text'):
+                article = {key: value for key, value in article.items() if key != 'text'}
+                article['body_ref'] = next(refs)
+            stored.append(article)
+        return stored
+
+    def read(self, ref):
+        """Decompress one body; the file is mapped, not read"""
+        offset, length = ref
+        with self._lock:
+            if self._map is None or len(self._map) < offset + length:
+                if self._map is not None:
+                    self._map.close()
+                with open(self.path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return decompress_record(memoryview(self._map)[offset:offset + length])
+
+    def text(self, article):
+        """An article's body, inline or from the store"""
+        if article.get('body_ref'):
+            return self.read(article['body_ref'])
+        return article.get('text') or ''
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
@@ -0,0 +1,13 @@
+import json
+
+def normalize_article(article):
+    """Bring a stored record up to the current layout"""
+    if isinstance(article.get('success'), str):
+        # Older records carried the body again as their 'success' value
+        article = {**article, 'success': bool(article['success'])}
+    return article
+
+def read_daily_articles(filename):
+    """Articles of a daily JSON file, normalized; raises OSError/ValueError like json.load"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [normalize_article(article) for article in json.load(f).get('articles', [])]
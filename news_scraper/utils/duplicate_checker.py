@@ -1,24 +1,96 @@
+from config.settings import Settings
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class TitleIndex:
+    """Inverted token index over normalized titles for near-duplicate lookups"""
+
+    MIN_SIMILARITY_LENGTH = 20
+
+    def __init__(self, threshold=None):
+        self.threshold = Settings.SIMILARITY_THRESHOLD if threshold is None else threshold
+        self.exact_titles = set()
+        self.token_sets = []
+        self.postings = {}
+
+    @staticmethod
+    def normalize(title):
+        return title.strip().lower()
+
+    def add(self, title):
+        """Index a title so later queries can match against it"""
+        title = self.normalize(title)
+        self.exact_titles.add(title)
+
+        if len(title) > self.MIN_SIMILARITY_LENGTH:
+            title_id = len(self.token_sets)
+            words = set(title.split())
+            self.token_sets.append(words)
+            for word in words:
+                self.postings.setdefault(word, []).append(title_id)
+
+    def _min_overlap(self, size):
+        """Smallest shared word count that can clear the threshold for a title of this size"""
+        overlap = int(self.threshold * size)
+        while overlap <= size and overlap / size <= self.threshold:
+            overlap += 1
+        return max(overlap, 1)
+
+    def contains_similar(self, title):
+        """Same decision as DuplicateChecker's pairwise exact-or-Jaccard-style check"""
+        title = self.normalize(title)
+        if title in self.exact_titles:
+            return True
+
+        if len(title) <= self.MIN_SIMILARITY_LENGTH:
+            return False
+
+        words = set(title.split())
+        min_overlap = self._min_overlap(len(words))
+        if min_overlap > len(words):
+            return False
+
+        # Prefix filter: any title sharing min_overlap words must share at least
+        # one of the (len - min_overlap + 1) rarest words, so only probe those.
+        probe_words = sorted(words, key=lambda w: len(self.postings.get(w, ())))
+        probe_words = probe_words[:len(words) - min_overlap + 1]
+
+        checked = set()
+        for word in probe_words:
+            for title_id in self.postings.get(word, ()):
+                if title_id in checked:
+                    continue
+                checked.add(title_id)
+
+                existing_words = self.token_sets[title_id]
+                common_words = len(words & existing_words)
+                if common_words / max(len(words), len(existing_words)) > self.threshold:
+                    return True
+
+        return False
+
 class DuplicateChecker:
     @staticmethod
     def is_duplicate_article(new_article, existing_articles):
         """Check if article with same title already exists"""
         new_title = new_article['title'].strip().lower()
-        
+
         for existing_article in existing_articles:
             existing_title = existing_article['title'].strip().lower()
-            
+
             # Exact match
             if new_title == existing_title:
                 return True
-            
+
             # Similarity check for longer titles
             if len(new_title) > 20 and len(existing_title) > 20:
                 similarity = DuplicateChecker._calculate_similarity(new_title, existing_title)
-                if similarity > 0.7:  # 70% similarity threshold
+                if similarity > Settings.SIMILARITY_THRESHOLD:
                     return True
-        
+
         return False
-    
+
     @staticmethod
     def _calculate_similarity(title1, title2):
         """Calculate similarity between two titles"""
@@ -26,19 +98,32 @@ class DuplicateChecker:
         words2 = set(title2.split())
         common_words = words1.intersection(words2)
         return len(common_words) / max(len(words1), len(words2))
-    
+
+    @staticmethod
+    def build_index(articles, threshold=None):
+        """Build a title index over existing articles once per run"""
+        index = TitleIndex(threshold)
+        for article in articles:
+            index.add(article['title'])
+        return index
+
     @staticmethod
-    def filter_new_articles(scraped_articles, existing_articles):
-        """Filter out articles that already exist"""
+    def filter_new_articles(scraped_articles, existing_articles, index=None):
+        """Filter out articles that already exist or repeat earlier ones in the batch"""
+        if index is None:
+            index = DuplicateChecker.build_index(existing_articles)
+
         new_articles = []
         duplicate_count = 0
-        
+
         for article in scraped_articles:
-            if not DuplicateChecker.is_duplicate_article(article, existing_articles):
+            if not index.contains_similar(article['title']):
                 new_articles.append(article)
+                # Catch the same story from another source later in this batch
+                index.add(article['title'])
             else:
                 duplicate_count += 1
-                print(f"   ⏭️  Skipping duplicate: {article['title'][:60]}...")
-        
-        print(f"📊 Filtered {duplicate_count} duplicate articles")
-        return new_articles
\ No newline at end of file
+                logger.info(f"   ⏭️  Skipping duplicate: {article['title'][:60]}...")
+
+        logger.info(f"📊 Filtered {duplicate_count} duplicate articles")
+        return new_articles
@@ -1,6 +1,14 @@
 import json
 import os
 from datetime import datetime
+from config.settings import Settings
+from utils.storage import JsonStorage, JournalStorage, SQLiteStorage
+from utils.body_store import BodyStore
+from utils.daily_articles import read_daily_articles
+from utils.log import get_logger
+from utils.metrics import Metrics
+
+logger = get_logger(__name__)
 
 class FileHandler:
     @staticmethod
@@ -10,13 +18,20 @@ class FileHandler:
             return []
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('articles', [])
+            return read_daily_articles(filename)
         except Exception as e:
-            print(f"⚠️  Error loading existing file: {e}")
+            logger.warning(f"⚠️  Error loading existing file: {e}")
             return []
     
+    def get_storage(self, mode=None):
+        """Create the storage backend for a mode: 'json', 'journal' or 'sqlite'"""
+        mode = mode or Settings.STORAGE_MODE
+        if mode == 'journal':
+            return JournalStorage()
+        if mode == 'sqlite':
+            return SQLiteStorage(file_handler=self)
+        return JsonStorage(self)
+    
     @staticmethod
     def save_to_json(articles, filename, metadata=None):
         """Save articles to JSON file"""
@@ -36,9 +51,14 @@ class FileHandler:
                 'sources': list(set(article['source'] for article in articles)),
                 'generated_at': datetime.now().isoformat(),
                 'date': datetime.now().strftime('%Y-%m-%d'),
-                'updated_at': datetime.now().isoformat()
+                'updated_at': datetime.now().isoformat(),
+                'metrics': Metrics.shared().summary()
             }
         
+        # Bodies go to the day's body store; the JSON keeps a reference to each
+        if Settings.BODY_STORE_ENABLED:
+            articles = BodyStore(filename).externalize(articles)
+        
         output = {
             'metadata': metadata,
             'articles': articles
@@ -47,5 +67,5 @@ class FileHandler:
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(output, f, indent=2, ensure_ascii=False)
         
-        print(f"💾 Saved {len(articles)} articles to {filename}")
+        logger.info(f"💾 Saved {len(articles)} articles to {filename}")
         return filename
\ No newline at end of file
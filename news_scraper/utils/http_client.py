@@ -0,0 +1,109 @@
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from config.settings import Settings
+from utils.response_cache import ResponseCache, CachedResponse
+from utils.metrics import Metrics
+
+class JitteredRetry(Retry):
+    """urllib3 Retry with random jitter added to the exponential backoff"""
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, Settings.HTTP_BACKOFF_JITTER)
+
+    def increment(self, *args, **kwargs):
+        Metrics.shared().increment('http_retries')
+        return super().increment(*args, **kwargs)
+
+class HttpClient:
+    """Shared requests session with per-host connection pooling and retries"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': Settings.USER_AGENT,
+            # Advertises br only when a brotli decoder is installed
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+        })
+
+        retries = JitteredRetry(
+            total=Settings.HTTP_MAX_RETRIES,
+            backoff_factor=Settings.HTTP_BACKOFF_FACTOR,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=Settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Settings.HTTP_POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self.cache = None
+        if Settings.HTTP_CACHE_ENABLED:
+            self.cache = ResponseCache(Settings.get_http_cache_dir(), Settings.HTTP_CACHE_MAX_BYTES)
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide client used by scrapers and article extraction"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, url, headers=None, timeout=None):
+        """GET a URL through the pooled session, raising on HTTP errors"""
+        response = self.session.get(
+            url, headers=headers, timeout=timeout or Settings.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        return response
+
+    def fetch(self, url, ttl, headers=None):
+        """GET a URL through the response cache when it is enabled"""
+        if self.cache:
+            return self.cache.fetch(self, url, ttl, headers=headers)
+
+        response = self.get(url, headers=headers)
+        return CachedResponse(response.url, response.content, response.encoding,
+                              response.status_code, 'bypass')
+
+    def cache_stats(self):
+        """Per-run cache hit/miss/revalidated counts"""
+        if not self.cache:
+            return None
+        return self.cache.summary()
+
+    def connection_stats(self):
+        """Count requests sent, connections opened and connections reused"""
+        requests_sent = 0
+        connections_opened = 0
+
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += pool.num_requests
+            connections_opened += pool.num_connections
+
+        return {
+            'requests': requests_sent,
+            'connections': connections_opened,
+            'reused': max(requests_sent - connections_opened, 0),
+        }
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,54 @@
+import json
+import logging
+import sys
+from config.settings import Settings
+
+LOGGER_NAME = 'news_scraper'
+
+# Attributes every LogRecord has; anything else came from ``extra=``
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and any ``extra`` fields"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage().strip(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_FIELDS})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class StdoutHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is at emit time, so redirecting stdout still works"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure_logging(log_format=None, level=None):
+    """Set up the package logger: 'text' keeps the console messages, 'json' emits JSON lines"""
+    log_format = log_format or Settings.LOG_FORMAT
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level or Settings.LOG_LEVEL)
+    logger.propagate = False
+
+    handler = StdoutHandler()
+    handler.setFormatter(JsonFormatter() if log_format == 'json' else logging.Formatter('%(message)s'))
+    logger.handlers = [handler]
+    return logger
+
+def get_logger(name):
+    """Logger under the package namespace, configured with defaults on first use"""
+    root = logging.getLogger(LOGGER_NAME)
+    if not root.handlers:
+        configure_logging()
+    return root.getChild(name)
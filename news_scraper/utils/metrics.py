@@ -0,0 +1,123 @@
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from config.settings import Settings
+
+class Metrics:
+    """Per-run stage timers and event counters, shared across threads
+
+    Counts and totals cover every observation; quantiles and max come from the
+    latest ``METRICS_MAX_SAMPLES`` per stage, so a long-lived daemon stays bounded.
+    """
+
+    QUANTILES = (0.5, 0.95)
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.totals = {}
+        self.counters = Counter()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide registry every stage reports into"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @contextmanager
+    def timer(self, stage, timings=None):
+        """Time a block as ``stage``; also adds the duration to a per-article ``timings`` dict"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, timings)
+
+    def observe(self, stage, seconds, timings=None):
+        with self._lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=Settings.METRICS_MAX_SAMPLES)
+                self.totals[stage] = [0, 0.0]
+            self.samples[stage].append(seconds)
+            self.totals[stage][0] += 1
+            self.totals[stage][1] += seconds
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + seconds
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    @staticmethod
+    def _quantile(ordered, q):
+        """Linear-interpolated quantile of an already sorted list"""
+        position = (len(ordered) - 1) * q
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    def summary(self):
+        """Run-level aggregates: count, total, p50, p95 and max per stage, plus counters"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self.samples.items()}
+            totals = {stage: tuple(total) for stage, total in self.totals.items()}
+            counters = dict(self.counters)
+
+        stages = {}
+        for stage, ordered in samples.items():
+            count, total = totals[stage]
+            stages[stage] = {
+                'count': count,
+                'total_s': round(total, 4),
+                'p50_s': round(self._quantile(ordered, 0.5), 4),
+                'p95_s': round(self._quantile(ordered, 0.95), 4),
+                'max_s': round(ordered[-1], 4),
+            }
+        return {'stages': stages, 'counters': counters}
+
+    def to_prometheus(self, prefix='news_scraper'):
+        """Render stages as a summary metric and counters as counters (Prometheus text format)"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self.samples.items()}
+            totals = {stage: tuple(total) for stage, total in self.totals.items()}
+            counters = dict(self.counters)
+
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage, ordered in sorted(samples.items()):
+            for q in self.QUANTILES:
+                lines.append(f'{prefix}_stage_seconds{{stage="{stage}",quantile="{q}"}} {self._quantile(ordered, q):.6f}')
+            count, total = totals[stage]
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {count}')
+
+        for name, value in sorted(counters.items()):
+            metric = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Atomically write the text exposition file (node_exporter textfile collector layout)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self.samples = {}
+            self.totals = {}
+            self.counters = Counter()
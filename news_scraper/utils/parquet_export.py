@@ -0,0 +1,169 @@
+import glob
+import json
+import os
+import re
+import shutil
+from urllib.parse import quote
+from config.settings import Settings
+from utils.body_store import BodyStore
+from utils.daily_articles import read_daily_articles
+from utils.log import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - only needed for --export-parquet
+    pa = None
+
+logger = get_logger(__name__)
+
+DAILY_FILE = re.compile(r'news_articles_(\d{4}-\d{2}-\d{2})\.json')
+
+# Bodies and free text: plain encoding, every other string column is dictionary encoded
+TEXT_COLUMNS = ('text', 'summary', 'ai_summary')
+
+def article_schema():
+    """Columns of one partition file; date and source come from the partition path"""
+    return pa.schema([
+        ('title', pa.string()),
+        ('link', pa.string()),
+        ('final_url', pa.string()),
+        ('published_date', pa.string()),
+        ('publish_date', pa.string()),
+        ('processed_at', pa.string()),
+        ('success', pa.bool_()),
+        ('used_selenium', pa.bool_()),
+        ('resolved_by', pa.string()),
+        ('content_length', pa.int64()),
+        ('authors', pa.list_(pa.string())),
+        ('keywords', pa.list_(pa.string())),
+        ('top_image', pa.string()),
+        ('timings', pa.map_(pa.string(), pa.float64())),
+        ('summary', pa.large_string()),
+        ('ai_summary', pa.large_string()),
+        # Last and in its own column chunk, so metadata and keyword scans never read it
+        ('text', pa.large_string()),
+    ])
+
+def _row(article, body_store):
+    return {
+        'title': article.get('title'),
+        'link': article.get('link'),
+        'final_url': article.get('final_url'),
+        'published_date': article.get('published_date'),
+        'publish_date': article.get('publish_date'),
+        'processed_at': article.get('processed_at'),
+        'success': bool(article.get('success')),
+        'used_selenium': bool(article.get('used_selenium')),
+        'resolved_by': article.get('resolved_by'),
+        'content_length': article.get('content_length'),
+        'authors': [str(author) for author in article.get('authors') or []],
+        'keywords': [str(keyword) for keyword in article.get('keywords') or []],
+        'top_image': article.get('top_image'),
+        'timings': list((article.get('timings') or {}).items()),
+        'summary': article.get('summary'),
+        'ai_summary': article.get('ai_summary'),
+        'text': body_store.text(article),
+    }
+
+class ParquetExporter:
+    """Incremental export of the daily JSON files into a Parquet dataset
+
+    Layout is Hive-style, one file per day and source::
+
+        <export_dir>/date=YYYY-MM-DD/source=<quoted name>/part-0.parquet
+
+    Each changed day is rewritten whole (which also compacts it), and days whose
+    JSON file has the same mtime and size as at the last export are skipped.
+    """
+
+    STATE_FILE = "_export_state.json"  # '_' prefix keeps it out of dataset discovery
+
+    def __init__(self, export_dir=None, json_dir=None):
+        if pa is None:
+            raise ImportError("Parquet export needs pyarrow (pip install pyarrow)")
+        self.export_dir = export_dir or Settings.get_parquet_export_dir()
+        self.json_dir = json_dir or Settings.JSON_OUTPUT_DIR or '.'
+        self.state_path = os.path.join(self.export_dir, self.STATE_FILE)
+        self.schema = article_schema()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def daily_files(self):
+        """(date, path) of every daily JSON file, oldest first"""
+        files = []
+        for path in sorted(glob.glob(os.path.join(self.json_dir, 'news_articles_*.json'))):
+            match = DAILY_FILE.fullmatch(os.path.basename(path))
+            if match:
+                files.append((match.group(1), path))
+        return files
+
+    def export_day(self, date, articles, body_store):
+        """Write one day's partitions, replacing the previous export of that day"""
+        by_source = {}
+        for article in articles:
+            by_source.setdefault(article.get('source') or 'Unknown', []).append(_row(article, body_store))
+
+        day_dir = os.path.join(self.export_dir, f"date={date}")
+        # Dot prefix keeps a half-written day out of dataset discovery
+        tmp_dir = os.path.join(self.export_dir, f".date={date}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        dictionary_columns = [name for name in self.schema.names if name not in TEXT_COLUMNS]
+        for source, rows in by_source.items():
+            source_dir = os.path.join(tmp_dir, f"source={quote(source, safe='')}")
+            os.makedirs(source_dir, exist_ok=True)
+            table = pa.Table.from_pylist(rows, schema=self.schema)
+            pq.write_table(
+                table, os.path.join(source_dir, 'part-0.parquet'),
+                compression=Settings.PARQUET_COMPRESSION,
+                use_dictionary=dictionary_columns
+            )
+
+        shutil.rmtree(day_dir, ignore_errors=True)
+        if by_source:
+            os.replace(tmp_dir, day_dir)
+        else:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def export(self, full=False):
+        """Convert days whose JSON file changed since the last export; returns the dates written"""
+        os.makedirs(self.export_dir, exist_ok=True)
+        state = {} if full else self._load_state()
+        exported = []
+
+        for date, path in self.daily_files():
+            stat = os.stat(path)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            if state.get(date) == signature:
+                continue
+
+            try:
+                articles = read_daily_articles(path)
+            except (OSError, ValueError) as e:
+                # Likely mid-write; keep the previous export and retry on the next run
+                logger.warning(f"⚠️  Skipping {path}: {e}")
+                continue
+            body_store = BodyStore(path)
+            try:
+                self.export_day(date, articles, body_store)
+            finally:
+                body_store.close()
+            state[date] = signature
+            # Saved per day, so an interrupted export resumes where it stopped
+            self._save_state(state)
+            exported.append(date)
+            logger.info(f"📦 Exported {len(articles)} articles for {date}")
+
+        return exported
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from utils.metrics import Metrics
+
+class CachedResponse:
+    """Minimal response object served from the cache or a fresh fetch"""
+
+    def __init__(self, url, content, encoding, status_code, cache_status):
+        self.url = url
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.status_code = status_code
+        self.cache_status = cache_status  # 'hit', 'revalidated', 'miss' or 'bypass'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def html(self):
+        """Markup for newspaper3k; raw bytes when requests only guessed the charset"""
+        if self.encoding.upper() == 'ISO-8859-1':
+            return self.content
+        return self.text
+
+    @property
+    def from_cache(self):
+        """True when the body was served from disk (fresh hit or 304)"""
+        return self.cache_status in ('hit', 'revalidated')
+
+class ResponseCache:
+    """Persistent URL-keyed HTTP response cache with ETag/Last-Modified revalidation"""
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.stats = {'hit': 0, 'miss': 0, 'revalidated': 0}
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(
+            os.path.getsize(os.path.join(cache_dir, name))
+            for name in os.listdir(cache_dir)
+        )
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url):
+        key = self._key(url)
+        return (os.path.join(self.cache_dir, f"{key}.json"),
+                os.path.join(self.cache_dir, f"{key}.body"))
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _load_meta(self, url):
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _save_meta(self, url, meta):
+        """Write an entry's metadata, keeping the byte count in step with its size on disk"""
+        meta_path, _ = self._paths(url)
+        with self._lock:
+            old_size = self._size(meta_path)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+            self._total_bytes += self._size(meta_path) - old_size
+
+    def _read_body(self, url):
+        _, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _record(self, status):
+        with self._lock:
+            self.stats[status] += 1
+        Metrics.shared().increment(f"http_cache_{status}")
+
+    def fetch(self, http_client, url, ttl, headers=None):
+        """Serve a URL from the cache, revalidating with the origin once stale"""
+        meta = self._load_meta(url)
+        body = self._read_body(url) if meta else None
+
+        if meta and body is not None and time.time() - meta['stored_at'] < ttl:
+            self._touch(url)
+            self._record('hit')
+            return CachedResponse(meta['final_url'], body, meta.get('encoding'), 200, 'hit')
+
+        request_headers = dict(headers or {})
+        if meta and body is not None:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        response = http_client.get(url, headers=request_headers)
+
+        if response.status_code == 304 and meta and body is not None:
+            meta['stored_at'] = time.time()
+            meta['etag'] = response.headers.get('ETag', meta.get('etag'))
+            meta['last_modified'] = response.headers.get('Last-Modified', meta.get('last_modified'))
+            self._save_meta(url, meta)
+            self._evict()
+            self._record('revalidated')
+            return CachedResponse(meta['final_url'], body, meta.get('encoding'), 200, 'revalidated')
+
+        self._store(url, response)
+        self._record('miss')
+        return CachedResponse(response.url, response.content, response.encoding,
+                              response.status_code, 'miss')
+
+    def _store(self, url, response):
+        _, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'final_url': response.url,
+            'encoding': response.encoding,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': time.time(),
+            'derived': {},
+        }
+        with self._lock:
+            old_size = self._size(body_path)
+            self._write_atomic(body_path, response.content)
+            self._total_bytes += self._size(body_path) - old_size
+        self._save_meta(url, meta)
+        self._evict()
+
+    def _touch(self, url):
+        meta_path, _ = self._paths(url)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    path = os.path.join(self.cache_dir, name)
+                    try:
+                        entries.append((os.path.getmtime(path), name[:-len('.json')]))
+                    except OSError:
+                        continue
+            entries.sort()
+
+            for _, key in entries:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                for suffix in ('.json', '.body'):
+                    path = os.path.join(self.cache_dir, key + suffix)
+                    try:
+                        self._total_bytes -= os.path.getsize(path)
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def get_derived(self, url, name):
+        """Return data previously derived from the cached body, e.g. parsed content"""
+        meta = self._load_meta(url)
+        if not meta:
+            return None
+        return meta.get('derived', {}).get(name)
+
+    def set_derived(self, url, name, data):
+        """Attach derived data to the cached entry; it is dropped when the body changes"""
+        meta = self._load_meta(url)
+        if not meta:
+            return
+        meta.setdefault('derived', {})[name] = data
+        # Parsed article content can outweigh the body, so it counts towards max_bytes
+        self._save_meta(url, meta)
+        self._evict()
+
+    def summary(self):
+        with self._lock:
+            return dict(self.stats)
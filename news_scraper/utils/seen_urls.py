@@ -0,0 +1,166 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from config.settings import Settings
+
+TRACKING_PARAMS = re.compile(
+    r'^(utm_\w+|fbclid|gclid|dclid|mc_cid|mc_eid|ref|ref_src|referrer|source|from|frmapp|cmp|intcmp|ito|amp|outputType)$',
+    re.IGNORECASE
+)
+
+def canonicalize_url(url):
+    """Normalize a link so tracking, AMP and mobile variants map to one key"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in ('www.', 'm.', 'amp.', 'mobile.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    path = parts.path
+    path = path.replace('/amp_articleshow/', '/articleshow/')
+    path = re.sub(r'/amp(?=/|$)', '', path)
+    path = re.sub(r'\.amp(?=/|$)', '', path)
+    path = path.rstrip('/') or '/'
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    ))
+    return urlunsplit(('https', host, path, query, ''))
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit URL hashes"""
+
+    def __init__(self, bits, hashes):
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray(bits // 8 + 1)
+
+    def _positions(self, value):
+        low = value & 0xFFFFFFFF
+        high = (value >> 32) | 1
+        return [(low + i * high) % self.bits for i in range(self.hashes)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.array[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+class SeenUrlStore:
+    """Cross-day set of processed article URLs: Bloom filter in memory, exact set in SQLite"""
+
+    def __init__(self, db_path=None, retention_days=None):
+        self.db_path = db_path or Settings.get_seen_urls_path()
+        self.bloom_path = f"{self.db_path}.bloom"
+        self.retention_days = retention_days or Settings.SEEN_URL_RETENTION_DAYS
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_urls (url_hash INTEGER PRIMARY KEY, last_seen TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_urls_last_seen ON seen_urls (last_seen)")
+        self.conn.commit()
+
+        pruned = self._prune()
+        self.bloom = BloomFilter(Settings.SEEN_URL_BLOOM_BITS, Settings.SEEN_URL_BLOOM_HASHES)
+        if pruned or not self._load_bloom():
+            self._rebuild_bloom()
+
+    @staticmethod
+    def url_hash(url):
+        """Signed 64-bit hash of the canonical URL (fits an SQLite INTEGER)"""
+        digest = hashlib.sha1(canonicalize_url(url).encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big', signed=True)
+
+    def _prune(self):
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+        with self.conn:
+            return self.conn.execute("DELETE FROM seen_urls WHERE last_seen < ?", (cutoff,)).rowcount
+
+    def _load_bloom(self):
+        try:
+            with open(self.bloom_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return False
+        if len(data) != len(self.bloom.array):
+            return False
+        self.bloom.array = bytearray(data)
+        return True
+
+    def _rebuild_bloom(self):
+        for (url_hash,) in self.conn.execute("SELECT url_hash FROM seen_urls"):
+            self.bloom.add(url_hash & 0xFFFFFFFFFFFFFFFF)
+        self._save_bloom()
+
+    def _save_bloom(self):
+        tmp_path = f"{self.bloom_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.bloom.array)
+        os.replace(tmp_path, self.bloom_path)
+
+    def _is_seen(self, url_hash):
+        if url_hash & 0xFFFFFFFFFFFFFFFF not in self.bloom:
+            return False
+        row = self.conn.execute("SELECT 1 FROM seen_urls WHERE url_hash = ?", (url_hash,)).fetchone()
+        return row is not None
+
+    def filter_unseen(self, articles):
+        """Drop articles whose link was already processed within the retention window"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        unseen = []
+        seen_hashes = []
+        with self._lock:
+            for article in articles:
+                url_hash = self.url_hash(article['link'])
+                if self._is_seen(url_hash):
+                    seen_hashes.append(url_hash)
+                else:
+                    unseen.append(article)
+
+            # Refresh last_seen so stories still on the homepage stay in the window
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE seen_urls SET last_seen = ? WHERE url_hash = ?",
+                    [(today, url_hash) for url_hash in seen_hashes]
+                )
+            self.skipped += len(seen_hashes)
+        return unseen
+
+    def mark_seen(self, urls):
+        """Record processed URLs in one transaction"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        hashes = [self.url_hash(url) for url in urls if url]
+        if not hashes:
+            return
+        with self._lock:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO seen_urls (url_hash, last_seen) VALUES (?, ?) "
+                    "ON CONFLICT (url_hash) DO UPDATE SET last_seen = excluded.last_seen",
+                    [(url_hash, today) for url_hash in hashes]
+                )
+            for url_hash in hashes:
+                self.bloom.add(url_hash & 0xFFFFFFFFFFFFFFFF)
+            self._save_bloom()
+
+    def prune(self):
+        """Drop URLs last seen before the retention window, for long-running processes"""
+        with self._lock:
+            if self._prune():
+                self.bloom = BloomFilter(Settings.SEEN_URL_BLOOM_BITS, Settings.SEEN_URL_BLOOM_HASHES)
+                self._rebuild_bloom()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -1,12 +1,27 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+import queue
+import threading
 import time
 from config.settings import Settings
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+class DriverPool:
+    """Thread-safe pool of warm headless Chrome drivers"""
+
+    def __init__(self, size=None, max_pages=None):
+        self.size = size or Settings.SELENIUM_POOL_SIZE
+        self.max_pages = max_pages or Settings.SELENIUM_MAX_PAGES_PER_DRIVER
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._page_counts = {}
+        self._closed = False
 
-class SeleniumHelper:
     @staticmethod
-    def get_final_url_selenium(url):
-        """Get final URL after redirects using Selenium"""
+    def _create_driver():
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -15,28 +30,129 @@ class SeleniumHelper:
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--ignore-certificate-errors")
         chrome_options.add_argument("--ignore-ssl-errors")
-        
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(Settings.SELENIUM_TIMEOUT)
+        return driver
+
+    def acquire(self):
+        """Take an idle driver, starting a new one while under the pool size"""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._created < self.size:
+                    self._created += 1
+                    break
+
+            # Pool is full; wait for a driver to come back or a slot to free up
+            try:
+                return self._idle.get(timeout=Settings.SELENIUM_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+        with self._lock:
+            self._page_counts[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a driver to the pool, recycling it after a crash or N pages"""
+        with self._lock:
+            pages = self._page_counts.get(id(driver), 0) + 1
+            self._page_counts[id(driver)] = pages
+            recycle = broken or self._closed or pages >= self.max_pages
+
+        if recycle:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except:
+            pass
+
+    def close(self):
+        """Quit every idle driver; drivers still in use are quit on release"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+class SeleniumHelper:
+    def __init__(self, pool=None):
+        self.pool = pool or DriverPool()
+
+    @staticmethod
+    def _wait_for_final_url(driver):
+        """Wait until the page has loaded and the URL stops changing"""
+        last_url = driver.current_url
+        stable_since = time.monotonic()
+        deadline = stable_since + Settings.SELENIUM_REDIRECT_WAIT
+
+        while time.monotonic() < deadline:
+            time.sleep(Settings.SELENIUM_POLL_INTERVAL)
+            current_url = driver.current_url
+            now = time.monotonic()
+
+            if current_url != last_url:
+                last_url = current_url
+                stable_since = now
+                continue
+
+            if (now - stable_since >= Settings.SELENIUM_URL_STABLE_SECONDS and
+                driver.execute_script("return document.readyState") == "complete"):
+                break
+
+        return last_url
+
+    def get_final_url_selenium(self, url):
+        """Get final URL after redirects using a pooled Selenium driver"""
+        final_url, _ = self.get_final_page_selenium(url)
+        return final_url
+
+    def get_final_page_selenium(self, url):
+        """Get final URL and rendered HTML after redirects"""
         driver = None
+        broken = False
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(Settings.SELENIUM_TIMEOUT)
-            
-            print(f"   Opening with Selenium: {url[:80]}...")
+            driver = self.pool.acquire()
+
+            logger.info(f"   Opening with Selenium: {url[:80]}...")
             driver.get(url)
-            
-            # Wait for potential redirects
-            time.sleep(3)
-            
-            final_url = driver.current_url
-            print(f"   ✅ Final URL obtained: {final_url[:80]}...")
-            return final_url
-            
+
+            final_url = self._wait_for_final_url(driver)
+            logger.info(f"   ✅ Final URL obtained: {final_url[:80]}...")
+            return final_url, driver.page_source
+
         except Exception as e:
-            print(f"   ❌ Selenium error: {str(e)[:100]}...")
-            return url
+            broken = True
+            logger.error(f"   ❌ Selenium error: {str(e)[:100]}...")
+            return url, None
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
\ No newline at end of file
+                self.pool.release(driver, broken=broken)
+
+    def close(self):
+        """Shut down the pooled drivers"""
+        self.pool.close()
@@ -0,0 +1,192 @@
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+from config.settings import Settings
+from utils.article_journal import ArticleJournal
+from utils.log import get_logger
+from utils.metrics import Metrics
+
+logger = get_logger(__name__)
+
+class StorageBackend:
+    """Interface for where a run's articles are loaded from and saved to"""
+
+    name = None
+
+    def load_existing(self, date):
+        """Articles already stored for a date, used for duplicate checks"""
+        raise NotImplementedError
+
+    def record(self, article):
+        """Called as each article finishes processing; may be called from worker threads"""
+
+    def save(self, all_articles, new_articles, date):
+        """Persist the run and return a human readable location"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class JsonStorage(StorageBackend):
+    """One whole-file JSON document per day (the original layout)"""
+
+    name = 'json'
+
+    def __init__(self, file_handler):
+        self.file_handler = file_handler
+
+    def load_existing(self, date):
+        return self.file_handler.load_existing_articles(Settings.get_full_json_path(date))
+
+    def save(self, all_articles, new_articles, date):
+        return self.file_handler.save_to_json(all_articles, Settings.get_full_json_path(date))
+
+class JournalStorage(StorageBackend):
+    """Append-only journal per day, compacted into the daily JSON file at day rollover or on request"""
+
+    name = 'journal'
+
+    def __init__(self):
+        self.journal = None
+
+    def load_existing(self, date):
+        filename = Settings.get_full_json_path(date)
+        if self.journal and self.journal.json_filename != filename and Settings.JOURNAL_COMPACT_ON_ROLLOVER:
+            # The previous day is complete, so its JSON file is rebuilt once
+            self.journal.compact()
+        self.journal = ArticleJournal(filename, date)
+        return self.journal.load_index()
+
+    def record(self, article):
+        self.journal.append(article)
+
+    def save(self, all_articles, new_articles, date):
+        # Articles were appended as they finished, so saving costs nothing per run;
+        # compacting rewrites the whole day and is opt-in (see --compact-journal)
+        if Settings.JOURNAL_COMPACT_ON_SAVE:
+            return self.journal.compact({'metrics': Metrics.shared().summary()})
+        return self.journal.journal_path
+
+    @staticmethod
+    def compact(date=None):
+        """Rebuild a day's JSON file from its journal for JSON consumers"""
+        date = date or Settings.get_current_date()
+        return ArticleJournal(Settings.get_full_json_path(date), date).compact()
+
+class SQLiteStorage(StorageBackend):
+    """SQLite database holding every day's articles with indexed lookups"""
+
+    name = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            source TEXT,
+            link TEXT,
+            final_url TEXT,
+            date TEXT,
+            published_date TEXT,
+            processed_at TEXT,
+            success INTEGER,
+            used_selenium INTEGER,
+            data TEXT NOT NULL,
+            UNIQUE (date, link)
+        );
+        CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source);
+        CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date);
+        CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link);
+        CREATE INDEX IF NOT EXISTS idx_articles_processed_at ON articles (processed_at);
+    """
+
+    COLUMNS = ('title', 'source', 'link', 'final_url', 'date', 'published_date', 'processed_at')
+
+    def __init__(self, db_path=None, file_handler=None):
+        self.db_path = db_path or Settings.get_sqlite_path()
+        self.file_handler = file_handler
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def _row(self, article):
+        return (
+            *(article.get(column) for column in self.COLUMNS),
+            1 if article.get('success') else 0,
+            1 if article.get('used_selenium') else 0,
+            json.dumps(article, ensure_ascii=False),
+        )
+
+    def insert_articles(self, articles):
+        """Insert articles in a single transaction, ignoring (date, link) repeats"""
+        with self._lock, self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO articles "
+                "(title, source, link, final_url, date, published_date, processed_at, "
+                "success, used_selenium, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(article) for article in articles]
+            )
+            return cursor.rowcount
+
+    def query_articles(self, start_date=None, end_date=None, sources=None, limit=None):
+        """Articles between two YYYY-MM-DD dates (inclusive) from the given sources"""
+        clauses = []
+        params = []
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        if sources:
+            clauses.append(f"source IN ({', '.join('?' for _ in sources)})")
+            params.extend(sources)
+
+        sql = "SELECT data FROM articles"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date, id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def load_existing(self, date):
+        return self.query_articles(start_date=date, end_date=date)
+
+    def save(self, all_articles, new_articles, date):
+        inserted = self.insert_articles(new_articles)
+        logger.info(f"💾 Inserted {inserted} articles into {self.db_path}")
+
+        if Settings.SQLITE_EXPORT_JSON and self.file_handler:
+            return self.export_json(date)
+        return self.db_path
+
+    def export_json(self, date, filename=None):
+        """Write one day's articles in the daily JSON layout for JSON consumers"""
+        filename = filename or Settings.get_full_json_path(date)
+        return self.file_handler.save_to_json(self.load_existing(date), filename)
+
+    def import_json_files(self, directory=None):
+        """One-shot import of existing news_articles_YYYY-MM-DD.json files"""
+        directory = directory or Settings.JSON_OUTPUT_DIR or '.'
+        total = 0
+        for path in sorted(glob.glob(os.path.join(directory, 'news_articles_*.json'))):
+            if not re.fullmatch(r'news_articles_\d{4}-\d{2}-\d{2}\.json', os.path.basename(path)):
+                continue
+            articles = self.file_handler.load_existing_articles(path)
+            inserted = self.insert_articles(articles)
+            logger.info(f"📥 Imported {inserted}/{len(articles)} articles from {path}")
+            total += inserted
+        return total
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
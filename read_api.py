@@ -0,0 +1,312 @@
+"""Local read API over the scraper's daily JSON output
+
+One process holds one in-memory index (feed records, BM25 search index and
+keyword facets) and serves it to every UI session:
+
+    python read_api.py --port 8502
+    NEWS_READ_API_URL=http://127.0.0.1:8502 streamlit run Ui.py
+
+Endpoints (JSON, GET only):
+    /articles?page=1&page_size=20         paginated feed
+    /articles/<id>                        one article with its full text
+    /search?q=...&top_k=15                BM25 hits, best first
+    /favorites?subject=a&subject=b&page=1 feed pages matching any favorite subject
+    /keywords?limit=10&min_count=2        most frequent keywords
+
+Every response carries an ETag derived from the data file version, so clients
+revalidate with If-None-Match and get a body-less 304 until the scraper writes
+new articles.
+"""
+import argparse
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import requests
+from search_index import BM25Index
+from feed_data import file_signature, load_articles, project_articles, load_article_bodies, FeedFacets, FeedView
+
+DEFAULT_OUTPUT_DIR = "news_scraper/output"
+MAX_PAGE_SIZE = 100
+MAX_TOP_K = 50
+# Encoded responses kept per dataset version, so popular pages are served without re-encoding
+RESPONSE_CACHE_ENTRIES = 512
+
+def daily_json_path(output_dir, date=None):
+    current_date = date or datetime.now().strftime('%Y-%m-%d')
+    return f"{output_dir}/news_articles_{current_date}.json"
+
+class Dataset:
+    """One version of the data file: a FeedView, its ETag and encoded responses"""
+
+    def __init__(self, json_file_path, signature, include_body=False):
+        self.json_file_path = json_file_path
+        self.signature = signature
+        self.etag = f'"{signature[0]:x}-{signature[1]:x}"' if signature else '"empty"'
+        self._bodies = None
+        self._bodies_lock = threading.Lock()
+        self._responses = OrderedDict()
+        self._responses_lock = threading.Lock()
+
+        if signature is None:
+            articles = []
+        else:
+            articles = project_articles(load_articles(json_file_path))
+
+        index_articles = articles
+        if include_body:
+            bodies = self.load_bodies()
+            index_articles = [{**article, 'text': bodies.get(article['id'], '')} for article in articles]
+        self.view = FeedView(articles, BM25Index(index_articles, include_body=include_body),
+                             FeedFacets(articles), self.load_bodies)
+
+    def load_bodies(self):
+        """Full texts, read once per dataset version the first time an article is opened"""
+        with self._bodies_lock:
+            if self._bodies is None:
+                self._bodies = load_article_bodies(self.json_file_path) if self.signature else {}
+            return self._bodies
+
+    def cached_response(self, key, build):
+        """Encoded JSON for a request key, built once per dataset version"""
+        with self._responses_lock:
+            body = self._responses.get(key)
+            if body is not None:
+                self._responses.move_to_end(key)
+                return body
+
+        body = build()
+        if body is not None:
+            with self._responses_lock:
+                self._responses[key] = body
+                if len(self._responses) > RESPONSE_CACHE_ENTRIES:
+                    self._responses.popitem(last=False)
+        return body
+
+class DatasetCache:
+    """Holds the current Dataset, reloading only when the day's file path or signature changes"""
+
+    def __init__(self, json_file_path=None, output_dir=DEFAULT_OUTPUT_DIR, include_body=False):
+        self.json_file_path = json_file_path
+        self.output_dir = output_dir
+        self.include_body = include_body
+        self._dataset = None
+        self._lock = threading.Lock()
+
+    def current(self):
+        path = self.json_file_path or daily_json_path(self.output_dir)
+        signature = file_signature(path)
+        dataset = self._dataset
+        if dataset is not None and (dataset.json_file_path, dataset.signature) == (path, signature):
+            return dataset
+
+        with self._lock:
+            # Another request may have finished the reload while this one waited
+            dataset = self._dataset
+            if dataset is None or (dataset.json_file_path, dataset.signature) != (path, signature):
+                try:
+                    dataset = Dataset(path, signature, self.include_body)
+                except (OSError, ValueError):
+                    # Mid-write or unreadable: keep serving the previous version
+                    if self._dataset is None:
+                        raise
+                    return self._dataset
+                self._dataset = dataset
+            return dataset
+
+def _int_param(params, name, default, minimum=1, maximum=None):
+    try:
+        value = int(params.get(name, [default])[0])
+    except ValueError:
+        value = default
+    value = max(value, minimum)
+    return min(value, maximum) if maximum else value
+
+def _page_payload(page_articles, start, page_count, total, page_size):
+    return {
+        'articles': page_articles,
+        'page': start // page_size + 1,
+        'page_count': page_count,
+        'start': start,
+        'total': total,
+    }
+
+class ReadApiHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the shared dataset's FeedView"""
+
+    server_version = "NewsReadAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def route(self, view, path, params):
+        """JSON-serializable payload for a request, or None for an unknown resource"""
+        if path == '/articles':
+            page_size = _int_param(params, 'page_size', 20, maximum=MAX_PAGE_SIZE)
+            page_articles, start, page_count, total = view.feed_page(_int_param(params, 'page', 1), page_size)
+            return _page_payload(page_articles, start, page_count, total, page_size)
+
+        if path.startswith('/articles/'):
+            article_id = path[len('/articles/'):]
+            return view.article(int(article_id)) if article_id.isdigit() else None
+
+        if path == '/search':
+            query = params.get('q', [''])[0]
+            return {'articles': view.search(query, _int_param(params, 'top_k', 15, maximum=MAX_TOP_K))}
+
+        if path == '/favorites':
+            page_size = _int_param(params, 'page_size', 20, maximum=MAX_PAGE_SIZE)
+            page_articles, start, page_count, total = view.favorites_page(
+                params.get('subject', []), _int_param(params, 'page', 1), page_size
+            )
+            return _page_payload(page_articles, start, page_count, total, page_size)
+
+        if path == '/keywords':
+            keywords = view.popular_keywords(_int_param(params, 'limit', 10, maximum=MAX_PAGE_SIZE),
+                                             _int_param(params, 'min_count', 2))
+            return {'keywords': [{'keyword': keyword, 'count': view.facets.keyword_counts[keyword]}
+                                 for keyword in keywords]}
+
+        return None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            dataset = self.server.datasets.current()
+        except (OSError, ValueError) as e:
+            self._send(503, json.dumps({'error': f"Data file unavailable: {e}"}).encode('utf-8'))
+            return
+
+        if dataset.etag in (tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')):
+            self._send(304, None, dataset.etag)
+            return
+
+        params = parse_qs(url.query)
+
+        def build():
+            payload = self.route(dataset.view, url.path.rstrip('/') or '/', params)
+            return None if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+        # Search queries are open-ended, so only bounded resources go in the response cache
+        if url.path == '/search':
+            body = build()
+        else:
+            body = dataset.cached_response(self.path, build)
+
+        if body is None:
+            self._send(404, json.dumps({'error': f"Not found: {url.path}"}).encode('utf-8'))
+        else:
+            self._send(200, body, dataset.etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+        else:
+            self.send_header('Content-Length', '0')
+        self.end_headers()
+        if body is not None:
+            self.wfile.write(body)
+
+class ReadApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, datasets, verbose=False):
+        super().__init__(address, ReadApiHandler)
+        self.datasets = datasets
+        self.verbose = verbose
+
+class ReadApiClient:
+    """Thin client with the FeedView interface, revalidating cached responses by ETag"""
+
+    def __init__(self, base_url, timeout=5, max_entries=256):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.session = requests.Session()
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, path, **params):
+        request = requests.Request('GET', self.base_url + path, params=params).prepare()
+        with self._lock:
+            cached = self._responses.get(request.url)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+
+        response = self.session.get(request.url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+
+        payload = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._lock:
+                self._responses[request.url] = (etag, payload)
+                self._responses.move_to_end(request.url)
+                if len(self._responses) > self.max_entries:
+                    self._responses.popitem(last=False)
+        return payload
+
+    @staticmethod
+    def _page(payload):
+        return payload['articles'], payload['start'], payload['page_count'], payload['total']
+
+    def count(self):
+        return self._get('/articles', page=1, page_size=1)['total']
+
+    def feed_page(self, page, page_size):
+        return self._page(self._get('/articles', page=page, page_size=page_size))
+
+    def search(self, query, top_k=20):
+        return self._get('/search', q=query, top_k=top_k)['articles']
+
+    def favorites_page(self, favorite_subjects, page, page_size):
+        return self._page(self._get('/favorites', subject=list(favorite_subjects), page=page, page_size=page_size))
+
+    def popular_keywords(self, limit=10, min_count=2):
+        return [item['keyword'] for item in self._get('/keywords', limit=limit, min_count=min_count)['keywords']]
+
+    def article(self, article_id):
+        return self._get(f'/articles/{article_id}')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve the scraper's output to UI sessions from one in-memory index")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument(
+        '--data-file', metavar='PATH',
+        help="Serve this JSON file instead of the current day's file in --output-dir"
+    )
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        '--search-body', action='store_true',
+        help="Also index full article bodies (larger index, better recall)"
+    )
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    datasets = DatasetCache(args.data_file, args.output_dir, args.search_body)
+    server = ReadApiServer((args.host, args.port), datasets, args.verbose)
+    print(f"📡 Serving news read API on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import heapq
+import math
+import re
+from collections import Counter
+
+STOPWORDS = set("""
+    a an and are as at be been but by for from has have in is it its of on or that
+    the their this to was were will with what who how about news
+""".split())
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords"""
+    return [token for token in re.findall(r"[a-z0-9]+", str(text).lower()) if token not in STOPWORDS]
+
+class BM25Index:
+    """Inverted BM25 index over article title, summary, keywords and optionally body"""
+
+    FIELD_WEIGHTS = {'title': 2, 'keywords': 2, 'ai_summary': 1, 'text': 1}
+
+    def __init__(self, articles, include_body=False, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.include_body = include_body
+        self.postings = {}
+        self.doc_lengths = []
+
+        for doc_id, article in enumerate(articles):
+            term_counts = self._article_terms(article)
+            self.doc_lengths.append(sum(term_counts.values()))
+            for term, count in term_counts.items():
+                self.postings.setdefault(term, []).append((doc_id, count))
+
+        self.doc_count = len(self.doc_lengths)
+        self.avg_doc_length = (sum(self.doc_lengths) / self.doc_count) if self.doc_count else 0
+        self.idf = {
+            term: math.log(1 + (self.doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def _article_terms(self, article):
+        # Field weights are applied by counting a term once per unit of weight
+        term_counts = Counter()
+        fields = {
+            'title': article.get('title', ''),
+            'ai_summary': article.get('ai_summary', ''),
+            'keywords': ' '.join(str(keyword) for keyword in article.get('keywords', [])),
+        }
+        if self.include_body:
+            fields['text'] = article.get('text', '')
+
+        for field, value in fields.items():
+            for token in tokenize(value):
+                term_counts[token] += self.FIELD_WEIGHTS[field]
+        return term_counts
+
+    def search(self, query, top_k=20):
+        """Return up to top_k (doc_id, score) pairs, best first"""
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+def parse_indices(response, limit):
+    """Safely read a list of 0-based indices from an LLM response (no eval)"""
+    start = response.find('[')
+    end = response.find(']', start)
+    if start == -1 or end == -1:
+        return None
+
+    indices = []
+    for value in re.findall(r'\d+', response[start:end]):
+        index = int(value)
+        if index < limit and index not in indices:
+            indices.append(index)
+    return indices